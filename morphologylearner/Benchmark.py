@@ -0,0 +1,326 @@
+import json
+import math
+import multiprocessing
+import os
+import platform
+import subprocess
+import sys
+import time
+from . import CorpusLoader
+from . import Reporting
+
+try:
+    import resource
+except ImportError:
+    resource = None
+    # Peak memory use is only recorded where the resource module is available (it isn't on Windows)
+
+ladders = {"EnglishCorpus": (100, 500, 1000, 5000, 54626), "CornishCorpus": (100, 500, 1000, 5000, 9645)}
+# The sizes of the bundled corpora, which are found at "[directory]/[language]/[language][size].txt"
+
+algorithms = ("harris", "neuvelfulop", "mdl")
+
+directory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# The bundled corpora are kept alongside the package
+
+def peakrss():
+    if resource is None:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    if sys.platform == "darwin":
+        return peak
+
+    return peak * 1024
+    # Returns the peak resident set size of the process so far in bytes (or None if it can't be measured)
+    # macOS reports it in bytes, while Linux reports it in kilobytes
+
+def measure(phases, name, function, *arguments):
+    rss = peakrss()
+
+    wall = time.perf_counter()
+    cpu = time.process_time()
+
+    result = function(*arguments)
+
+    cpu = time.process_time() - cpu
+    wall = time.perf_counter() - wall
+
+    peak = peakrss()
+
+    if peak is None:
+        phases.append({"phase": name, "wall": wall, "cpu": cpu, "peakrss": None, "rssgrowth": None})
+    else:
+        phases.append({"phase": name, "wall": wall, "cpu": cpu, "peakrss": peak, "rssgrowth": peak - rss})
+
+    return result
+    # Calls a function as a named phase, recording its measurements in [phases] before returning its result
+    # Wall and CPU times are in seconds, while the process' peak resident set size at the end of the phase (and how much the phase raised it by) are in bytes
+
+# ---------------------------------------------------------------------------------------------------- #
+
+def benchharris(corpus, phases, settings):
+    from . import Indexing
+    from .HarrisImplementation import eagersuffixes, harrissplits
+    # Indexing (and NumPy with it) is loaded before anything is measured, so that the index build isn't charged for the import
+
+    root = measure(phases, "index", Indexing.index, corpus)
+
+    measure(phases, "varieties", root.varieties)
+
+    indexes = {}
+
+    if settings["esm"] > 0:
+        indexes = measure(phases, "esm", eagersuffixes, corpus, settings["esm"], True, root, Reporting.silent)
+
+    measure(phases, "splits", harrissplits, corpus, settings["esm"], indexes, root, Reporting.silent)
+    # Harris' method is made up of an index build (and the successor varieties it's queried for), eager suffix matching and split discovery
+
+def benchneuvelfulop(corpus, phases, settings):
+    from .Indexing import CorpusIndex
+    from .NeuvelFulopImplementation import components, stemrelationships, endingrelationships, consensus, applyrules
+
+    corpus = [word.lower() for word in corpus]
+
+    corpusindex = measure(phases, "index", CorpusIndex, corpus)
+
+    stems, endings = measure(phases, "components", components, corpus, settings["minmatch"], settings["cachereq"], Reporting.silent, None, corpusindex)
+
+    relset = measure(phases, "stem pairs", stemrelationships, corpus, stems, endings, settings["relreq"], Reporting.silent, None, corpusindex)
+    relset += measure(phases, "ending pairs", endingrelationships, corpus, stems, endings, settings["relreq"], Reporting.silent, None, corpusindex)
+
+    def generate():
+        return set(out for found in applyrules(corpus, consensus(relset)) for index, out in found)
+
+    measure(phases, "rules", generate)
+    # Neuvel and Fulop's method is made up of indexing the corpus, stem and ending discovery, the mining of stem pairs and ending pairs and the application of the resulting rules to every word
+
+def benchmdl(corpus, phases, settings):
+    from .MDLImplementation import Population, entropytable, genetic
+
+    population = measure(phases, "population", Population, corpus, settings["popcount"], None, 0)
+
+    measure(phases, "entropy table", entropytable, population.words, None, population.table)
+
+    measure(phases, "generations", lambda: genetic(corpus, settings["popcount"], settings["gencount"], 0.01, 8, 0, 0, True, rng=0, reporter=Reporting.silent))
+    # The genetic process is made up of building its population, building its entropy table and evolving the population
+    # The final phase builds its own population (but no entropy table, as entropic locking is left disabled)
+
+benchmarks = {"harris": benchharris, "neuvelfulop": benchneuvelfulop, "mdl": benchmdl}
+
+def worker(connection, algorithm, path, settings):
+    phases = []
+
+    corpus = measure(phases, "load", CorpusLoader.load, path).words
+
+    benchmarks[algorithm](corpus, phases, settings)
+
+    connection.send((len(corpus), phases))
+    connection.close()
+    # Runs a single benchmark in its own process, so that the peak memory use of each run is measured independently
+
+# ---------------------------------------------------------------------------------------------------- #
+
+# Runs every algorithm over every size of every bundled corpus, measuring the wall time, CPU time and peak memory use of each phase
+# Each run is made in a fresh process
+# Once a run exceeds the timeout, larger corpora aren't attempted with the same algorithm and language
+# LANGUAGES: The corpus ladders to run over (see "ladders" above)
+# SIZES: The sizes of corpus to run over
+    # Every size in each ladder is used when set to None
+# ALGORITHMS: The algorithms to run (see "algorithms" above)
+# TIMEOUT: The number of seconds each run is allowed to take
+    # Feature disabled when set to 0
+# SETTINGS: A dictionary of parameters to override the defaults given to the algorithms with
+# LABEL: A name for the version being measured (such as a commit hash)
+    # The current commit's hash is used when set to None (if it can be found)
+# PATH: The directory the corpora are kept in
+# REPORTER: The Reporting.Reporter to write progress and results to
+    # Reporting.default is used when set to None
+def benchmark(languages=None, sizes=None, algorithms=algorithms, timeout=300, settings=None, label=None, path=directory, reporter=None):
+    if reporter is None:
+        reporter = Reporting.default
+
+    if languages is None:
+        languages = list(ladders)
+
+    defaults = {"esm": 1, "minmatch": 1, "cachereq": 2, "relreq": 3, "popcount": 32, "gencount": 10}
+
+    if settings is not None:
+        defaults.update(settings)
+
+    settings = defaults
+
+    if label is None:
+        label = revision(path)
+
+    context = multiprocessing.get_context("spawn")
+    # Spawned processes don't inherit the memory of this one, so their peak memory use only reflects the run itself
+
+    runs = []
+
+    for algorithm in algorithms:
+        for language in languages:
+            for size in ladders[language]:
+                if sizes is not None and size not in sizes:
+                    continue
+
+                file = os.path.join(path, language, language + str(size) + ".txt")
+
+                if not os.path.exists(file):
+                    reporter.log("Skipped " + algorithm + " on " + language + str(size) + " | The corpus file could not be found")
+                    continue
+
+                connection, remote = context.Pipe()
+
+                process = context.Process(target=worker, args=(remote, algorithm, file, settings))
+                process.start()
+
+                remote.close()
+
+                if connection.poll(timeout if timeout > 0 else None):
+                    try:
+                        words, phases = connection.recv()
+                        status = "complete"
+                    except EOFError:
+                        words, phases = None, []
+                        status = "failed"
+                else:
+                    process.terminate()
+
+                    words, phases = None, []
+                    status = "timeout"
+
+                process.join()
+
+                runs.append({"language": language, "size": size, "words": words, "algorithm": algorithm, "status": status, "phases": phases})
+
+                if status == "complete":
+                    reporter.log(algorithm + " on " + language + str(size) + " | " + " | ".join(phase["phase"] + " " + str(round(phase["wall"], 3)) + "s" for phase in phases))
+                else:
+                    reporter.log(algorithm + " on " + language + str(size) + " | " + status.upper())
+                    break
+
+    results = {"label": label, "time": time.strftime("%Y-%m-%dT%H:%M:%S"), "python": platform.python_version(), "platform": platform.platform(), "processor": platform.processor(), "cpus": os.cpu_count(), "settings": settings, "runs": runs}
+
+    results["fits"] = fits(runs)
+
+    for fit in results["fits"]:
+        reporter.log("Scaling | " + fit["algorithm"] + " on " + fit["language"] + " | " + fit["phase"] + " ~ n^" + str(round(fit["exponent"], 2)))
+
+    return results
+    # Returns the measurements of every run (alongside details of the machine and the fitted scaling curves) in a form that can be saved as JSON
+
+def revision(path):
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=path, capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    # Returns the hash of the commit checked out in the repository at [path] (or None if there isn't one)
+
+def fits(runs):
+    groups = {}
+
+    for run in runs:
+        if run["status"] != "complete":
+            continue
+
+        for phase in run["phases"]:
+            if phase["wall"] > 0.001:
+                groups.setdefault((run["language"], run["algorithm"], phase["phase"]), []).append((run["words"], phase["wall"]))
+            # Phases that take less than a millisecond are left out, as their timings are mostly noise
+
+    results = []
+
+    for (language, algorithm, phase), points in groups.items():
+        if len(points) < 2:
+            continue
+
+        x = [log(words) for words, wall in points]
+        y = [log(wall) for words, wall in points]
+
+        mx = sum(x) / len(x)
+        my = sum(y) / len(y)
+
+        variance = sum((value - mx) ** 2 for value in x)
+
+        if variance == 0:
+            continue
+
+        exponent = sum((x[i] - mx) * (y[i] - my) for i in range(len(x))) / variance
+
+        results.append({"language": language, "algorithm": algorithm, "phase": phase, "exponent": exponent, "coefficient": math.exp(my - exponent * mx), "points": len(points)})
+
+    return results
+    # Fits a power law (wall = coefficient × words ^ exponent) to the timings of each phase across corpus sizes by least squares in log-log space
+    # An exponent near 1 means the phase scales linearly, while one near 2 (or above) exposes a quadratic blowup
+
+def log(value):
+    return math.log(max(value, 1e-9))
+
+def save(results, path):
+    with open(path, "w", encoding="utf8") as file:
+        json.dump(results, file, indent=1)
+
+def load(path):
+    with open(path, encoding="utf8") as file:
+        return json.load(file)
+
+# Compares two sets of benchmark results (such as those saved from two versions of the package)
+# OLD, NEW: The results to compare (or the paths of the files they were saved to)
+# THRESHOLD: A phase is reported as a regression once its wall time in [NEW] exceeds [THRESHOLD] times its wall time in [OLD]
+# EXPONENTTHRESHOLD: A phase is also reported as a regression once its fitted scaling exponent rises by more than this
+# Returns a list of the regressions found
+def compare(old, new, threshold=1.25, exponentthreshold=0.3, reporter=None):
+    if reporter is None:
+        reporter = Reporting.default
+
+    if type(old) is str:
+        old = load(old)
+
+    if type(new) is str:
+        new = load(new)
+
+    timings = {}
+
+    for run in old["runs"]:
+        for phase in run["phases"]:
+            timings[(run["language"], run["size"], run["algorithm"], phase["phase"])] = phase["wall"]
+
+    regressions = []
+
+    reporter.log("Comparing " + str(old["label"]) + " → " + str(new["label"]))
+
+    for run in new["runs"]:
+        for phase in run["phases"]:
+            key = (run["language"], run["size"], run["algorithm"], phase["phase"])
+
+            if key not in timings or timings[key] < 0.001:
+                continue
+
+            ratio = phase["wall"] / timings[key]
+
+            line = run["algorithm"] + " on " + run["language"] + str(run["size"]) + " | " + phase["phase"] + " | " + str(round(timings[key], 3)) + "s → " + str(round(phase["wall"], 3)) + "s (×" + str(round(ratio, 2)) + ")"
+
+            if ratio > threshold:
+                regressions.append(line)
+
+                reporter.log("REGRESSION | " + line)
+            else:
+                reporter.log(line, Reporting.PROGRESS)
+
+    exponents = {(fit["language"], fit["algorithm"], fit["phase"]): fit["exponent"] for fit in old["fits"]}
+
+    for fit in new["fits"]:
+        key = (fit["language"], fit["algorithm"], fit["phase"])
+
+        if key in exponents and fit["exponent"] - exponents[key] > exponentthreshold:
+            line = fit["algorithm"] + " on " + fit["language"] + " | " + fit["phase"] + " scaling ~ n^" + str(round(exponents[key], 2)) + " → n^" + str(round(fit["exponent"], 2))
+
+            regressions.append(line)
+
+            reporter.log("REGRESSION | " + line)
+
+    reporter.log(str(len(regressions)) + " regression(s) found")
+
+    return regressions
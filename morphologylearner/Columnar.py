@@ -0,0 +1,205 @@
+import json
+import mmap
+import os
+import struct
+import numpy as np
+from itertools import chain
+
+magic = b"MLCOLS01"
+# Identifies the binary format (and its version)
+
+alignment = 8
+# Every array in the binary format starts at a multiple of this many bytes, so that it can be viewed in place
+
+# Holds a list of words (and optionally the boundaries of each word) as contiguous arrays
+# CHARACTERS: The UTF-8 bytes of every word, one after another
+# WORDOFFSETS: Where each word starts in [CHARACTERS] (with one more entry marking the end of the last word)
+# SPLITS: The boundaries of every word, one word after another
+# SPLITOFFSETS: Where each word's boundaries start in [SPLITS] (with one more entry marking the end of the last word's)
+    # Both are set to None for plain word lists (such as the words generated by Neuvel and Fulop's rules)
+# METADATA: A dictionary describing the run the results came from (such as its algorithm, parameters, time and fitness)
+class Columns:
+    def __init__(self, characters, wordoffsets, splits=None, splitoffsets=None, metadata=None, buffer=None):
+        self.characters = characters
+        self.wordoffsets = wordoffsets
+        self.splits = splits
+        self.splitoffsets = splitoffsets
+        self.metadata = metadata if metadata is not None else {}
+        self.buffer = buffer
+        # The memory map that the arrays are viewing (if they were loaded from the binary format) is kept open for as long as they are
+
+    def word(self, i):
+        return bytes(self.characters[self.wordoffsets[i]:self.wordoffsets[i + 1]]).decode("utf8")
+
+    def words(self):
+        text = bytes(self.characters).decode("utf8")
+
+        if len(text) == len(self.characters):
+            offsets = self.wordoffsets.tolist()
+        else:
+            starts = np.zeros(len(self.characters) + 1, dtype=np.int64)
+            starts[1:] = np.cumsum((self.characters & 0xC0) != 0x80)
+
+            offsets = starts[self.wordoffsets].tolist()
+        # Byte offsets are only character offsets when every character is a single byte
+        # Otherwise, each byte offset is converted by counting the bytes before it that start a character (as continuation bytes always begin with the bits 10)
+
+        return [text[offsets[i]:offsets[i + 1]] for i in range(len(offsets) - 1)]
+        # Decodes and returns every word
+
+    def boundary(self, i):
+        return self.splits[self.splitoffsets[i]:self.splitoffsets[i + 1]]
+
+    def boundaries(self):
+        splits = self.splits.tolist()
+        offsets = self.splitoffsets.tolist()
+
+        return {word: splits[offsets[i]:offsets[i + 1]] for i, word in enumerate(self.words())}
+        # Returns a dictionary of the boundaries of each word (in the same format as the output of Harris(), so it can be passed to Evaluation.evaluate())
+
+    def arrays(self):
+        arrays = {"characters": self.characters, "wordoffsets": self.wordoffsets}
+
+        if self.splits is not None:
+            arrays["splits"] = self.splits
+            arrays["splitoffsets"] = self.splitoffsets
+
+        return arrays
+
+    def __len__(self):
+        return len(self.wordoffsets) - 1
+
+def columns(words, boundaries=None, metadata=None):
+    if hasattr(words, "splits") and hasattr(words, "index"):
+        boundaries = words
+        words = words.index.words
+    # An individual returned by genetic() carries its own words
+
+    encoded = [word.encode("utf8") for word in words]
+
+    characters = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+
+    wordoffsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    wordoffsets[1:] = np.cumsum([len(word) for word in encoded])
+
+    if boundaries is None:
+        return Columns(characters, wordoffsets, metadata=metadata)
+
+    if hasattr(boundaries, "splits") and hasattr(boundaries, "index"):
+        if boundaries.index.words != tuple(words):
+            boundaries = [[boundaries.boundaryabsolute(word)] for word in words]
+        else:
+            splits = np.abs(np.asarray(boundaries.splits, dtype=np.int32))
+
+            return Columns(characters, wordoffsets, splits, np.arange(len(splits) + 1, dtype=np.int64), metadata)
+        # The genetic process gives each word a single boundary (with locked boundaries marked by negation, which is dropped here)
+    elif type(boundaries) is dict:
+        boundaries = [boundaries[word] for word in words]
+        # Output from Harris(), mapping each word to a list of its boundaries
+
+    counts = np.fromiter(map(len, boundaries), dtype=np.int64, count=len(boundaries))
+
+    splitoffsets = np.zeros(len(boundaries) + 1, dtype=np.int64)
+    splitoffsets[1:] = np.cumsum(counts)
+
+    splits = np.fromiter(chain.from_iterable(boundaries), dtype=np.int32, count=int(splitoffsets[-1]))
+
+    return Columns(characters, wordoffsets, splits, splitoffsets, metadata)
+    # Converts a list of words (and optionally the boundaries of each word) into columns
+    # BOUNDARIES: The dictionary returned by Harris(), the individual returned by genetic() or a list of boundary lists in the same order as [WORDS]
+        # Feature disabled when set to None (such as for the words generated by Neuvel and Fulop's rules)
+
+# ---------------------------------------------------------------------------------------------------- #
+
+# Saves results as columns, with the run's metadata in a JSON file alongside them (at "[PATH].json")
+# Files ending in ".npz" are saved as an uncompressed NumPy archive, while any others are saved in the package's own binary format (which can be memory-mapped)
+# The binary format is the magic bytes "MLCOLS01", the number of arrays and then each array in turn, as the lengths of its name and dtype, its name, its dtype, its element count and (from the next multiple of 8 bytes) its data
+# All of the lengths and counts are little-endian, and each array is padded to a multiple of 8 bytes
+# PATH: The location to save the results to
+# WORDS, BOUNDARIES, METADATA: As for columns() (or a Columns object in place of [WORDS])
+def save(path, words, boundaries=None, metadata=None):
+    if type(words) is Columns:
+        results = words
+    else:
+        results = columns(words, boundaries, metadata)
+
+    if path.endswith(".npz"):
+        with open(path + ".tmp", "wb") as file:
+            np.savez(file, **results.arrays())
+    else:
+        with open(path + ".tmp", "wb") as file:
+            file.write(magic + struct.pack("<I", len(results.arrays())))
+
+            for name, array in results.arrays().items():
+                array = np.ascontiguousarray(array)
+
+                header = struct.pack("<HH", len(name), len(array.dtype.str)) + name.encode("ascii") + array.dtype.str.encode("ascii") + struct.pack("<Q", len(array))
+
+                file.write(header + bytes(-(file.tell() + len(header)) % alignment))
+                file.write(array.tobytes())
+                file.write(bytes(-file.tell() % alignment))
+
+    os.replace(path + ".tmp", path)
+
+    with open(path + ".json.tmp", "w", encoding="utf8") as file:
+        json.dump(dict(results.metadata, words=len(results)), file, indent=1)
+
+    os.replace(path + ".json.tmp", path + ".json")
+    # Each file is written in full before it replaces any older one, so an interrupted save never leaves half a file behind
+
+# Loads results saved by save()
+# PATH: The location of the results
+# MAPPED: Whether to view the arrays of the binary format in place through a memory map, instead of reading them into memory
+    # Arrays in ".npz" archives are always read into memory
+def load(path, mapped=True):
+    metadata = {}
+
+    if os.path.exists(path + ".json"):
+        with open(path + ".json", encoding="utf8") as file:
+            metadata = json.load(file)
+
+    if path.endswith(".npz"):
+        with np.load(path) as archive:
+            arrays = {name: archive[name] for name in archive.files}
+
+        return Columns(arrays["characters"], arrays["wordoffsets"], arrays.get("splits"), arrays.get("splitoffsets"), metadata)
+
+    with open(path, "rb") as file:
+        if mapped:
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            buffer = file.read()
+
+    if buffer[:len(magic)] != magic:
+        print("'" + path + "' is not a columnar results file")
+        return None
+
+    arrays = {}
+
+    position = len(magic)
+
+    count, = struct.unpack_from("<I", buffer, position)
+    position += 4
+
+    for i in range(count):
+        namelength, dtypelength = struct.unpack_from("<HH", buffer, position)
+        position += 4
+
+        name = bytes(buffer[position:position + namelength]).decode("ascii")
+        position += namelength
+
+        dtype = np.dtype(bytes(buffer[position:position + dtypelength]).decode("ascii"))
+        position += dtypelength
+
+        length, = struct.unpack_from("<Q", buffer, position)
+        position += 8
+
+        position += -position % alignment
+
+        arrays[name] = np.frombuffer(buffer, dtype=dtype, count=length, offset=position)
+        # Arrays are viewed where they lie in the file rather than copied out of it
+
+        position += length * dtype.itemsize
+        position += -position % alignment
+
+    return Columns(arrays["characters"], arrays["wordoffsets"], arrays.get("splits"), arrays.get("splitoffsets"), metadata, buffer if mapped else None)
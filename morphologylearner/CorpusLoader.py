@@ -0,0 +1,131 @@
+import mmap
+from collections import Counter
+
+class Corpus:
+    def __init__(self, words, frequencies, lowercase):
+        self.words = words
+        self.frequencies = frequencies
+        self.lowercase = lowercase
+        self.encoding = None
+        self.indexing = None
+        # Defines a corpus as its list of unique words (in the order they were first seen) and the number of times each word occurred
+        # The "lowercase" variable records whether the words were normalised to lowercase when they were loaded
+
+    def encoded(self):
+        if self.encoding is None:
+            self.encoding = encode(self.words, self.frequencies, self.lowercase)
+
+        return self.encoding
+        # Returns the integer-coded form of the corpus (which is only built once)
+
+    def indexed(self):
+        if self.indexing is None:
+            from .Indexing import CorpusIndex
+
+            self.indexing = CorpusIndex(self.words, self.encoded() if self.lowercase else None)
+
+        return self.indexing
+        # Returns the prefix and suffix index of the corpus (which is only built once, and then shared by every method given the corpus)
+        # Corpora that were normalised to lowercase when loaded already hold the index's words in order, so their encoded form is reused
+
+    def __len__(self):
+        return len(self.words)
+
+    def __iter__(self):
+        return iter(self.words)
+
+class EncodedCorpus:
+    def __init__(self, alphabet, codes, offsets, frequencies, lowercase):
+        self.alphabet = alphabet
+        self.codes = codes
+        self.offsets = offsets
+        self.frequencies = frequencies
+        self.lowercase = lowercase
+        # Defines a corpus as an alphabet table and a flat array of positions in that alphabet spelling out every word in order
+        # The characters of word [i] are found between [offsets[i]] and [offsets[i + 1]] in the flat array
+
+    def word(self, i):
+        return "".join(self.alphabet[code] for code in self.codes[self.offsets[i]:self.offsets[i + 1]].tolist())
+        # Decodes and returns a single word
+
+    def words(self):
+        text = "".join(self.alphabet[code] for code in self.codes.tolist())
+        offsets = self.offsets.tolist()
+
+        return [text[offsets[i]:offsets[i + 1]] for i in range(len(offsets) - 1)]
+        # Decodes and returns every word in the corpus
+
+    def lengths(self):
+        return self.offsets[1:] - self.offsets[:-1]
+        # Returns the length of every word in the corpus
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+# ---------------------------------------------------------------------------------------------------- #
+
+# Loads a corpus file containing one word per line
+# Anything following the first word on a line (such as the boundary indexes recorded in the English corpora) is ignored, as are blank lines
+# PATH: The location of the corpus file
+# LOWERCASE: Whether to normalise all the words to lowercase
+# MAPPED: Whether to read the file through a memory map instead of a regular read
+def load(path, lowercase=True, mapped=False):
+    with open(path, "rb") as file:
+        if mapped:
+            try:
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                    data = view[:]
+            except (ValueError, OSError):
+                data = file.read()
+            # Empty files (and special files such as pipes) can't be memory-mapped, so they're read normally
+        else:
+            data = file.read()
+
+    return parse(data.decode("utf8"), lowercase)
+
+def read(file, lowercase=True):
+    return parse(file.read(), lowercase)
+    # Loads a corpus from an open text file (such as standard input) in the same format as load()
+
+def parse(text, lowercase):
+    if lowercase:
+        text = text.lower()
+
+    frequencies = Counter(line.split(None, 1)[0] for line in text.splitlines() if line and not line.isspace())
+    # Take the first word from every non-blank line and count the occurrences of each one (in the order they were first seen)
+
+    return Corpus(list(frequencies), list(frequencies.values()), lowercase)
+
+def encode(words, frequencies=None, lowercase=False):
+    import numpy as np
+    # NumPy is only needed (and loaded) once a corpus is encoded
+
+    words = list(words)
+
+    if frequencies is None:
+        frequencies = [1] * len(words)
+
+    points = np.frombuffer("".join(words).encode("utf-32-le"), dtype=np.uint32)
+
+    alphabet, codes = np.unique(points, return_inverse=True)
+    # The alphabet is derived from the words themselves, so accented or non-Latin characters are treated the same as any others
+
+    offsets = np.zeros(len(words) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(word) for word in words])
+
+    return EncodedCorpus([chr(point) for point in alphabet.tolist()], codes.astype(np.int64).reshape(-1), offsets, np.array(frequencies, dtype=np.int64), lowercase)
+    # Returns the integer-coded form of a list of words
+
+def words(corpus):
+    if type(corpus) is str:
+        return corpus.split()
+
+    if type(corpus) is Corpus:
+        return corpus.words
+
+    if type(corpus) is EncodedCorpus:
+        return corpus.words()
+
+    return corpus
+    # Returns the words of any supported form of corpus as a list
+    # Corpora can be supplied as a block of text, a list of words, a loaded corpus or an encoded corpus
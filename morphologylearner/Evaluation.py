@@ -0,0 +1,199 @@
+import numpy as np
+from itertools import chain
+from . import Reporting
+
+class Segmentation:
+    def __init__(self, words, boundaries):
+        self.words = tuple(words)
+
+        self.lengths = np.fromiter(map(len, self.words), dtype=np.int64, count=len(self.words))
+
+        self.offsets = np.zeros(len(self.words) + 1, dtype=np.int64)
+        self.offsets[1:] = np.cumsum(self.lengths + 1)
+
+        self.ids = np.repeat(np.arange(len(self.words)), self.lengths + 1)
+        self.indexes = np.arange(int(self.offsets[-1])) - self.offsets[self.ids]
+        # Every position in every word (from before its first character to after its last) is given a "slot" in a flat array
+        # The slots of word [i] run from [offsets[i]] to [offsets[i + 1]], and slot [j] is position [indexes[j]] of word [ids[j]]
+
+        self.mask = self.slots(*flatten(boundaries))
+
+        last = np.zeros(len(self.words), dtype=np.int64)
+        np.maximum.at(last, self.ids[self.mask], self.indexes[self.mask])
+        # Find the last boundary of every word (or 0 if it has none)
+
+        self.suffixes, suffixids = np.unique([word[p:] if p > 0 else "" for word, p in zip(self.words, last.tolist())], return_inverse=True)
+
+        self.slotlengths = self.lengths[self.ids]
+        self.slotsuffixes = suffixids.reshape(-1)[self.ids]
+        # Record the length and final suffix of the word that each slot belongs to, which the breakdowns of evaluate() are grouped by
+        # Words without a boundary are grouped under an empty suffix
+        # Defines a segmentation of a set of words (such as the gold standard boundaries of the English corpora) as a boolean mask over every position of every word
+        # Only positions strictly inside a word can be boundaries, so any others (such as 0, which the English corpora use to mark words without one) are ignored
+
+    def slots(self, ids, positions):
+        valid = (ids >= 0) & (positions > 0) & (positions < self.lengths[np.maximum(ids, 0)])
+
+        mask = np.zeros(int(self.offsets[-1]), dtype=bool)
+        mask[self.offsets[ids[valid]] + positions[valid]] = True
+
+        return mask
+        # Converts lists of word numbers and boundary positions into a mask over the segmentation's slots
+
+    def predicted(self, output):
+        if type(output) is dict:
+            return self.slots(*flatten([output.get(word, ()) for word in self.words]))
+            # Output from Harris(), mapping each word to a list of its boundaries
+
+        if type(output) is Segmentation:
+            if output.words == self.words:
+                return output.mask
+
+            return self.predicted(output.boundaries())
+            # Output loaded from a file (see load())
+
+        if hasattr(output, "splitoffsets"):
+            return self.predicted(output.boundaries())
+            # Output loaded from a columnar results file (see Columnar.load())
+
+        if hasattr(output, "splits") and hasattr(output, "index"):
+            splits = np.abs(np.asarray(output.splits, dtype=np.int64))
+
+            if output.index.words == self.words:
+                return self.slots(np.arange(len(self.words)), splits)
+
+            rows = np.fromiter((output.index.positions.get(word, -1) for word in self.words), dtype=np.int64, count=len(self.words))
+
+            return self.slots(np.where(rows >= 0, np.arange(len(self.words)), -1), splits[np.maximum(rows, 0)])
+            # Output from genetic(), which holds a single boundary for each word of its own index
+            # Splits at the end of a word (or at its start) mark words that are left whole
+
+        return self.slots(*flatten(output))
+        # Otherwise, a list holding a list of boundaries for each word of this segmentation (in order)
+
+    def boundaries(self):
+        splits = {word: [] for word in self.words}
+
+        for i, position in zip(self.ids[self.mask].tolist(), self.indexes[self.mask].tolist()):
+            splits[self.words[i]].append(position)
+
+        return splits
+        # Returns a dictionary of the boundaries of each word (in the same format as the output of Harris())
+
+    def __len__(self):
+        return len(self.words)
+
+def flatten(boundaries):
+    counts = np.fromiter(map(len, boundaries), dtype=np.int64, count=len(boundaries))
+
+    positions = np.fromiter(chain.from_iterable(boundaries), dtype=np.int64, count=int(counts.sum()))
+
+    return np.repeat(np.arange(len(boundaries)), counts), positions
+    # Converts a list of lists of boundaries into parallel arrays of word numbers and positions
+
+# Loads a file of segmented words, with each word followed by the positions of its boundaries (such as "sibilating 5 7")
+# The English corpora are stored in this format, as are the outputs written by the Harris and MDL commands
+# Repeated words keep the boundaries given on their first line
+# PATH: The location of the file
+# LOWERCASE: Whether to normalise all the words to lowercase
+def load(path, lowercase=True):
+    with open(path, encoding="utf8") as file:
+        return parse(file.read(), lowercase)
+
+def read(file, lowercase=True):
+    return parse(file.read(), lowercase)
+    # Loads a segmentation from an open text file (such as standard input) in the same format as load()
+
+def parse(text, lowercase):
+    if lowercase:
+        text = text.lower()
+
+    segmented = {}
+
+    for line in text.splitlines():
+        tokens = line.split()
+
+        if len(tokens) > 0 and tokens[0] not in segmented:
+            segmented[tokens[0]] = [int(token) for token in tokens[1:]]
+
+    return Segmentation(list(segmented), list(segmented.values()))
+
+def scores(tp, fp, fn):
+    tp = np.asarray(tp, dtype=np.float64)
+
+    precision = np.divide(tp, tp + fp, out=np.zeros_like(tp), where=(tp + fp) > 0)
+    recall = np.divide(tp, tp + fn, out=np.zeros_like(tp), where=(tp + fn) > 0)
+    f1 = np.divide(2 * precision * recall, precision + recall, out=np.zeros_like(tp), where=(precision + recall) > 0)
+
+    return precision, recall, f1
+    # Calculates precision, recall and F1 (elementwise, when given arrays of counts)
+    # Any score whose denominator is 0 is given as 0
+
+def breakdown(keys, gold, predicted, size):
+    tp = np.bincount(keys[gold & predicted], minlength=size)
+    fp = np.bincount(keys[~gold & predicted], minlength=size)
+    fn = np.bincount(keys[gold & ~predicted], minlength=size)
+
+    precision, recall, f1 = scores(tp, fp, fn)
+
+    return tp, fp, fn, precision, recall, f1
+    # Counts and scores boundaries separately for each group of slots (as identified by [keys])
+
+# Scores the boundaries found by one of the algorithms against a reference segmentation
+# Boundaries are counted across the whole corpus: a boundary is a true positive if the reference has a boundary at the same position of the same word
+# GOLD: The reference segmentation (as returned by load())
+# OUTPUT: The boundaries to score, as the dictionary returned by Harris(), the individual returned by genetic(), columnar results, another segmentation or a list of boundary lists in the same order as the reference's words
+# BREAKDOWNS: Whether to also score boundaries separately for each word length and for each of the reference's final suffixes
+# Returns a dictionary of the counts and scores
+def evaluate(gold, output, breakdowns=True):
+    predicted = gold.predicted(output)
+
+    tp = int(np.count_nonzero(gold.mask & predicted))
+    fp = int(np.count_nonzero(predicted)) - tp
+    fn = int(np.count_nonzero(gold.mask)) - tp
+
+    precision, recall, f1 = scores(tp, fp, fn)
+
+    results = {"words": len(gold), "tp": tp, "fp": fp, "fn": fn, "precision": float(precision), "recall": float(recall), "f1": float(f1)}
+
+    if breakdowns:
+        for name, keys, labels in (("lengths", gold.slotlengths, None), ("suffixes", gold.slotsuffixes, gold.suffixes)):
+            size = int(keys.max()) + 1 if len(keys) > 0 else 0
+
+            counts = np.bincount(keys, minlength=size)
+            tps, fps, fns, precisions, recalls, f1s = breakdown(keys, gold.mask, predicted, size)
+
+            groups = {}
+
+            for i in np.flatnonzero(counts).tolist():
+                if labels is None:
+                    key = i
+                else:
+                    key = str(labels[i])
+
+                groups[key] = {"tp": int(tps[i]), "fp": int(fps[i]), "fn": int(fns[i]), "precision": float(precisions[i]), "recall": float(recalls[i]), "f1": float(f1s[i])}
+
+            results[name] = groups
+
+    return results
+
+def report(results, suffixcount=20, reporter=None):
+    if reporter is None:
+        reporter = Reporting.default
+
+    reporter.log("Boundaries | P " + str(round(results["precision"], 4)) + " | R " + str(round(results["recall"], 4)) + " | F1 " + str(round(results["f1"], 4)) + " | " + str(results["tp"]) + " TP | " + str(results["fp"]) + " FP | " + str(results["fn"]) + " FN (" + str(results["words"]) + " words)")
+
+    if "lengths" in results:
+        reporter.log("\nBy Word Length")
+
+        for length, counts in sorted(results["lengths"].items()):
+            reporter.log(str(length) + " | P " + str(round(counts["precision"], 4)) + " | R " + str(round(counts["recall"], 4)) + " | F1 " + str(round(counts["f1"], 4)))
+
+    if "suffixes" in results and suffixcount > 0:
+        reporter.log("\nBy Final Suffix (" + str(suffixcount) + " most common)")
+
+        suffixes = sorted(results["suffixes"].items(), key=lambda item: item[1]["tp"] + item[1]["fn"], reverse=True)
+
+        for suffix, counts in suffixes[:suffixcount]:
+            reporter.log("-" + suffix + " | P " + str(round(counts["precision"], 4)) + " | R " + str(round(counts["recall"], 4)) + " | F1 " + str(round(counts["f1"], 4)) + " | " + str(counts["tp"] + counts["fn"]) + " gold boundaries")
+    # Writes the scores returned by evaluate(), with the suffixes that carry the most gold boundaries listed first
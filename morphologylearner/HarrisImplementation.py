@@ -1,4 +1,7 @@
 import time
+from . import CorpusLoader
+from . import Instrumentation
+from . import Reporting
 
 class HarrisNode:
     def __init__(self, character):
@@ -18,17 +21,16 @@ class HarrisNode:
         character = word.lower()[0]
 
         if character not in self.children():
-            self.successors.append(HarrisNode(character))
+            self.successors.append(self.__class__(character))
         
         if len(word) > 1:
             self.child(character).appendstring(word[1:])
         elif "#" not in self.child(character).children():
-            self.child(character).successors.append(HarrisNode("#"))
+            self.child(character).successors.append(self.__class__("#"))
         # Recursively appends the characters of an input string to the node (followed by the "#" symbol after the final character)
 
     def appendstrings(self, corpus):       
-        if type(corpus) is str:
-            corpus = corpus.split()
+        corpus = CorpusLoader.words(corpus)
         
         for word in corpus:
             self.appendstring(word)
@@ -57,7 +59,7 @@ class HarrisNode:
         subtrie = self.successors.pop(self.childindex(character))
 
         if "#" not in self.children():
-            self.successors.append(HarrisNode("#"))
+            self.successors.append(self.__class__("#"))
                 
         return subtrie
         # Prunes (and returns) the child node corresponding to the specified character (and any children of that node)
@@ -128,64 +130,150 @@ class HarrisNode:
 
 # ---------------------------------------------------------------------------------------------------- #
 
-def Harris(corpus, ESM, frequencymatching):
-    if type(corpus) is str:
-        corpus = corpus.split()
-    
-    splits = {}
+def Harris(corpus, ESM, frequencymatching, root=None, reporter=None, stats=None):
+    if root is None:
+        root = index(corpus, stats)
+    # Index the corpus (unless it has already been indexed, or a trie has already been built for it)
+    # Loaded corpora keep their index, so it's only built once however many methods are run over them
 
-    root = HarrisNode.start()
-    root.appendstrings(corpus)
-    # Build a trie from the corpus
+    corpus = CorpusLoader.words(corpus)
 
-    print("*" + ("=" * 50) + "*\n")
+    if reporter is None:
+        reporter = Reporting.default
 
-    if ESM > 0:        
+    reporter.log("*" + ("=" * 50) + "*\n")
+
+    if ESM > 0:
+        indexes = eagersuffixes(corpus, ESM, frequencymatching, root, reporter, stats)
+    else:
         indexes = {}
-        suffixlog = {}
 
-        for word in corpus:
-            # If ESM is enabled, catalogue all unique suffixes following all words' last splits
-            # Also record their natural occurrence counts
-            suffix = word[root.finalbranch(word):]
+    return harrissplits(corpus, ESM, indexes, root, reporter, stats)
+    # Splits every word in the corpus with Harris' method, after (optionally) matching words with their suffixes eagerly
+    # Returns a dictionary of the split indexes of each word
+    # ROOT: Either a trie built from the corpus (see trie()) or an Indexing.CorpusIndex of it, which give the same branching factors
+    # If an Instrumentation.Stats object is supplied, the index's size (or the trie's node creations and child lookups), ESM's suffix comparisons and the time spent in each phase are recorded in it
+    # Child lookups are only counted in tries built by trie() with the same object
+
+def index(corpus, stats=None):
+    from . import Indexing
+    # The index is built with NumPy, which is only loaded once a corpus is indexed
+
+    if stats is None:
+        return Indexing.index(corpus)
+
+    start = time.perf_counter()
+
+    corpusindex = Indexing.index(corpus)
+    corpusindex.varieties()
+
+    stats.count("index.stems", len(corpusindex.stemids))
+    stats.count("index.suffixes", len(corpusindex.suffixids))
+    stats.time("index", time.perf_counter() - start)
+
+    return corpusindex
+    # Indexes the corpus' prefixes and suffixes, from which the successor varieties of every prefix are found at once (see Indexing.CorpusIndex)
+
+def trie(corpus, stats=None):
+    if stats is None:
+        root = HarrisNode.start()
+        root.appendstrings(corpus)
+
+        return root
+
+    start = time.perf_counter()
+
+    root = Instrumentation.counting(HarrisNode, stats, {"__init__": "trie.nodes", "childindex": "trie.lookups"}).start()
+    root.appendstrings(corpus)
+
+    stats.time("trie", time.perf_counter() - start)
+
+    return root
+    # Builds a trie from the corpus
+    # When recording stats, the trie is built from nodes that count their creations and child lookups
+
+def eagersuffixes(corpus, ESM, frequencymatching, root, reporter, stats=None):
+    if stats is not None:
+        start = time.perf_counter()
+
+    detail = reporter.enabled(Reporting.DETAIL)
+
+    indexes = {}
+
+    suffixes = suffixranking(corpus, ESM, frequencymatching, root)
+
+    reporter.log("EAGER SUFFIX MATCHES", Reporting.DETAIL)
+    
+    for word in corpus:
+        if len(word) <= 1:
+            continue
+        
+        for suffix in suffixes:
+            if word not in indexes and word.endswith(suffix):
+                # Match each word with the most commonly-occurring documented suffix that it ends with
+                split = word.rfind(suffix)
+
+                indexes[word] = split
 
-            if frequencymatching and len(suffix) < ESM:
-                continue
+                if detail:
+                    reporter.log(word + " ← " + suffix + " [" + str(split) + "]", Reporting.DETAIL)
 
-            if suffix not in suffixlog:
-                suffixlog[suffix] = 1
-            else:
-                suffixlog[suffix] += 1
+                break
+
+    reporter.log("", Reporting.DETAIL)
+
+    if stats is not None:
+        ranks = {suffix: i for i, suffix in enumerate(suffixes)}
+
+        stats.count("esm.suffixes", len(suffixes))
+        stats.count("esm.attempts", sum(1 for word in corpus if len(word) > 1))
+        stats.count("esm.comparisons", sum(ranks[word[indexes[word]:]] + 1 if word in indexes else len(suffixes) for word in corpus if len(word) > 1))
+        stats.count("esm.matches", len(indexes))
+        stats.time("esm", time.perf_counter() - start)
+        # Each word is compared with every suffix up to the one it's matched with, so the comparisons are counted from the matches afterwards instead of in the loop above
+
+    return indexes
+    # Returns the index of the eagerly-matched suffix of each word that has one
+
+def suffixranking(corpus, ESM, frequencymatching, root):
+    suffixlog = {}
 
-        if frequencymatching:
-            suffixes = sorted(suffixlog, key=suffixlog.get)
+    for word in corpus:
+        # If ESM is enabled, catalogue all unique suffixes following all words' last splits
+        # Also record their natural occurrence counts
+        suffix = word[root.finalbranch(word):]
+
+        if frequencymatching and len(suffix) < ESM:
+            continue
+
+        if suffix not in suffixlog:
+            suffixlog[suffix] = 1
         else:
-            suffixes = sorted(suffixlog, key=len)
-            
-        suffixes.reverse()
-        # Sort the suffix list to place greater precedence on more frequently-occuring suffixes
+            suffixlog[suffix] += 1
 
-        print("EAGER SUFFIX MATCHES")
+    if frequencymatching:
+        suffixes = sorted(suffixlog, key=suffixlog.get)
+    else:
+        suffixes = sorted(suffixlog, key=len)
         
-        for word in corpus:
-            if len(word) <= 1:
-                continue
-            
-            for suffix in suffixes:
-                if word not in indexes and word.endswith(suffix):
-                    # Match each word with the most commonly-occurring documented suffix that it ends with
-                    split = word.rfind(suffix)
+    suffixes.reverse()
+    # Sort the suffix list to place greater precedence on more frequently-occuring suffixes
+
+    return suffixes
+    # Returns the suffixes following the final branch of every word, in the order that eager suffix matching tries them
 
-                    indexes[word] = split
+def harrissplits(corpus, ESM, indexes, root, reporter, stats=None):
+    if stats is not None:
+        start = time.perf_counter()
 
-                    print(word + " ← " + suffix + " [" + str(split) + "]")
+    detail = reporter.enabled(Reporting.DETAIL)
 
-                    break
+    splits = {}
 
-        print()
+    c = 0
 
     for word in corpus:
-        if ESM > 0 and word in indexes and indexes[word] > 0:
+        if word in indexes and indexes[word] > 0:
             # If ESM is enabled, perform Harrisian analysis on the parts of each word *before* their newly-designated suffixes
             splits[word] = maxima(root.distribution(word[:indexes[word]]))
             splits[word].append(indexes[word])
@@ -193,14 +281,23 @@ def Harris(corpus, ESM, frequencymatching):
             # Otherwise, perform standard Harrisian analysis
             splits[word] = maxima(root.distribution(word))
 
-    print("SPLITS (ESM: " + str(ESM) + ")")
+        c += 1
 
-    for word in corpus:
-        print(word + " " + str(splits[word]))
+        reporter.progress("word(s) split", c, len(corpus))
 
-    print()
+    if detail:
+        reporter.log("SPLITS (ESM: " + str(ESM) + ")", Reporting.DETAIL)
+
+        for word in corpus:
+            reporter.log(word + " " + str(splits[word]), Reporting.DETAIL)
+
+        reporter.log("", Reporting.DETAIL)
+
+    if stats is not None:
+        stats.time("splits", time.perf_counter() - start)
 
     return splits
+    # Returns the split indexes of each word (with those before any eagerly-matched suffix found from the trie's branching factors)
 
 def maxima(flat):        
     indexes = []
@@ -304,20 +401,7 @@ minESMlength = 1
 ESMmatchsetting = True
 
 def test(filename, outname):
-    corpus = []
-    
-    with open("C:\\Users\\Joseph\\Desktop\\" + filename + ".txt", "r") as file:
-        for line in file:
-            word = line
-
-            if "\n" in word:
-                word = word[:word.rfind("\n")]
-
-            if " " in word:
-                word = word[:word.find(" ")]
-
-            if len(word) > 0:
-                corpus.append(word)
+    corpus = CorpusLoader.load("C:\\Users\\Joseph\\Desktop\\" + filename + ".txt").words
 
     timeA = time.process_time()
 
@@ -342,20 +426,7 @@ def test(filename, outname):
         file.close()
 
 def testutf(filename, outname):
-    corpus = []
-    
-    with open("C:\\Users\\Joseph\\Desktop\\" + filename + ".txt", "r", encoding="utf8") as file:
-        for line in file:
-            word = line
-
-            if "\n" in word:
-                word = word[:word.rfind("\n")]
-
-            if " " in word:
-                word = word[:word.find(" ")]
-
-            if len(word) > 0:
-                corpus.append(word)
+    corpus = CorpusLoader.load("C:\\Users\\Joseph\\Desktop\\" + filename + ".txt").words
 
     timeA = time.process_time()
 
@@ -382,8 +453,10 @@ def testutf(filename, outname):
 
 # ---------------------------------------------------------------------------------------------------- #
 
-#testscript2()
-#testscript3()
+if __name__ == "__main__":
+    #testscript2()
+    #testscript3()
 
-#root = test("CornishCorpus100", "CornishCorpus100HarrisNoESM")
-root = testutf("ScotsGaelicCorpus5028", "ScotsGaelicCorpus5028WithESMFreqMinLen1")
+    #root = test("CornishCorpus100", "CornishCorpus100HarrisNoESM")
+    root = testutf("ScotsGaelicCorpus5028", "ScotsGaelicCorpus5028WithESMFreqMinLen1")
+    # Experiments are only run when this module is executed directly (with "python -m morphologylearner.HarrisImplementation")
@@ -0,0 +1,186 @@
+import numpy as np
+from . import CorpusLoader
+
+# Indexes every prefix and suffix of a corpus once, so that Harris' method, Neuvel and Fulop's method and the genetic process can all draw their statistics from it
+# Words are normalised to lowercase and only kept once each (in the order they were first seen)
+# Every position in every word (from before its first character to after its last) is given a "slot", and the slot of position [k] in word [j] is found at [offsets[j] + k]
+# Each slot records the ID of the prefix before it ([stems]) and of the suffix after it ([suffixes])
+# Statistics derived from the IDs (successor varieties, entropies and the words holding each prefix and suffix) are only worked out the first time they're asked for
+# CORPUS: The corpus to index (in any form supported by CorpusLoader.words())
+# ENCODED: An encoded form of the same (lowercased, unique) words, which is encoded from the words when set to None
+class CorpusIndex:
+    def __init__(self, corpus, encoded=None):
+        self.words = tuple(dict.fromkeys(word.lower() for word in CorpusLoader.words(corpus)))
+        self.positions = {word: j for j, word in enumerate(self.words)}
+
+        self.lengths = np.array([len(word) for word in self.words], dtype=np.int64)
+        self.nmax = int(self.lengths.sum())
+
+        self.offsets = np.zeros(len(self.words) + 1, dtype=np.int64)
+        self.offsets[1:] = np.cumsum(self.lengths + 1)
+
+        self.stemids = {}
+        self.suffixids = {}
+
+        stems = []
+        suffixes = []
+
+        for word in self.words:
+            for k in range(len(word) + 1):
+                stems.append(self.stemids.setdefault(word[:k], len(self.stemids)))
+                suffixes.append(self.suffixids.setdefault(word[k:], len(self.suffixids)))
+        # Assign an integer ID to every possible stem and suffix across the corpus
+
+        self.stems = np.array(stems, dtype=np.int64)
+        self.suffixes = np.array(suffixes, dtype=np.int64)
+
+        self.stemlengths = np.array([len(stem) for stem in self.stemids], dtype=np.int64)
+        self.suffixlengths = np.array([len(suffix) for suffix in self.suffixids], dtype=np.int64)
+        # Record the length of the substring behind every ID
+
+        self.stemcounts = np.bincount(self.stems, minlength=len(self.stemids))
+        self.suffixcounts = np.bincount(self.suffixes, minlength=len(self.suffixids))
+        # Every word holds each of its prefixes and suffixes in exactly one slot, so these count the words that start with each stem and end with each suffix
+
+        if encoded is None:
+            encoded = CorpusLoader.encode(self.words)
+
+        self.alphabet = encoded.alphabet
+        self.codes = encoded.codes
+        # Record every character of the corpus (in order) as a position in the corpus' own alphabet
+
+        self.characters = np.arange(len(self.codes)) + np.repeat(np.arange(len(self.words)), self.lengths)
+        # Find the slot before every character of the corpus (the character at position [k] of a word follows the stem [word[:k]] and precedes the suffix [word[k + 1:]])
+
+        self.cache = {}
+
+    def varieties(self):
+        if "varieties" not in self.cache:
+            successors = np.full(len(self.stems), len(self.alphabet), dtype=np.int64)
+            successors[self.characters] = self.codes
+            # The successor of every slot is the character after it, or an end marker (coded after the alphabet) after a word's last character
+
+            pairs = np.unique(self.stems * (len(self.alphabet) + 1) + successors)
+            owners = pairs // (len(self.alphabet) + 1)
+
+            varieties = np.bincount(owners, minlength=len(self.stemids))
+
+            ended = np.zeros(len(self.stemids), dtype=bool)
+            ended[owners[pairs % (len(self.alphabet) + 1) == len(self.alphabet)]] = True
+
+            varieties[(varieties == 1) & ended] = 0
+            # A stem's variety is the number of distinct characters (or word ends) that follow it, except that stems only ever followed by word ends are given 0 (matching HarrisNode.factor())
+
+            self.cache["varieties"] = varieties
+            self.cache["slotvarieties"] = varieties[self.stems].tolist()
+
+        return self.cache["varieties"]
+        # Returns the successor variety of every stem (as a branching factor in a Harris trie built from the corpus)
+
+    def distribution(self, word):
+        self.varieties()
+
+        word = word.lower()
+
+        if word in self.positions:
+            base = int(self.offsets[self.positions[word]])
+
+            return self.cache["slotvarieties"][base + 1:base + len(word) + 1]
+
+        flat = []
+
+        for k in range(1, len(word) + 1):
+            if word[:k] not in self.stemids:
+                break
+
+            flat.append(int(self.cache["varieties"][self.stemids[word[:k]]]))
+
+        return flat
+        # Returns the successor quantity distribution across a word (in the same "flat" format as HarrisNode.distribution() from a root)
+        # Distributions of words outside the corpus stop at the longest prefix that the corpus holds
+
+    def finalbranch(self, word):
+        distribution = self.distribution(word)[:-1]
+
+        for i in range(len(distribution))[::-1]:
+            if distribution[i] > 1:
+                return i + 1
+        # Returns the index of the final branch along the word (or None if there isn't one), as HarrisNode.finalbranch() does
+
+    def entropies(self):
+        if "entropies" not in self.cache:
+            stementropies = distributionentropy(self.stems[self.characters], self.codes, len(self.stemids), len(self.alphabet))
+            suffixentropies = distributionentropy(self.suffixes[self.characters + 1], self.codes, len(self.suffixids), len(self.alphabet))
+            # Calculate the next-letter entropy of every possible stem and the last-letter entropy of every possible suffix in a single pass each
+
+            if len(self.words) > 0:
+                stementropies[self.stems[self.offsets[0]]] = 0
+                suffixentropies[self.suffixes[self.offsets[1] - 1]] = 0
+                # The entropies of empty stems and suffixes are defined as 0
+
+            self.cache["entropies"] = (stementropies, suffixentropies)
+
+        return self.cache["entropies"]
+        # Returns the entropy of the characters following every stem and of those preceding every suffix
+
+    def postings(self):
+        if "stempostings" not in self.cache:
+            words = np.repeat(np.arange(len(self.words)), self.lengths + 1)
+
+            for name, ids, count in (("stem", self.stems, len(self.stemids)), ("suffix", self.suffixes, len(self.suffixids))):
+                order = np.argsort(ids, kind="stable")
+
+                starts = np.zeros(count + 1, dtype=np.int64)
+                starts[1:] = np.cumsum(np.bincount(ids, minlength=count))
+
+                self.cache[name + "postings"] = (words[order], starts)
+            # Sorting the slots by ID (stably, so that each ID's words stay in corpus order) gathers the words holding each stem or suffix together
+
+        return self.cache["stempostings"], self.cache["suffixpostings"]
+        # Returns, for stems and for suffixes, the positions of the words holding each ID (in corpus order) and where each ID's positions start
+
+    def holding(self, stem=None, suffix=None):
+        (stemwords, stemstarts), (suffixwords, suffixstarts) = self.postings()
+
+        found = []
+
+        if stem is not None and stem in self.stemids:
+            i = self.stemids[stem]
+
+            found.append(stemwords[stemstarts[i]:stemstarts[i + 1]])
+
+        if suffix is not None and suffix in self.suffixids:
+            i = self.suffixids[suffix]
+
+            found.append(suffixwords[suffixstarts[i]:suffixstarts[i + 1]])
+
+        if len(found) == 0:
+            return np.zeros(0, dtype=np.int64)
+
+        if len(found) == 1:
+            return found[0]
+
+        return np.union1d(found[0], found[1])
+        # Returns the positions (in corpus order) of the words that start with [STEM] or end with [SUFFIX]
+
+    def __len__(self):
+        return len(self.words)
+
+def index(corpus):
+    if type(corpus) is CorpusLoader.Corpus:
+        return corpus.indexed()
+
+    return CorpusIndex(corpus)
+    # Returns the index of a corpus, reusing the one held by a loaded corpus if it has one
+
+def distributionentropy(ids, codes, count, alphabetsize):
+    pairs, counts = np.unique(ids * alphabetsize + codes, return_counts=True)
+    owners = pairs // alphabetsize
+    # Count the occurrences of every distinct (ID, character) pairing
+
+    totals = np.bincount(owners, weights=counts, minlength=count)
+    p = counts / totals[owners]
+
+    return np.bincount(owners, weights=-p * np.log2(p), minlength=count)
+    # Returns the entropy of the characters observed alongside each ID (from 0 to [count - 1])
+    # IDs that were never observed alongside a character are given an entropy of 0
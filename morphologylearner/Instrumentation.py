@@ -0,0 +1,80 @@
+import json
+import time
+from collections import Counter
+
+throughputs = ("attempts", "comparisons", "evaluated", "evaluations", "lookups", "nodes", "scans")
+# The kinds of counter that are also reported per second of their subject's timer
+
+# Collects counters and phase timers from the package's methods
+# Methods that accept a "stats" argument only record anything when they're given a Stats object, and check for one outside of their innermost loops (so leaving it out costs nothing)
+# Counters are named "[subject].[event]" (such as "stemcache.hits"), and timers are named after phases (such as "trie" or "fitness")
+class Stats:
+    def __init__(self):
+        self.counters = Counter()
+        self.timers = Counter()
+
+    def count(self, name, n=1):
+        self.counters[name] += n
+
+    def time(self, name, seconds):
+        self.timers[name] += seconds
+
+    def lap(self, name, mark):
+        now = time.perf_counter()
+
+        self.timers[name] += now - mark
+
+        return now
+        # Adds the time since [mark] to a timer and returns the current time (to be used as the next mark)
+
+    def rates(self):
+        rates = {}
+
+        for name in self.counters:
+            subject, event = name.rsplit(".", 1) if "." in name else ("", name)
+
+            if event == "hits":
+                total = self.counters[name] + self.counters[subject + ".misses"]
+
+                rates[subject + ".hitrate"] = self.counters[name] / total if total > 0 else 0.0
+            elif event == "matches" and self.counters[subject + ".attempts"] > 0:
+                rates[subject + ".matchrate"] = self.counters[name] / self.counters[subject + ".attempts"]
+
+            if event in throughputs and self.timers[subject] > 0:
+                rates[name + ".persecond"] = self.counters[name] / self.timers[subject]
+
+        return rates
+        # Derives hit rates (from "hits" and "misses" counters), match rates (from "matches" and "attempts" counters) and throughputs (from counters of operations whose subject has a timer of the same name)
+
+    def record(self):
+        return {"counters": dict(self.counters), "timers": dict(self.timers), "rates": self.rates()}
+
+    def dump(self, path):
+        with open(path, "w", encoding="utf8") as file:
+            json.dump(self.record(), file, indent=1)
+
+    def __str__(self):
+        lines = [name + ": " + str(value) for name, value in sorted(self.counters.items())]
+        lines += [name + ": " + str(round(value, 6)) + "s" for name, value in sorted(self.timers.items())]
+        lines += [name + ": " + str(round(value, 4)) for name, value in sorted(self.rates().items())]
+
+        return "\n".join(lines)
+
+def counting(base, stats, methods):
+    attributes = {}
+
+    for method, name in methods.items():
+        attributes[method] = counted(getattr(base, method), stats.counters, name)
+
+    return type(base.__name__, (base,), attributes)
+    # Returns a subclass of [base] whose given methods each increment a counter whenever they're called
+    # METHODS: A dictionary mapping method names to the counters they increment
+    # Only objects created from the subclass are counted, so the base class itself is left as fast as ever
+
+def counted(function, counters, name):
+    def method(*arguments):
+        counters[name] += 1
+
+        return function(*arguments)
+
+    return method
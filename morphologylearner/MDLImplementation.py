@@ -0,0 +1,1283 @@
+import ctypes
+import json
+import multiprocessing
+import os
+import time
+import random
+import numpy as np
+from array import array
+from . import CorpusLoader
+from . import Reporting
+from .HarrisImplementation import Harris, trie
+from .Indexing import CorpusIndex
+from collections import Counter
+from math import *
+
+bestlist = []
+statslist = []
+
+class WordIndex:
+    __slots__ = ("words", "positions", "nmax", "typecode")
+
+    def __init__(self, words, nmax=None):
+        self.words = tuple(dict.fromkeys(words))
+        self.positions = {word: i for i, word in enumerate(self.words)}
+
+        if nmax is None:
+            nmax = sum(len(word) for word in self.words)
+
+        self.nmax = nmax
+
+        if max((len(word) for word in self.words), default=0) < 128:
+            self.typecode = "b"
+        else:
+            self.typecode = "h"
+        # Split positions are stored as signed bytes unless a word is too long for them
+        # Defines the (unique) words of a corpus and their positions, which are shared by every individual built over that corpus
+        # NMAX: The total character-count of the original corpus
+
+class Individual:
+    __slots__ = ("index", "splits")
+
+    def __init__(self, corpus, splits=None):
+        if type(corpus) is WordIndex:
+            self.index = corpus
+        elif type(corpus) is dict:
+            self.index = WordIndex(list(corpus))
+            splits = list(corpus.values())
+        else:
+            corpus = CorpusLoader.words(corpus)
+
+            self.index = WordIndex([word.lower() for word in corpus], sum(len(word) for word in corpus))
+
+        if splits is None:
+            splits = [random.randint(1, len(word)) for word in self.index.words]
+
+        self.splits = array(self.index.typecode, splits)
+        # Can either instantiate with a list of words (which will be assigned random split positions), an existing mapping, or a shared word index (with or without its split positions)
+        # Split positions are stored in the same order as the index's words, and locked boundaries are indicated by negation
+
+    @property
+    def corpus(self):
+        return dict(zip(self.index.words, self.splits))
+        # Returns a copy of the individual as a mapping from each word to its split position
+
+    def list(self):
+        return [[word, split] for word, split in zip(self.index.words, self.splits)]
+        # Returns a list of each word-split pairing
+
+    def listabsolute(self):
+        return [[word, abs(split)] for word, split in zip(self.index.words, self.splits)]
+        # Returns a list of each word-split pairing
+        # Negative splits (indicating locked boundaries) are converted to positive values
+
+    def wordlist(self):
+        return list(self.index.words)
+        # Returns an ordered list of the words in the mapping
+
+    def splitlist(self):
+        return self.splits.tolist()
+        # Returns an ordered list of the splits in the mapping
+
+    def splitlistabsolute(self):
+        return [abs(split) for split in self.splits]
+        # Returns an ordered list of the splits in the mapping
+        # Negative splits (indicating locked boundaries) are converted to positive values
+
+    def boundary(self, word):
+        return self.splits[self.index.positions[word.lower()]]
+        # Acts as an interface for the core mapping
+
+    def boundaryabsolute(self, word):
+        return abs(self.splits[self.index.positions[word.lower()]])
+        # Acts as an interface for the core mapping
+        # Returns negative splits (indicating locked boundaries) as positive values
+
+    def stem(self, word):
+        return word[:abs(self.splits[self.index.positions[word]])]
+        # Returns a word's assigned stem
+
+    def suffix(self, word):
+        return word[abs(self.splits[self.index.positions[word]]):]
+        # Returns a word's assigned suffix
+
+    def segmented(self, word):
+        word = word.lower()
+
+        p = abs(self.splits[self.index.positions[word]])
+
+        return word[:p] + "|" + word[p:]
+        # Returns a copy of the word with the word's assigned split indicated
+
+    def set(self, word, n, shift):
+        word = word.lower()
+
+        if word not in self.index.positions:
+            print("'" + word + "' is not defined in the corpus")
+            return
+
+        i = self.index.positions[word]
+
+        if self.splits[i] < 0:
+            print("'" + word + "': Boundary has been locked at position [" + str(abs(self.splits[i])) + "] and cannot be changed")
+            return
+
+        if (shift):
+            if self.splits[i] + n < 1:
+                p = 1
+            elif self.splits[i] + n > len(word):
+                p = len(word)
+            else:
+                p = self.splits[i] + n
+        else:
+            if n < 1:
+                p = 1
+            elif n > len(word):
+                p = len(word)
+            else:
+                p = n
+
+        self.splits[i] = p
+
+        return word[:p] + "|" + word[p:]
+        # Changes a word's boundary
+        # The "shift" parameter imposes relative changes (as opposed to absolute changes) if it's set to be True
+
+    def lock(self, word):
+        word = word.lower()
+
+        if word not in self.index.positions:
+            print("'" + word + "' is not defined in the corpus")
+            return
+
+        i = self.index.positions[word]
+
+        self.splits[i] = -self.splits[i]
+        # Locks (or unlocks) a word's split position
+        # Locking is indicated by negation
+
+    def islocked(self, word):
+        word = word.lower()
+
+        if word not in self.index.positions:
+            print("'" + word + "' is not defined in the corpus")
+            return
+
+        return self.splits[self.index.positions[word]] < 0
+        # Returns True if a word's split position is locked, and False otherwise
+
+    def stems(self):
+        return list(dict.fromkeys(word[:abs(split)] for word, split in zip(self.index.words, self.splits)))
+        # Returns a list of the (unique) stems defined by the individual
+
+    def suffixes(self):
+        return list(dict.fromkeys(word[abs(split):] for word, split in zip(self.index.words, self.splits)))
+        # Returns a list of the (unique) suffixes defined by the individual
+
+    def n(self):
+        return sum(len(stem) for stem in self.stems()) + sum(len(suffix) for suffix in self.suffixes())
+        # Returns the total character-count across the sets of unique stems and suffixes defined by the individual
+
+    def nmax(self):
+        return self.index.nmax
+        # Returns the total character-count of the original corpus
+
+    def fitnessabsolute(self):
+        return self.index.nmax - self.n()
+        # Returns a fitness value for the individual, defined as [nmax - n]
+        # As the sizes of the unique stem/suffix sets decrease, this value increases
+
+    def fitnessproportion(self):
+        return 1 - (self.n() / self.index.nmax)
+        # Returns a fitness value for the individual, defined as [1 - (n / nmax)]
+        # As the proportion between the counts of unique stem/suffix characters and corpus characters decreases, this value approaches one
+        # This is not used in any calculations but is provided for anyone who might want to use it
+
+    def __str__(self):
+        string = ""
+
+        first = True
+
+        for word, split in zip(self.index.words, self.splits):
+            if first:
+                first = False
+            else:
+                string += "\n"
+
+            string += word[:abs(split)] + "|" + word[abs(split):] + " [" + str(abs(split)) + "]"
+
+            if split < 0:
+                string += " {Locked}"
+
+        return string
+        # Returns a list of all the words in the corpus with their assigned split positions marked and their locks identified
+
+    def __repr__(self):
+        return repr(self.corpus)
+
+# ---------------------------------------------------------------------------------------------------- #
+
+class SplitTable:
+    def __init__(self, words, encoded=None, corpusindex=None):
+        if corpusindex is None or corpusindex.words != tuple(words):
+            corpusindex = CorpusIndex(words, encoded)
+        # The stem and suffix IDs are taken from the corpus' index (which is built here unless one was supplied for the same words)
+
+        self.corpusindex = corpusindex
+
+        self.words = words
+        self.lengths = corpusindex.lengths
+        self.nmax = corpusindex.nmax
+
+        self.offsets = corpusindex.offsets
+        # Every word is given one slot per split position (including the positions before and after its ends)
+        # The slot of split [k] in word [j] is found at [offsets[j] + k] in each of the flat arrays below
+
+        self.stems = corpusindex.stems
+        self.suffixes = corpusindex.suffixes
+        self.stemlengths = corpusindex.stemlengths
+        self.suffixlengths = corpusindex.suffixlengths
+        # The ID of the stem and suffix on either side of every slot, and the length of the substring behind every ID
+
+        self.alphabet = corpusindex.alphabet
+        self.codes = corpusindex.codes
+        # Record every character of the corpus (in order) as a position in the corpus' own alphabet
+        # An encoded corpus that has already been loaded (with the same words in the same order) can be supplied instead of encoding the words again
+
+    def flat(self, splits):
+        return self.offsets[:-1] + np.abs(splits)
+        # Converts a (rows × nwords) matrix of split positions into slot positions in the flat arrays
+        # Negative splits (indicating locked boundaries) are converted to positive values
+
+    def n(self, splits):
+        flat = self.flat(np.atleast_2d(splits))
+
+        return uniquelength(self.stems[flat], self.stemlengths) + uniquelength(self.suffixes[flat], self.suffixlengths)
+        # Returns the total character-count across the sets of unique stems and suffixes defined by each row of split positions
+
+    def fitnesses(self, splits):
+        return self.nmax - self.n(splits)
+        # Returns the absolute fitness of each row of split positions, defined as [nmax - n]
+
+    def estimate(self, splits, columns):
+        splits = np.atleast_2d(splits)[:, columns]
+        flat = self.offsets[columns] + np.abs(splits)
+
+        n = uniquelength(self.stems[flat], self.stemlengths) + uniquelength(self.suffixes[flat], self.suffixlengths)
+
+        return self.nmax * (1 - n / self.lengths[columns].sum())
+        # Estimates the absolute fitness of each row of split positions from a sample of its words (identified by their positions in the corpus)
+        # The proportional fitness of the sample, [1 - (n / nmax)], is scaled up to the size of the whole corpus
+
+def uniquelength(ids, lengths):
+    ids = np.sort(ids, axis=1)
+
+    first = np.ones(ids.shape, dtype=bool)
+    first[:, 1:] = ids[:, 1:] != ids[:, :-1]
+    # Once each row is sorted, repeated IDs sit next to each other and only the first of them is counted
+
+    return (lengths[ids] * first).sum(axis=1)
+    # Sums the lengths of the unique IDs found in each row of an ID matrix
+    # The cost of this depends only on the size of the matrix (and not on the number of possible IDs), so it's just as suited to samples of words
+
+class EntropyTable:
+    def __init__(self, words, values=None, table=None):
+        self.words = words
+        self.lengths = np.array([len(word) for word in words], dtype=np.int64)
+
+        self.offsets = np.zeros(len(words) + 1, dtype=np.int64)
+        self.offsets[1:] = np.cumsum(self.lengths + 1)
+        # Words are laid out in the same way as they are in a split table, with one slot per split position
+
+        if values is None:
+            if table is None:
+                table = SplitTable(words)
+
+            stementropies, suffixentropies = table.corpusindex.entropies()
+            # The next-letter entropy of every possible stem and the last-letter entropy of every possible suffix are taken from the corpus' index
+
+            values = stementropies[table.stems] + suffixentropies[table.suffixes]
+            # For every split position, sum the entropies of the stem and the suffix on either side of it
+
+        self.values = values
+        # Stores the collective entropy of every (word, split position) pairing across a corpus
+
+    def collective(self, columns, indexes):
+        indexes = np.clip(indexes, 0, self.lengths[columns])
+
+        return self.values[self.offsets[columns] + indexes]
+        # Returns the collective entropies around the given split positions of the given words (identified by their positions in the corpus)
+        # Positions beyond either end of a word are treated as the word's ends
+
+    def save(self, path):
+        with open(path, "wb") as file:
+            np.savez(file, words=np.array(self.words, dtype=str), values=self.values)
+        # Writes the table to disk so that it can be reused by later runs over the same corpus
+        # The table is written through an open file, as np.savez() would otherwise add ".npz" to paths without it (and entropytable() would never find the table again)
+
+    @classmethod
+    def load(EntropyTable, path, words):
+        with np.load(path) as data:
+            if data["words"].tolist() != list(words):
+                print("The entropy table at '" + str(path) + "' was built from a different corpus")
+                return None
+
+            return EntropyTable(list(words), data["values"])
+        # Reads a table from disk, provided that it was built from the same list of words
+
+def entropytable(corpus, path=None, table=None, stats=None):
+    corpus = CorpusLoader.words(corpus)
+
+    words = [word.lower() for word in corpus]
+
+    if path is not None and os.path.exists(path):
+        entropies = EntropyTable.load(path, words)
+
+        if entropies is not None:
+            if stats is not None:
+                stats.count("entropytable.hits")
+
+            return entropies
+
+    if stats is not None:
+        stats.count("entropytable.misses")
+
+    entropies = EntropyTable(words, None, table)
+
+    if path is not None:
+        entropies.save(path)
+
+    return entropies
+    # Returns the entropy table for a corpus, reusing the one stored at the given path if it exists and saving a new one there otherwise
+    # An existing split table for the corpus can be supplied to avoid rebuilding its stem/suffix IDs
+    # If an Instrumentation.Stats object is supplied, whether the stored table could be reused is counted in it
+
+def tournamentselection(fitnesses, tournamentsize, count, rng):
+    tournamentsize = min(tournamentsize, len(fitnesses))
+
+    keys = rng.random((count, len(fitnesses)))
+    entrants = keys <= np.partition(keys, tournamentsize - 1, axis=1)[:, tournamentsize - 1, None]
+    # Draw [count] tournaments at once, each one entered by [tournamentsize] distinct individuals
+    # Individuals enter a tournament in the order of their random keys, so the entrants of each tournament are the individuals with its smallest keys
+
+    scores = np.where(entrants, fitnesses, -np.inf)
+    contenders = entrants & (scores == scores.max(axis=1)[:, None])
+
+    return np.argmin(np.where(contenders, keys, np.inf), axis=1)
+    # Returns the index of the winner of each tournament, which is its fittest entrant
+    # Ties go to whichever of the tied entrants was drawn first
+
+def rouletteselection(fitnesses, count, rng):
+    total = fitnesses.sum()
+
+    if total > 0:
+        distribution = fitnesses / total
+    else:
+        distribution = np.full(len(fitnesses), 1 / len(fitnesses))
+    # Each individual's reproduction probability is defined as the proportion of its fitness to the total fitness count
+    # If no individual has any fitness, every individual is equally likely to be picked
+
+    return rng.choice(len(fitnesses), count, p=distribution)
+    # Returns the indexes of [count] individuals picked in proportion to their fitnesses (with replacement)
+
+class Population:
+    def __init__(self, corpus, popcount, entropies=None, rng=None, corpusindex=None):
+        encoded = None
+
+        if type(corpus) is CorpusLoader.EncodedCorpus and corpus.lowercase:
+            encoded = corpus
+        # Encoded corpora that were normalised to lowercase when loaded already hold the population's words in order (and only once each)
+
+        corpus = CorpusLoader.words(corpus)
+
+        self.index = WordIndex([word.lower() for word in corpus])
+        self.words = list(self.index.words)
+        self.table = SplitTable(self.words, encoded, corpusindex)
+        self.lengths = self.table.lengths
+        self.nmax = self.table.nmax
+
+        self.rng = np.random.default_rng(rng)
+
+        self.splits = self.rng.integers(1, self.lengths + 1, size=(popcount, len(self.words)))
+        self.locks = np.zeros((popcount, len(self.words)), dtype=bool)
+
+        self.entropies = entropies
+
+        self.order = None
+        self.position = 0
+        # Stores the whole population as a (popcount × nwords) matrix of split positions alongside a matching lock mask
+        # Every row is an individual and every column is a word of the corpus (in its original order)
+        # Collective entropies are looked up from an entropy table (which only needs to be supplied if entropic locking is used)
+        # Every random choice made for the population is drawn from its own random generator (which can be supplied as a seed or an existing generator)
+        # An index of the same corpus (see Indexing.CorpusIndex) can be supplied so that its stem and suffix IDs aren't worked out again
+
+    def __len__(self):
+        return len(self.splits)
+
+    def individual(self, i):
+        splits = array(self.index.typecode)
+        splits.frombytes(self.signed(i).tobytes())
+
+        return Individual(self.index, splits)
+        # Converts a row of the population into a standalone individual
+        # Every individual converted from the population shares the population's word index
+
+    def signed(self, rows):
+        if self.index.typecode == "b":
+            dtype = np.int8
+        else:
+            dtype = np.int16
+
+        return np.where(self.locks[rows], -self.splits[rows], self.splits[rows]).astype(dtype)
+        # Returns the given rows of the population as a compact array of split positions
+        # Locked boundaries are expressed as negative splits, as is done by the individual class
+
+    def insert(self, rows, signed):
+        self.splits[rows] = np.abs(signed)
+        self.locks[rows] = signed < 0
+        # Overwrites the given rows of the population with a compact array of split positions (as returned by signed())
+
+    def fitnesses(self):
+        return self.table.fitnesses(self.splits)
+        # Returns the absolute fitness of every individual in the population
+        # This is equivalent to calling fitnessabsolute() on each individual, but the whole population is evaluated at once
+
+    def select(self, fitnesses, tournamentsize):
+        if tournamentsize > 0:
+            parents = tournamentselection(fitnesses, tournamentsize, 2 * len(self.splits), self.rng)
+        else:
+            parents = rouletteselection(fitnesses, 2 * len(self.splits), self.rng)
+
+        return parents[0::2], parents[1::2]
+        # Returns the indexes of both parents of every child in the next generation
+        # Individuals may be picked twice if their fitnesses are high
+
+    def breed(self, a, b):
+        mask = self.rng.random(self.splits.shape) < 0.5
+
+        self.splits = np.where(mask, self.splits[a], self.splits[b])
+        self.locks = np.where(mask, self.locks[a], self.locks[b])
+        # Replaces the population with the children of the supplied parent pairings
+        # Each child takes every word's split position (and its lock) from one of its two parents at random
+
+    def diversity(self):
+        width = int(self.lengths.max()) + 1
+
+        counts = np.bincount((np.arange(len(self.words)) * width + self.splits).ravel(), minlength=len(self.words) * width)
+        # Count how many individuals assign each split position to each word
+
+        return 1 - float(counts.reshape(len(self.words), width).max(axis=1).mean()) / len(self.splits)
+        # Returns the average proportion of individuals that disagree with the most common split position of each word
+        # This is 0 when every individual is identical and approaches 1 as the population's split positions vary more
+
+    def seed(self, rows, boundaries):
+        boundaries = np.asarray(boundaries, dtype=np.int64)
+        usable = (boundaries >= 1) & (boundaries <= self.lengths)
+
+        self.splits[np.ix_(rows, np.nonzero(usable)[0])] = boundaries[usable]
+        # Overwrites the given rows' split positions with a supplied set of boundaries (one per word)
+        # Words without a usable boundary (such as those given 0) keep their existing split positions
+
+    def sample(self, size):
+        if self.order is None or self.position + size > len(self.order):
+            self.order = self.rng.permutation(len(self.words))
+            self.position = 0
+
+        columns = self.order[self.position:self.position + size]
+
+        self.position += size
+
+        return np.sort(columns)
+        # Returns the positions of the next [size] words in a random rotation through the corpus
+        # Every word is sampled once before any word is sampled again
+
+    def climb(self, rows, passes):
+        stems = self.table.stems.tolist()
+        suffixes = self.table.suffixes.tolist()
+        stemlengths = self.table.stemlengths.tolist()
+        suffixlengths = self.table.suffixlengths.tolist()
+        offsets = self.table.offsets.tolist()
+        lengths = self.lengths.tolist()
+
+        gains = []
+
+        for r in rows:
+            splits = self.splits[r].tolist()
+            locks = self.locks[r].tolist()
+
+            flat = self.table.flat(self.splits[r])
+
+            stemcounts = np.bincount(self.table.stems[flat], minlength=len(stemlengths)).tolist()
+            suffixcounts = np.bincount(self.table.suffixes[flat], minlength=len(suffixlengths)).tolist()
+            # Count how many words of the individual share each stem and each suffix
+
+            gain = 0
+
+            for p in range(passes):
+                improved = False
+
+                for j in range(len(splits)):
+                    if locks[j]:
+                        continue
+
+                    a = offsets[j] + splits[j]
+
+                    for shift in (-1, 1):
+                        if splits[j] + shift < 1 or splits[j] + shift > lengths[j]:
+                            continue
+
+                        b = a + shift
+
+                        delta = 0
+
+                        if stemcounts[stems[a]] == 1:
+                            delta += stemlengths[stems[a]]
+                        if stemcounts[stems[b]] == 0:
+                            delta -= stemlengths[stems[b]]
+                        if suffixcounts[suffixes[a]] == 1:
+                            delta += suffixlengths[suffixes[a]]
+                        if suffixcounts[suffixes[b]] == 0:
+                            delta -= suffixlengths[suffixes[b]]
+                        # The fitness changes by the lengths of any stems/suffixes that would no longer be used, less the lengths of any that would be newly introduced
+
+                        if delta > 0:
+                            stemcounts[stems[a]] -= 1
+                            stemcounts[stems[b]] += 1
+                            suffixcounts[suffixes[a]] -= 1
+                            suffixcounts[suffixes[b]] += 1
+
+                            splits[j] += shift
+                            gain += delta
+
+                            improved = True
+
+                            break
+                        # Only moves that improve the individual's fitness are accepted
+
+                if not improved:
+                    break
+
+            self.splits[r] = splits
+
+            gains.append(gain)
+
+        return np.array(gains, dtype=np.int64)
+        # Hill-climbs the given rows of the population by shifting unlocked boundaries one position at a time
+        # Each candidate shift is judged by its change in fitness alone (using the reference counts of stems and suffixes), so individuals are never fully re-evaluated
+        # Up to [passes] passes are made over each row's words (stopping early if a pass makes no improvements)
+        # Returns the fitness gained by each row
+
+    def entropy(self, columns, indexes):
+        return self.entropies.collective(columns, indexes)
+        # Returns the collective entropies around the given split positions of the given words
+
+    def mutate(self, mutprob, entropythreshold, seek):
+        locked = np.zeros(self.splits.shape, dtype=bool)
+        shifted = np.zeros(self.splits.shape, dtype=np.int64)
+
+        if entropythreshold > 0:
+            rows, columns = np.nonzero(~self.locks)
+            k = self.splits[rows, columns]
+
+            high = self.entropy(columns, k) > entropythreshold
+            rows, columns, k = rows[high], columns[high], k[high]
+            # If entropic locking is enabled, find every unlocked boundary whose collective entropy is high enough to lock it
+
+            if seek:
+                left = self.entropy(columns, k - 1) > entropythreshold
+                right = self.entropy(columns, k + 1) > entropythreshold
+
+                choice = np.floor(self.rng.random(len(k)) * (1 + left + right)).astype(np.int64)
+                shift = np.where(choice == 0, 0, np.where((choice == 1) & left, -1, 1))
+
+                k = np.clip(k + shift, 1, self.lengths[columns])
+                shifted[rows, columns] = shift
+                # The collective entropies of the left- and right-hand splits are also measured and a definitive split is randomly chosen from any of the three that indicate sufficient variation
+
+            self.splits[rows, columns] = k
+            self.locks[rows, columns] = True
+            locked[rows, columns] = True
+
+        # Any boundary that is still unlocked is randomly shifted one position to the left or right (within the bounds of its word) with the mutation probability
+        draw = (self.rng.random(self.splits.shape) < mutprob) & ~self.locks
+        shift = np.where(self.rng.random(self.splits.shape) < 0.5, -1, 1)
+
+        self.splits = np.where(draw, np.clip(self.splits + shift, 1, self.lengths), self.splits)
+        shifted = np.where(draw, shift, shifted)
+
+        return locked, shifted
+        # Mutates every child of the population at once
+        # Returns which boundaries were newly locked and the directions that boundaries were shifted in
+
+# ---------------------------------------------------------------------------------------------------- #
+
+# Derives a single boundary for each word in a corpus from Harris' method, for use in seeding genetic populations
+# ESM: If this is more than 0, each word's final split is taken from Harris() with eager suffix matching (using this minimum suffix length)
+    # Otherwise, each word's final branch in the Harris trie is used
+# ROOT: A Harris trie (or an Indexing.CorpusIndex) already built from the corpus (if there is one)
+def harrisboundaries(corpus, ESM, root=None, reporter=None, stats=None):
+    if root is None:
+        root = trie(corpus, stats)
+
+    if ESM > 0:
+        splits = Harris(corpus, ESM, True, root, reporter, stats)
+
+        return [splits[word][-1] if len(splits[word]) > 0 else 0 for word in corpus]
+
+    return [root.finalbranch(word) or 0 for word in corpus]
+    # Words for which no boundary is found are given 0
+
+def savecheckpoint(path, population, g, best, bestfitness, improvement, elapsed, scale=1.0):
+    if best is None:
+        best = (population.splits[0], np.zeros(len(population.words), dtype=bool))
+
+    if type(population.entropies) is EntropyTable:
+        entropies = population.entropies.values
+    else:
+        entropies = np.zeros(0)
+
+    if population.order is not None:
+        order = population.order
+    else:
+        order = np.zeros(0, dtype=np.int64)
+
+    with open(path + ".tmp", "wb") as file:
+        np.savez(file, words=np.array(population.words, dtype=str), splits=population.splits, locks=population.locks, entropies=entropies, order=order, bestsplits=best[0], bestlocks=best[1], state=np.array(json.dumps({"generation": g, "bestfitness": bestfitness, "improvement": improvement, "elapsed": elapsed, "scale": scale, "position": population.position, "bestlist": bestlist, "statslist": statslist, "rng": population.rng.bit_generator.state})))
+
+    os.replace(path + ".tmp", path)
+    # Writes the state of a genetic process at the start of generation [g] to disk
+    # The checkpoint is written to a temporary file first, so an interruption while writing never damages the previous checkpoint
+
+def loadcheckpoint(path, population):
+    with np.load(path) as data:
+        if data["words"].tolist() != population.words:
+            print("The checkpoint at '" + path + "' was saved from a different corpus")
+            return None
+
+        state = json.loads(str(data["state"]))
+
+        population.splits = data["splits"]
+        population.locks = data["locks"]
+        population.rng.bit_generator.state = state["rng"]
+
+        if len(data["entropies"]) > 0:
+            population.entropies = EntropyTable(population.words, data["entropies"])
+
+        if len(data["order"]) > 0:
+            population.order = data["order"]
+            population.position = state["position"]
+
+        bestlist[:] = state["bestlist"]
+        statslist[:] = state["statslist"]
+
+        if state["bestfitness"] > 0:
+            best = (data["bestsplits"], data["bestlocks"])
+        else:
+            best = None
+
+        return state["generation"], best, state["bestfitness"], state["improvement"], state["elapsed"], state.get("scale", 1.0)
+    # Restores the population, random generator and records of a genetic process from a checkpoint
+    # Returns the generation to resume from alongside the healthiest observed individual, its fitness, the generation it was found in, the time elapsed so far and the calibration of sampled fitness estimates
+    # Checkpoints saved before the calibration was recorded resume with it reset
+
+# This method carries out Kazakov's naive genetic process
+# CORPUS: The list of words to be operated on
+# POPCOUNT: The maximum number of individuals stored at any one time
+# GENCOUNT: The number of generations to be evaluated
+# MUTPROB: The probability of a word's split position being randomly shifted if entropic locking is disabled
+# FITNESSTHRESHOLD: Once an individual with a higher fitness rating than this has been found, it will be returned straight away
+    # Feature disabled when set to 0
+# ENTROPYTHRESHOLD: Once a boundary's collective entropy is judged to be higher than this, it or any sufficiently-varying neighbours will be set and locked in place
+    # Entropic locking is disabled when set to 0
+# ENTROPIES: An entropy table for the corpus (or the path of a stored one) to use for entropic locking
+    # If it isn't supplied, a new table will be built whenever entropic locking is enabled
+# LOCALSEARCH: The number of the healthiest individuals to improve by hill-climbing in each generation
+    # Feature disabled when set to 0
+# LOCALPASSES: The maximum number of passes that hill-climbing makes over each of those individuals' words
+# PLATEAU: Once this many generations have passed without the fitness record improving, the healthiest observed individual will be returned
+    # Feature disabled when set to 0
+# DIVERSITYFLOOR: Once the population's diversity (as measured by Population.diversity()) falls below this, the healthiest observed individual will be returned
+    # Feature disabled when set to 0
+# TIMEBUDGET: Once this many seconds have passed, the healthiest observed individual will be returned
+    # Feature disabled when set to 0
+# HARRISSEED: The proportion of the initial population to seed with boundaries derived from Harris' method (the rest are random)
+    # Feature disabled when set to 0
+# HARRISESM: The minimum suffix length used for eager suffix matching when deriving those boundaries (see harrisboundaries())
+# RNG: A seed (or an existing NumPy random generator) from which every random choice of the process is drawn
+    # Runs with the same seed and arguments are identical
+# CHECKPOINT: The path of a file to save the process' state to every [CHECKPOINTINTERVAL] generations
+    # If the file already exists (and was saved from the same corpus), the process resumes from it
+    # Feature disabled when set to None
+# SAMPLESIZE: The number of words (rotating through the corpus) from which fitnesses are estimated in each generation
+    # Fitnesses are always evaluated exactly when set to 0
+# EXACTINTERVAL: When fitnesses are being estimated, they are still evaluated exactly every [EXACTINTERVAL] generations (and in the final generation)
+    # The fitness record and the healthiest observed individual are only updated in those generations
+# REPORTER: The Reporting.Reporter to write progress and results to
+    # Reporting.default is used when set to None
+# STATS: An Instrumentation.Stats object to record fitness evaluations, entropy lookups and the time spent in each phase of each generation in
+    # Feature disabled when set to None
+# CORPUSINDEX: An Indexing.CorpusIndex of the corpus, whose stem and suffix IDs, entropies and successor varieties are reused instead of being worked out again
+    # One is built from the corpus when set to None (or when it was built from different words)
+def genetic(corpus, popcount, gencount, mutprob, tournamentsize, fitnessthreshold, entropythreshold, seek, entropies=None, localsearch=0, localpasses=1, plateau=0, diversityfloor=0, timebudget=0, harrisseed=0, harrisESM=0, rng=None, checkpoint=None, checkpointinterval=10, samplesize=0, exactinterval=10, reporter=None, stats=None, corpusindex=None):
+    if popcount < 1 or gencount < 1 or mutprob < 0 or mutprob > 1 or tournamentsize < 0 or fitnessthreshold < 0 or entropythreshold < 0 or localsearch < 0 or localsearch > popcount or localpasses < 1 or plateau < 0 or diversityfloor < 0 or timebudget < 0 or harrisseed < 0 or harrisseed > 1 or harrisESM < 0 or checkpointinterval < 1 or samplesize < 0 or exactinterval < 1:
+        print("One or more of the provided arguments are invalid")
+        return None
+
+    if reporter is None:
+        reporter = Reporting.default
+
+    detail = reporter.enabled(Reporting.DETAIL)
+
+    start = time.perf_counter()
+    mark = start
+
+    bestlist.clear()
+    statslist.clear()
+    # Records are only kept for the current run
+
+    population = Population(corpus, popcount, entropies, rng, corpusindex)
+    # Use the corpus to generate and store a set of random individuals
+
+    resumed = None
+
+    if checkpoint is not None and os.path.exists(checkpoint):
+        resumed = loadcheckpoint(checkpoint, population)
+
+    if entropythreshold > 0 and (population.entropies is None or type(population.entropies) is str):
+        population.entropies = entropytable(population.words, population.entropies, population.table, stats)
+        # Look up (or build) the collective entropies of every possible boundary before evolution begins
+
+    if resumed is None:
+        seeded = int(round(harrisseed * popcount))
+
+        if seeded > 0:
+            population.seed(np.arange(seeded), harrisboundaries(population.words, harrisESM, population.table.corpusindex, reporter, stats))
+            # Seed part of the population with the boundaries found by Harris' method, which are derived once and shared by every seeded individual
+
+        reporter.log("Spawned " + str(popcount) + " initial individuals (" + str(seeded) + " seeded by Harris' method)")
+
+        resumed = (0, None, 0, 0, 0, 1.0)
+    else:
+        reporter.log("Resumed from generation " + str(resumed[0] + 1) + " of the checkpoint at '" + checkpoint + "'")
+
+    first, best, bestfitness, improvement, elapsed, scale = resumed
+
+    if first > gencount:
+        reporter.log("The checkpoint at '" + checkpoint + "' is already past generation " + str(gencount) + ", so its healthiest individual is returned as it is")
+
+    exact = True
+    # Only generations whose fitnesses were estimated need a final exact evaluation (and a checkpoint taken beyond [GENCOUNT] evaluates no generations at all)
+
+    start -= elapsed
+    # Time spent before the checkpoint counts towards the time budget
+
+    if samplesize >= len(population.words):
+        samplesize = 0
+    # Samples as large as the corpus are no cheaper than exact evaluations
+
+    if stats is not None:
+        mark = stats.lap("setup", mark)
+
+    for g in range(first, gencount + 1):
+        if checkpoint is not None and g > first and g % checkpointinterval == 0:
+            savecheckpoint(checkpoint, population, g, best, bestfitness, improvement, time.perf_counter() - start, scale)
+            # Periodically save the state of the process so that it can be resumed if it's interrupted
+
+            if stats is not None:
+                mark = stats.lap("checkpoint", mark)
+
+        if (g < gencount):
+            reporter.log("\n*" + ("=" * 50) + "*\n\nGENERATION " + str(g + 1) + " | POPULATION EVALUATION\n\nFitnesses", Reporting.DETAIL)
+        else:
+            reporter.log("\n*" + ("=" * 50) + "*\n\nFINAL GENERATION | POPULATION EVALUATION\n\nFitnesses", Reporting.DETAIL)
+
+        exact = samplesize == 0 or g % exactinterval == 0 or g == gencount
+        error = None
+
+        if samplesize > 0:
+            columns = population.sample(samplesize)
+            estimates = population.table.estimate(population.splits, columns) * scale
+            # Estimate the fitness of each individual from a sample of the corpus' words
+
+            if stats is not None:
+                stats.count("estimate.evaluations", popcount)
+                mark = stats.lap("estimate", mark)
+
+        if exact:
+            distribution = population.fitnesses()
+
+            if stats is not None:
+                stats.count("fitness.evaluations", popcount)
+                mark = stats.lap("fitness", mark)
+
+            if samplesize > 0:
+                error = float(np.mean(np.abs(estimates - distribution) / np.maximum(distribution, 1)))
+                # Measure the mean relative error of the estimates against the exact fitnesses
+
+                scale *= distribution.sum() / max(estimates.sum(), 1)
+                # Samples share fewer stems and suffixes than the whole corpus does, so later estimates are calibrated against these exact fitnesses
+        else:
+            distribution = estimates
+
+        if localsearch > 0:
+            elite = np.argsort(-distribution, kind="stable")[:localsearch]
+
+            gains = population.climb(elite, localpasses)
+
+            if exact:
+                distribution[elite] += gains
+            else:
+                distribution[elite] = population.table.estimate(population.splits[elite], columns) * scale
+            # Improve the healthiest individuals by hill-climbing before they're evaluated for reproduction
+
+            if stats is not None:
+                stats.count("localsearch.climbs", localsearch)
+                stats.count("localsearch.gain", int(gains.sum()))
+                mark = stats.lap("localsearch", mark)
+
+        if detail:
+            for i in range(len(distribution)):
+                reporter.log("Ind. " + str(i + 1) + " ← " + str(distribution[i]), Reporting.DETAIL)
+
+            if not exact:
+                reporter.log("\nFitnesses estimated from " + str(samplesize) + " word(s) | Last exact evaluation: Generation " + str(g - g % exactinterval + 1), Reporting.DETAIL)
+            elif error is not None:
+                reporter.log("\nMean estimator error: " + str(error), Reporting.DETAIL)
+
+            if localsearch > 0:
+                reporter.log("\nLocal Search | +" + str(int(gains.sum())) + " across " + str(localsearch) + " individual(s)", Reporting.DETAIL)
+
+        i = int(np.argmax(distribution))
+
+        if exact and distribution[i] > bestfitness:
+            best = (population.splits[i].copy(), population.locks[i].copy())
+            bestfitness = int(distribution[i])
+
+            improvement = g
+
+        bestlist.append(bestfitness)
+
+        diversity = population.diversity()
+        elapsed = time.perf_counter() - start
+
+        statslist.append({"generation": g + 1, "best": bestfitness, "max": float(distribution.max()), "mean": float(distribution.mean()), "min": float(distribution.min()), "diversity": diversity, "time": elapsed, "exact": exact, "error": error})
+        # Record the state of the population in each generation
+
+        if stats is not None:
+            stats.count("generations")
+            mark = stats.lap("records", mark)
+
+        if g == gencount or (fitnessthreshold > 0 and bestfitness > fitnessthreshold):
+            break
+
+        if plateau > 0 and exact and g - improvement >= plateau:
+            reporter.log("\nConverged | No improvement in " + str(plateau) + " generations")
+            break
+
+        if diversityfloor > 0 and diversity < diversityfloor:
+            reporter.log("\nConverged | Diversity " + str(diversity) + " is below " + str(diversityfloor))
+            break
+
+        if timebudget > 0 and elapsed >= timebudget:
+            reporter.log("\nStopped | Time budget of " + str(timebudget) + " second(s) reached")
+            break
+        # Stop early once the population stops making progress (or runs out of time)
+
+        if detail:
+            reporter.log("\nCurrent Fitness Record: " + str(bestfitness) + " | Diversity: " + str(diversity), Reporting.DETAIL)
+
+            reporter.log("\nReproduction Probabilities", Reporting.DETAIL)
+
+            for i in range(len(distribution)):
+                reporter.log("Ind. " + str(i + 1) + " ← " + str(distribution[i] / distribution.sum()), Reporting.DETAIL)
+                # For each individual, display a reproduction probability value
+                # This is defined as the proportion of an individual's fitness to the total fitness count
+
+            reporter.log("\n*" + ("=" * 50) + "*\n\nGENERATION " + str(g + 1) + " | CHILD BIRTH AND MUTATION\n", Reporting.DETAIL)
+        else:
+            reporter.progress("generation(s) evolved", g + 1, gencount, "Current Fitness Record: " + str(bestfitness) + " | Diversity: " + str(diversity))
+
+        if stats is not None:
+            mark = stats.lap("records", mark)
+
+        a, b = population.select(distribution, tournamentsize)
+        # Select two "parent" individuals for every child, weighting choices based on their reproduction probabilities
+
+        if stats is not None:
+            mark = stats.lap("selection", mark)
+
+        if detail:
+            for i in range(popcount):
+                reporter.log("Child " + str(i + 1) + " ← (" + str(a[i] + 1) + " × " + str(b[i] + 1) + ")", Reporting.DETAIL)
+
+        population.breed(a, b)
+        # Create the next generation's children from their parents, randomly mixing their contents together
+
+        if stats is not None:
+            mark = stats.lap("breeding", mark)
+
+            if entropythreshold > 0:
+                unlocked = np.count_nonzero(~population.locks)
+
+        locked, shifted = population.mutate(mutprob, entropythreshold, seek)
+        # Consider mutating (or locking) every unlocked boundary of every child
+
+        if stats is not None:
+            if entropythreshold > 0:
+                stats.count("entropy.lookups", int(unlocked + (2 * locked.sum() if seek else 0)))
+                # Every unlocked boundary's entropy is looked up, as are those of both neighbours of each boundary that's locked (when seeking)
+
+            mark = stats.lap("mutation", mark)
+
+        if detail:
+            reporter.log("\nMutation finished | " + str(int(locked.sum())) + " LOCK | " + str(int(np.count_nonzero(shifted < 0))) + " L SHIFT | " + str(int(np.count_nonzero(shifted > 0))) + " R SHIFT", Reporting.DETAIL)
+
+    if not exact:
+        distribution = population.fitnesses()
+
+        if stats is not None:
+            stats.count("fitness.evaluations", popcount)
+            mark = stats.lap("fitness", mark)
+
+        i = int(np.argmax(distribution))
+
+        if distribution[i] > bestfitness:
+            best = (population.splits[i].copy(), population.locks[i].copy())
+            bestfitness = int(distribution[i])
+
+            bestlist[-1] = bestfitness
+        # If the process stopped early in a generation whose fitnesses were only estimated, evaluate its final population exactly
+
+    if best is not None:
+        population.splits[0], population.locks[0] = best
+        best = population.individual(0)
+
+    reporter.log("\n*" + ("=" * 50) + "*\n\nBest Individual | Fitness = " + str(bestfitness))
+
+    if detail:
+        reporter.log(str(best) + "\n", Reporting.DETAIL)
+
+    return best
+    # Once the process has terminated following enough generations, return the healthiest observed individual
+
+# This method carries out the genetic process over several "islands" (populations evolving in parallel in separate processes)
+# Every [MIGRATIONINTERVAL] generations, each island sends copies of its healthiest individuals to the next island, where they replace the unhealthiest individuals
+# ISLANDCOUNT: The number of islands (and worker processes) to use
+    # All available cores are used when set to 0
+# MIGRATIONINTERVAL: The number of generations evaluated by each island between migrations
+# MIGRANTCOUNT: The number of individuals sent from each island to the next in each migration
+# All other parameters are equivalent to those of genetic() and apply to each island separately
+def islands(corpus, islandcount, migrationinterval, migrantcount, popcount, gencount, mutprob, tournamentsize, fitnessthreshold, entropythreshold, seek, entropies=None, rng=None, reporter=None):
+    if islandcount < 1:
+        islandcount = os.cpu_count() or 1
+
+    if migrationinterval < 1 or migrantcount < 0 or migrantcount > popcount or popcount < 1 or gencount < 1 or mutprob < 0 or mutprob > 1 or tournamentsize < 0 or fitnessthreshold < 0 or entropythreshold < 0:
+        print("One or more of the provided arguments are invalid")
+        return None
+
+    if type(corpus) is str:
+        corpus = corpus.lower().split()
+
+    if reporter is None:
+        reporter = Reporting.default
+
+    bestlist.clear()
+
+    rng = np.random.default_rng(rng)
+
+    population = Population(corpus, 1)
+
+    if entropythreshold > 0 and (entropies is None or type(entropies) is str):
+        entropies = entropytable(population.words, entropies, population.table)
+    # The entropy table is built (or loaded) once and handed to every island, so that islands never write the same stored table at once
+
+    connections = []
+    processes = []
+
+    for i in range(islandcount):
+        connection, remote = multiprocessing.Pipe()
+
+        process = multiprocessing.Process(target=island, args=(remote, corpus, popcount, migrantcount, mutprob, tournamentsize, entropythreshold, seek, entropies, int(rng.integers(2 ** 63))))
+        process.start()
+
+        connections.append(connection)
+        processes.append(process)
+    # Start one worker process per island, each of which generates its own population
+
+    reporter.log("Spawned " + str(islandcount) + " islands of " + str(popcount) + " individuals")
+
+    best = None
+    bestfitness = 0
+
+    messages = [connection.recv() for connection in connections]
+
+    g = 0
+
+    while True:
+        for i in range(islandcount):
+            if messages[i][2] is not None and messages[i][3] > bestfitness:
+                best = messages[i][2]
+                bestfitness = messages[i][3]
+
+        for j in range(len(messages[0][0])):
+            bestlist.append(max(message[0][j] for message in messages))
+        # Record the healthiest individual found across all the islands so far in each generation
+
+        if reporter.enabled(Reporting.DETAIL):
+            reporter.log("GENERATION " + str(g) + " | Island Records: " + str([message[3] for message in messages]) + " | Current Fitness Record: " + str(bestfitness), Reporting.DETAIL)
+        else:
+            reporter.progress("generation(s) evolved", g, gencount, "Current Fitness Record: " + str(bestfitness))
+
+        if g >= gencount or (fitnessthreshold > 0 and bestfitness > fitnessthreshold):
+            break
+
+        generations = min(migrationinterval, gencount - g)
+
+        for i in range(islandcount):
+            connections[i].send((generations, messages[i - 1][1] if migrantcount > 0 else None))
+        # Send each island the next number of generations to evaluate alongside the emigrants of the previous island (in a ring)
+
+        messages = [connection.recv() for connection in connections]
+
+        g += generations
+
+    for connection in connections:
+        connection.send(None)
+
+    for process in processes:
+        process.join()
+
+    if best is None:
+        print("No island found an individual with any fitness")
+        return None
+    # Islands that never found a healthy individual are skipped, so this only happens if none of them did
+
+    population.insert(0, best)
+    best = population.individual(0)
+
+    reporter.log("\n*" + ("=" * 50) + "*\n\nBest Individual | Fitness = " + str(bestfitness))
+
+    if reporter.enabled(Reporting.DETAIL):
+        reporter.log(str(best) + "\n", Reporting.DETAIL)
+
+    return best
+    # Once the process has terminated following enough generations, return the healthiest individual observed on any island
+
+def island(connection, corpus, popcount, migrantcount, mutprob, tournamentsize, entropythreshold, seek, entropies, seed):
+    population = Population(corpus, popcount, entropies, seed)
+    # Each island draws from its own random generator, seeded by the coordinating process
+    # The entropy table (if entropic locking is used) is the one built by the coordinating process
+
+    fitnesses = population.fitnesses()
+
+    best = None
+    bestfitness = -1
+
+    bestlist = []
+
+    generations = 0
+
+    while True:
+        i = int(np.argmax(fitnesses))
+
+        if fitnesses[i] > bestfitness:
+            best = population.signed(i)
+            bestfitness = int(fitnesses[i])
+
+        bestlist.append(bestfitness)
+
+        if generations == 0:
+            order = np.argsort(-fitnesses, kind="stable")
+
+            connection.send((bestlist, population.signed(order[:migrantcount]), best, bestfitness))
+            # Report the island's records for every generation since the last migration alongside copies of its healthiest individuals
+
+            message = connection.recv()
+
+            if message is None:
+                break
+
+            generations, migrants = message
+
+            if migrants is not None and len(migrants) > 0:
+                rows = order[len(order) - len(migrants):]
+
+                population.insert(rows, migrants)
+                fitnesses[rows] = population.table.fitnesses(population.splits[rows])
+                # Replace the island's unhealthiest individuals with the immigrants
+
+            bestlist = []
+
+        a, b = population.select(fitnesses, tournamentsize)
+
+        population.breed(a, b)
+        population.mutate(mutprob, entropythreshold, seek)
+
+        fitnesses = population.fitnesses()
+
+        generations -= 1
+        # Evolve the island's population by one generation
+
+    connection.close()
+    # Each island evolves its own population, pausing to exchange migrants with the coordinating process between sets of generations
+
+def stementropy(corpus, stem):
+    if len(stem) == 0:
+        return 0
+
+    corpus = CorpusLoader.words(corpus)
+
+    stem = stem.lower()
+
+    e = float(0)
+
+    successors = Counter(word.lower()[len(stem)] for word in corpus if len(word) > len(stem) and word.lower().startswith(stem))
+    total = sum(successors.values())
+
+    for count in successors.values():
+        e -= (count / total) * log2(count / total)
+
+    return e
+    # Calculates and returns the next-letter entropy of a given stem across the corpus
+
+def suffixentropy(corpus, suffix):
+    if len(suffix) == 0:
+        return 0
+
+    corpus = CorpusLoader.words(corpus)
+
+    suffix = suffix.lower()
+
+    e = float(0)
+
+    predecessors = Counter(word.lower()[-len(suffix) - 1] for word in corpus if len(word) > len(suffix) and word.lower().endswith(suffix))
+    total = sum(predecessors.values())
+
+    for count in predecessors.values():
+        e -= (count / total) * log2(count / total)
+
+    return e
+    # Calculates and returns the last-letter entropy of a given suffix across the corpus
+
+def collectiveentropy(corpus, word, index):
+    corpus = CorpusLoader.words(corpus)
+    
+    word = word.lower()
+
+    return stementropy(corpus, word[:index]) + suffixentropy(corpus, word[index:])
+    # Returns the sum of the next- and last-letter entropies around a boundary in a given word
+
+def stementropycacheaccess(corpus, stem, stementropycache):
+    if stem.lower() in stementropycache:
+        return stementropycache[stem.lower()]
+    else:
+        e = stementropy(corpus, stem)
+
+        stementropycache[stem.lower()] = e
+
+        return e
+
+def suffixentropycacheaccess(corpus, suffix, suffixentropycache):
+    if suffix.lower() in suffixentropycache:
+        return suffixentropycache[suffix.lower()]
+    else:
+        e = suffixentropy(corpus, suffix)
+
+        suffixentropycache[suffix.lower()] = e
+
+        return e
+
+def collectiveentropycacheaccess(corpus, word, index, stemcache, suffixcache):
+    return stementropycacheaccess(corpus, word[:index], stemcache) + suffixentropycacheaccess(corpus, word[index:], suffixcache)
+
+# ---------------------------------------------------------------------------------------------------- #
+
+def test(filename, outname):
+    print("Loading words...")
+
+    corpus = CorpusLoader.load("C:\\Users\\Joseph\\Desktop\\" + filename + ".txt").words
+
+    timeA = time.process_time()
+
+    best = genetic(corpus, 32, 100, 0.01, 8, 0, 0, True)
+
+    timeB = time.process_time()
+    timeB = timeB - timeA
+
+    fitness = best.fitnessabsolute()
+
+    with open("C:\\Users\\Joseph\\Desktop\\" + outname + ".txt", "w", encoding="utf") as file:
+        for word in corpus:
+            file.write(word + " " + str(best.boundaryabsolute(word)) + "\n")
+
+        file.write("TIME: " + str(timeB) + "\n")
+        file.write("FITNESS: " + str(fitness) + "\n")
+
+        for i in range(len(bestlist)):
+            file.write("GEN " + str(i + 1) + " BEST: " + str(bestlist[i]) + "\n")
+
+        for stats in statslist:
+            file.write("GEN " + str(stats["generation"]) + " STATS: MEAN " + str(stats["mean"]) + " | MIN " + str(stats["min"]) + " | DIVERSITY " + str(stats["diversity"]) + " | TIME " + str(stats["time"]) + "\n")
+
+        file.close()
+
+def test2(outname):
+    corpus = ["chanta", "chantai", "chantais", "chantait", "chanter"]
+    
+    timeA = time.process_time()
+
+    best = genetic(corpus, 8, 20, 1, 3, 275000, 4, True)
+
+    timeB = time.process_time()
+    timeB = timeB - timeA
+
+    fitness = best.fitnessabsolute()
+
+    with open("C:\\Users\\Joseph\\Desktop\\" + outname + ".txt", "w") as file:
+        for word in corpus:
+            file.write(word + " " + str(best.boundaryabsolute(word)) + "\n")
+
+        file.write("TIME: " + str(timeB) + "\n")
+        file.write("FITNESS: " + str(fitness) + "\n")
+
+        for i in range(len(bestlist)):
+            file.write("GEN " + str(i + 1) + " BEST: " + str(bestlist[i]) + "\n")
+            
+        file.close()
+
+def testislands(filename, outname):
+    print("Loading words...")
+
+    corpus = CorpusLoader.load("C:\\Users\\Joseph\\Desktop\\" + filename + ".txt").words
+
+    timeA = time.perf_counter()
+
+    best = islands(corpus, 0, 10, 2, 32, 100, 0.01, 8, 0, 0, True)
+
+    timeB = time.perf_counter()
+    timeB = timeB - timeA
+    # Islands evolve in other processes, so wall-clock time is recorded instead of processor time
+
+    fitness = best.fitnessabsolute()
+
+    with open("C:\\Users\\Joseph\\Desktop\\" + outname + ".txt", "w", encoding="utf") as file:
+        for word in corpus:
+            file.write(word + " " + str(best.boundaryabsolute(word)) + "\n")
+
+        file.write("TIME: " + str(timeB) + "\n")
+        file.write("FITNESS: " + str(fitness) + "\n")
+
+        for i in range(len(bestlist)):
+            file.write("GEN " + str(i + 1) + " BEST: " + str(bestlist[i]) + "\n")
+
+        file.close()
+
+if __name__ == "__main__":
+    if os.name == "nt":
+        ctypes.windll.kernel32.SetConsoleMode(ctypes.windll.kernel32.GetStdHandle(-11), 7)
+        # Enable the console's handling of escape sequences (which are used to overwrite progress lines)
+
+    test("ScotsGaelicCorpus5028", "ScotsGaelicCorpus5028Gen-32x100Prob001")
+    #test2("Ech")
+    #testislands("ScotsGaelicCorpus5028", "ScotsGaelicCorpus5028Islands-32x100Prob001")
+    # Island worker processes may re-import this module, so experiments are only run when it is executed directly (with "python -m morphologylearner.MDLImplementation")
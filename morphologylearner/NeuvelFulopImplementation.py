@@ -0,0 +1,712 @@
+import ctypes
+import os
+import time
+import math
+import random
+from . import CorpusLoader
+from . import Reporting
+
+class Relationship:
+    def __init__(self, related, A, B, orientation):
+        self.related = related
+        self.A = A
+        self.B = B
+        self.orientation = orientation
+        self.cached = None
+        # Establishes a "relationship", which is defined here as a pair of stems/suffixes and a set of substrings that append onto them to produce corpus words
+        # The "orientation" variable defines whether [A] and [B] are stems or suffixes
+        # ORIENTATION: TRUE | [A] and [B] are stems; [related] is comprised of word endings
+        # ORIENTATION: FALSE | [A] and [B] are suffixes: [related] is comprised of word beginnings
+
+    def binds(self):
+        return [self.A, self.B]
+        # Returns the two stems or suffixes commonly connected to the related substrings
+
+    def rule(self):
+        if self.cached is not None:
+            return self.cached
+        # The rule is only worked out the first time it's asked for (or all at once, by consensus())
+
+        string = ""
+        
+        if self.orientation:
+            for i in range(len(max(self.related, key=len))):
+                characters = [ending[i] for ending in self.related if len(ending) > i]
+
+                if len(characters) < len(self.related):
+                    string += "*"
+                elif characters.count(characters[0]) == len(characters):
+                    string += characters[0]
+                else:
+                    string += "#"
+
+            self.cached = (self.A + string, self.B + string)
+        else:
+            for i in range(len(max(self.related, key=len))):
+                characters = [stem[-(i + 1)] for stem in self.related  if len(stem) > i]
+
+                if len(characters) < len(self.related):
+                    string = "*" + string
+                elif characters.count(characters[0]) == len(characters):
+                    string = characters[0] + string
+                else:
+                    string = "#" + string
+
+            self.cached = (string + self.A, string + self.B)
+
+        return self.cached
+        # Returns the rule expressing the stem/suffix relationship that ties together all strings in the "related" set (in the format defined by Neuvel and Fulop)
+        # This is expressed as pair of "rule strings" containing characters, hash symbols and star symbols
+        # Characters in the relationship's two stems/suffixes and (separately) across related substrings will appear naturally in rule strings
+        # Hash (#) characters denote character positions that must be filled by strings formed from the relationship
+        # Conversely, star (*) characters denote positions that *may* (or may not) be filled
+        # EXAMPLE: "*##ceive <> *##ception" denotes that all strings in the relationship must either:
+            # - End with "ceive" and be 7 or 8 characters long
+            # - End with "ception" and be 9 or 10 characters long
+        # Rules of this format can be used to produce new strings from other strings
+
+    def __str__(self):
+        if len(self.A) == 0:
+            reprA = "#"
+        else:
+            reprA = self.A
+
+        if len(self.B) == 0:
+            reprB = "#"
+        else:
+            reprB = self.B
+        
+        if self.orientation:
+            return "Stem A: " + reprA + "-\nStem B: " + reprB + "-\nEndings: " + str(self.related)
+        else:
+            return "Ending A: -" + reprA + "\nEnding B: -" + reprB + "\nStems: " + str(self.related)
+        # Returns a string representation of the relationship, distinguishing the two stems/suffixes from the related substrings that they tie together
+
+def consensus(relationships):
+    import numpy as np
+    # NumPy is only needed (and loaded) once rules are worked out in bulk
+
+    pending = [rel for rel in relationships if rel.cached is None]
+
+    if len(pending) > 0:
+        strings = [string for rel in pending for string in rel.related]
+
+        sizes = np.array([len(rel.related) for rel in pending], dtype=np.int64)
+        starts = np.zeros(len(pending), dtype=np.int64)
+        starts[1:] = np.cumsum(sizes)[:-1]
+
+        lengths = np.fromiter(map(len, strings), dtype=np.int64, count=len(strings))
+        orientations = np.repeat(np.array([rel.orientation for rel in pending], dtype=bool), sizes)
+
+        codes = np.frombuffer("".join(strings).encode("utf-32-le"), dtype=np.uint32).astype(np.int64)
+
+        rows = np.repeat(np.arange(len(strings)), lengths)
+        positions = np.arange(len(codes)) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        columns = np.where(orientations[rows], positions, lengths[rows] - 1 - positions)
+        # Endings are aligned by their first characters and stems by their last characters, so column [i] holds the [i]th character from the start of each ending (or from the end of each stem)
+
+        width = max(int(lengths.max()), 1)
+
+        matrix = np.full((len(strings), width), -1, dtype=np.int64)
+        matrix[rows, columns] = codes
+        # Every related string is laid out as a row of character codes, padded with -1
+
+        present = matrix >= 0
+
+        counts = np.add.reduceat(present.astype(np.int64), starts, axis=0)
+        lowest = np.minimum.reduceat(np.where(present, matrix, np.iinfo(np.int64).max), starts, axis=0)
+        highest = np.maximum.reduceat(matrix, starts, axis=0)
+        # Count, for each relationship and column, the strings that reach the column and the range of characters found there
+
+        symbols = np.where(counts < sizes[:, None], ord("*"), np.where(lowest == highest, lowest, ord("#"))).astype("<u4")
+        # Columns that some strings don't reach are marked with stars, columns where every string has the same character keep it and any others are marked with hashes
+
+        widths = np.maximum.reduceat(lengths, starts)
+
+        text = symbols[np.arange(width) < widths[:, None]].tobytes().decode("utf-32-le")
+        # Each relationship's string runs as far as its longest related string, and they're all decoded together
+
+        offsets = [0] + np.cumsum(widths).tolist()
+
+        for i, rel in enumerate(pending):
+            string = text[offsets[i]:offsets[i + 1]]
+
+            if rel.orientation:
+                rel.cached = (rel.A + string, rel.B + string)
+            else:
+                string = string[::-1]
+
+                rel.cached = (string + rel.A, string + rel.B)
+
+    return [rel.rule() for rel in relationships]
+    # Works out the rules of every relationship in a list at once (as Relationship.rule() would one at a time) and returns them
+    # Relationships remember their rules, so those whose rules were already known are skipped
+
+# Identifies and returns the analogous relationships tying strings together from across a corpus
+# "Relationships" (as used in this context) are defined above
+# CORPUS: The set of words to be examined
+# MINMATCH: The number of words that each half of a (candidate) split must individually start off or end
+# MATCHREQ: Stems and endings are only catalogued once their combined occurrence counts exceed this number
+# RELREQ: A relationship (bound by two stems/suffixes) must tie at least this many substrings together to be returned
+# REPORTER: The Reporting.Reporter to write progress and results to
+    # Reporting.default is used when set to None
+# STATS: An Instrumentation.Stats object to record corpus scans, cache hits and misses, pair evaluations and the time spent in each phase in
+    # Feature disabled when set to None
+# CORPUSINDEX: An Indexing.CorpusIndex of the corpus, from which the words sharing each stem or ending are found
+    # One is built from the corpus when set to None (unless the corpus repeats a word, in which case every scan covers the whole corpus)
+def relationships(corpus, minmatch, cachereq, relreq, reporter=None, stats=None, corpusindex=None):
+    if corpusindex is None and type(corpus) is CorpusLoader.Corpus and corpus.lowercase:
+        corpusindex = corpus.indexed()
+
+    corpus = CorpusLoader.words(corpus)
+
+    if reporter is None:
+        reporter = Reporting.default
+
+    if minmatch < 1:
+        minmatch = 1
+
+    if cachereq < minmatch:
+        cachereq = minmatch
+
+    if relreq < 1:
+        relreq = 1
+    # Set default parameters for the method if they're too low
+
+    corpus = [word.lower() for word in corpus]
+    # Normalise all the words in the corpus
+
+    if corpusindex is None and len(set(corpus)) == len(corpus):
+        from .Indexing import CorpusIndex
+
+        corpusindex = CorpusIndex(corpus)
+
+    stems, endings = components(corpus, minmatch, cachereq, reporter, stats, corpusindex)
+
+    reporter.log(str(len(stems)) + " stems | " + str(len(endings)) + " endings\n")
+
+    relationships = stemrelationships(corpus, stems, endings, relreq, reporter, stats, corpusindex)
+
+    reporter.log(str(len(relationships)) + " stem relationships (with " + str(relreq) + " or more endings) found\n")
+
+    found = endingrelationships(corpus, stems, endings, relreq, reporter, stats, corpusindex)
+
+    reporter.log(str(len(found)) + " ending relationships (with " + str(relreq) + " or more stems) found\n")
+
+    relationships.extend(found)
+
+    # Return all of the relationships that link [relreq] words together
+    return relationships
+
+def components(corpus, minmatch, cachereq, reporter, stats=None, corpusindex=None):
+    if stats is not None:
+        start = time.perf_counter()
+
+    if corpusindex is not None and corpusindex.words != tuple(corpus):
+        corpusindex = None
+    # The index can only stand in for scans of the same words (in the same order)
+
+    stems = []
+    endings = []
+
+    stemcache = {""}
+    endingcache = {""}
+    # These caches are maintained to accelerate component searches
+    # If a stem or ending is in a cache, that means the component's occurrence count exceeds cachereq (which itself is equal to or more than minmatch)
+    # It does *not*, however, mean that the component is a stem or an ending
+    # A stem in the stemcache (or an ending in the endingcache) will only be taken as a stem (or an ending) if the occurrence count of the counterpart in a word containing it exceeds minmatch
+
+    c = 0
+
+    for word in corpus:        
+        splits = []
+        
+        for i in range(len(word) + 1):
+            # Go through each position of each word (including the positions before and after their ends) and calculate the respective occurrence quanities for the substrings before and after those positions (across the corpus)
+            # If a split's total multiplicity is high enough, the resultant stem and ending will be recorded
+            stemmultiplicity = 0
+            endmultiplicity = 0
+
+            stem = word[:i]
+            end = word[i:]
+
+            if stats is not None:
+                stats.count("components.scans")
+                stats.count("stemcache.hits" if stem in stemcache else "stemcache.misses")
+                stats.count("endingcache.hits" if end in endingcache else "endingcache.misses")
+                # Each position of each word begins a scan of the corpus, which skips counting the occurrences of any stem or ending that's already cached
+
+            if corpusindex is None:
+                keys = corpus
+            else:
+                stemcount = corpusindex.stemcounts[corpusindex.stemids[stem]] - 1
+                endcount = corpusindex.suffixcounts[corpusindex.suffixids[end]] - 1
+                # The multiplicity of a stem (or an ending) is the number of *other* words that start (or end) with it
+
+                if (stem not in stemcache and stemcount < min(minmatch, cachereq) and (end in endingcache or endcount < cachereq)) or (end not in endingcache and endcount < min(minmatch, cachereq) and (stem in stemcache or stemcount < cachereq)):
+                    continue
+                # If one half can never be matched (or cached) often enough and the other can never be cached, the scan can't change anything
+
+                keys = [corpus[j] for j in corpusindex.holding(None if stem in stemcache else stem, None if end in endingcache else end).tolist()]
+                # Only words that start with the stem or end with the ending can affect the scan (any others are passed over below), so only they're scanned (in corpus order)
+
+            for key in keys:
+                if key != word:
+                    if stem not in stemcache and key.startswith(stem):
+                        stemmultiplicity += 1
+
+                        if stemmultiplicity >= cachereq:
+                            stemcache.add(stem)
+                    elif end not in endingcache and key.endswith(end):
+                        endmultiplicity += 1
+
+                        if endmultiplicity >= cachereq:
+                            endingcache.add(end)
+                    else:
+                        continue
+
+                    if (stem in stemcache or stemmultiplicity >= minmatch) and (end in endingcache or endmultiplicity >= minmatch):
+                        splits.append(i + 1)
+                        break
+
+        for split in splits:
+            if word[:split] not in stems:
+                stems.append(word[:split])
+
+            if word[split:] not in endings:
+                endings.append(word[split:])
+
+        c += 1
+
+        reporter.progress("word(s) checked", c, len(corpus))
+
+    if stats is not None:
+        stats.time("components", time.perf_counter() - start)
+
+    return stems, endings
+    # Returns the stems and endings found by splitting the corpus' words wherever both halves are shared with enough other words
+
+def stemrelationships(corpus, stems, endings, relreq, reporter, stats=None, corpusindex=None):
+    if stats is not None:
+        start = time.perf_counter()
+
+    relationships = []
+
+    known = lookup(corpus, corpusindex)
+    # Words are looked up in a set (or the index's own table of words) rather than searched for in the corpus list
+
+    stemsearch = stems[:]
+
+    nck = int(math.factorial(len(stems)) / (2 * math.factorial(len(stems) - 2)))
+
+    c = 0
+
+    # For each pair of distinct registered stems, compile all of the endings that can be matched to both stems
+    # If enough endings can be matched to a pair of stems, register the relationship between the stems and the endings
+    for A in stems:
+        stemsearch.remove(A)
+        
+        for B in stemsearch:            
+            if len(A) == 0 or len(B) == 0 or A[-1] != B[-1]:                    
+                related = []
+                            
+                for end in endings:
+                    if str(A + end) in known and str(B + end) in known:
+                        related.append(end)
+
+                if related != [""] and len(related) >= relreq:
+                    relationships.append(Relationship(related, A, B, True))
+
+            c += 1
+
+            reporter.progress("stem combinations evaluated", c, nck)
+
+    if stats is not None:
+        stats.count("stempairs.evaluated", c)
+        stats.count("stempairs.related", len(relationships))
+        stats.time("stempairs", time.perf_counter() - start)
+
+    return relationships
+    # Returns the relationships between pairs of stems that share at least [relreq] endings
+
+def endingrelationships(corpus, stems, endings, relreq, reporter, stats=None, corpusindex=None):
+    if stats is not None:
+        start = time.perf_counter()
+
+    relationships = []
+
+    known = lookup(corpus, corpusindex)
+
+    endingsearch = endings[:]
+
+    nck = int(math.factorial(len(endings)) / (2 * math.factorial(len(endings) - 2)))
+
+    c = 0
+
+    # Do the same as above, except with pairs of distinct registered endings and sets of matching stems
+    for A in endings:
+        endingsearch.remove(A)
+        
+        for B in endingsearch:
+            if len(A) == 0 or len(B) == 0 or A[0] != B[0]:
+                related = []
+                            
+                for stem in stems:
+                    if str(stem + A) in known and str(stem + B) in known:
+                        related.append(stem)
+
+                if related != [""] and len(related) >= relreq:
+                    relationships.append(Relationship(related, A, B, False))
+
+            c += 1
+
+            reporter.progress("ending combinations evaluated", c, nck)
+
+    if stats is not None:
+        stats.count("endingpairs.evaluated", c)
+        stats.count("endingpairs.related", len(relationships))
+        stats.time("endingpairs", time.perf_counter() - start)
+
+    return relationships
+    # Returns the relationships between pairs of endings that share at least [relreq] stems
+
+def lookup(corpus, corpusindex=None):
+    if corpusindex is not None and corpusindex.words == tuple(corpus):
+        return corpusindex.positions
+
+    return set(corpus)
+    # Returns a table that the corpus' words can be looked up in, reusing the index's positions of its words if it was built from the same words
+
+# Applies a rule to a word to produce that word's counterpart
+# WORD: The word to be altered
+# RULE: The rule to apply (expressed as a tuple of two strings containing letters, hashes and stars)
+# STATS: An Instrumentation.Stats object to count attempts and matches in
+    # Feature disabled when set to None
+def applyrule(word, rule, reporter=None, stats=None):
+    if stats is not None:
+        stats.count("applyrule.attempts")
+
+    match = None
+    
+    for half in rule:
+        if len(word) > len(half) or len(word) < (len(half) - half.count("*")):
+            continue
+        # If the provided word is too short or too long to be matched with this half of the rule, move on
+        
+        offset = -1
+
+        pattern = []
+
+        for i in range(len(half)):
+            if half[i] != "#" and half[i] != "*":
+                if offset < 0:
+                    offset = 0
+
+                pattern.append([offset, half[i]])
+
+            if offset >= 0:
+                offset += 1
+        # Compile the distribution of definite characters in this half of the rule
+        
+        if len(pattern) > 0 and pattern[0][1] not in word:
+            continue
+
+        # For each character in the provided word matching the first character of the definite pattern recorded from this half of the rule, attempt to match the pattern with the string
+        # If a match is found, verify the string's other contents
+        if len(pattern) == 0:
+            halfstart = half[:half.find("#")]
+            halfend = half[half.rfind("#") + 1:]
+            
+            if half[0] == "#":
+                match = word[:half.count("#")]
+            elif half[-1] == "#":
+                match = word[-half.count("#"):]
+
+            wordstart = word[:word.find(match)]
+            wordend = word[word.find(match) + len(match):]
+        else:
+            for base in [index for index, character in enumerate(word) if character == pattern[0][1]]:
+                matching = True
+                
+                for i in range(len(pattern) - 1):
+                    if base + pattern[i + 1][0] >= len(word) or word[base + pattern[i + 1][0]] != pattern[i + 1][1]:
+                        matching = False
+                        
+                        break
+
+                if not matching:
+                    continue
+
+                halfstart = half[:half.find(pattern[0][1])]
+                halfend = half[half.find(pattern[0][1]) + pattern[-1][0] + 1:]
+                # Record the elements of the matching rule before and after the definite pattern's section
+
+                match = word[base:base + pattern[-1][0] + 1]
+                # Record the substring in the word that matches up with the definite pattern's section
+
+                wordstart = word[:base]
+                wordend = word[base + pattern[-1][0] + 1:]
+                # Record the substrings in the word before and after the matching section
+                
+                if len(wordstart) > len(halfstart) or len(wordstart) < (len(halfstart) - halfstart.count("*")) or len(wordend) > len(halfend) or len(wordend) < (len(halfend) - halfend.count("*")):
+                    match = None
+
+                    continue
+                
+                break
+
+        checked = half
+
+        break
+
+    if match is not None:
+        # Get the other half of the rule and retrieve that half's unique contents (with respect to the matched half)
+        for half in rule:
+            if half != checked:
+                frame = half
+
+        frame = frame.replace(halfstart, wordstart, 1)
+        frame = frame.replace(halfend, wordend, 1)
+
+        out = ""
+
+        for i in range(len(frame)):
+            if frame[i] == "#" or frame[i] == "*":
+                out += word[i]
+            else:
+                out += frame[i]
+
+        if stats is not None:
+            stats.count("applyrule.matches")
+
+        if reporter is None:
+            reporter = Reporting.default
+
+        if reporter.enabled(Reporting.DETAIL):
+            reporter.log(word + " → " + wordstart + "[" + match + "]" + wordend + " → " + out + " | " + str(rule), Reporting.DETAIL)
+
+        return out
+        # Return the transformation of the original string, as defined by the differences between the two halves of the supplied rule
+
+    return None
+
+# Holds a rule with everything applyrule() works out about each of its halves, so that it's only worked out once however many words the rule is applied to
+# RULE: The rule to compile (expressed as a tuple of two strings containing letters, hashes and stars)
+class CompiledRule:
+    __slots__ = ("rule", "halves", "degenerate")
+
+    def __init__(self, rule):
+        self.rule = tuple(rule)
+        self.halves = []
+
+        self.degenerate = len(self.rule) != 2 or self.rule[0] == self.rule[1]
+
+        for h in range(len(self.rule)):
+            half = self.rule[h]
+
+            definite = [i for i in range(len(half)) if half[i] != "#" and half[i] != "*"]
+
+            if len(definite) == 0:
+                self.degenerate = True
+                continue
+            # Halves without any definite characters are matched by a separate (and rarely used) branch of applyrule(), so rules with them are left to it
+
+            first = definite[0]
+            span = definite[-1] - first + 1
+
+            halfstart = half[:half.find(half[first])]
+            halfend = half[half.find(half[first]) + span:]
+
+            frame = self.rule[1 - h] if not self.degenerate else None
+
+            self.halves.append((len(half) - half.count("*"), len(half), half[first], tuple((i - first, half[i]) for i in definite[1:]), span, halfstart, halfend, len(halfstart) - halfstart.count("*"), len(halfstart), len(halfend) - halfend.count("*"), len(halfend), frame))
+            # Each half is recorded as the range of word lengths it can match, its definite characters (as offsets from the first of them), the span they cover, the parts of the half before and after that span (and the lengths that the matching parts of a word can have) and the other half of the rule
+
+def compilerules(rules):
+    return [rule if type(rule) is CompiledRule else CompiledRule(rule) for rule in rules]
+    # Compiles a list of rules (leaving any that are already compiled as they are)
+
+# Applies every rule in a set to every word in a list at once, giving exactly the same results as calling applyrule() with each pair
+# Words are bucketed by length first, so each rule is only tried on the words long (and short) enough for one of its halves
+# WORDS: The words to be altered
+# RULES: The rules to apply (compiled by compilerules(), or as tuples to be compiled)
+# STATS: An Instrumentation.Stats object to count the attempted and matched pairs of words and rules (and the time spent) in
+    # Feature disabled when set to None
+# Returns a list holding, for each rule, a list of the (index, output) pairs of the words that it transforms (in the order of [WORDS])
+def applyrules(words, rules, stats=None):
+    if stats is not None:
+        start = time.perf_counter()
+        attempts = 0
+
+    buckets = {}
+
+    for index, word in enumerate(words):
+        buckets.setdefault(len(word), []).append((index, word))
+
+    results = []
+
+    for compiled in compilerules(rules):
+        found = []
+
+        lengths = sorted(length for length in buckets if any(half[0] <= length <= half[1] for half in compiled.halves) or compiled.degenerate)
+
+        candidates = [pair for length in lengths for pair in buckets[length]]
+
+        if len(lengths) > 1:
+            candidates.sort()
+        # Keep the words in their original order
+
+        if stats is not None:
+            attempts += len(candidates)
+
+        if compiled.degenerate:
+            for index, word in candidates:
+                out = applyrule(word, compiled.rule, Reporting.silent)
+
+                if out is not None:
+                    found.append((index, out))
+
+            results.append(found)
+            continue
+
+        for index, word in candidates:
+            length = len(word)
+
+            for minlength, maxlength, first, pattern, span, halfstart, halfend, startmin, startmax, endmin, endmax, frame in compiled.halves:
+                if length < minlength or length > maxlength or first not in word:
+                    continue
+                # As in applyrule(), the first half that the word passes these checks for is the only one it's matched against (even if the match then fails)
+
+                base = word.find(first)
+
+                while base >= 0:
+                    if base < startmin or base > startmax or length - base - span < endmin or length - base - span > endmax:
+                        base = word.find(first, base + 1)
+                        continue
+                    # The parts of the word before and after the matching section must fit the parts of the half before and after its definite characters
+
+                    for offset, character in pattern:
+                        if base + offset >= length or word[base + offset] != character:
+                            break
+                    else:
+                        wordstart = word[:base]
+                        wordend = word[base + span:]
+
+                        frame = frame.replace(halfstart, wordstart, 1)
+                        frame = frame.replace(halfend, wordend, 1)
+
+                        out = ""
+
+                        for i in range(len(frame)):
+                            if frame[i] == "#" or frame[i] == "*":
+                                out += word[i]
+                            else:
+                                out += frame[i]
+                        # Build the transformation in exactly the same way as applyrule()
+
+                        found.append((index, out))
+
+                        break
+
+                    base = word.find(first, base + 1)
+
+                break
+
+        results.append(found)
+
+    if stats is not None:
+        stats.count("applyrules.attempts", attempts)
+        stats.count("applyrules.matches", sum(len(found) for found in results))
+        stats.time("applyrules", time.perf_counter() - start)
+
+    return results
+
+# ---------------------------------------------------------------------------------------------------- #
+
+#corpus = "receive reception conceive conception deceive deception honor honorem orator oratorem bake baked charge charged"
+#corpus2 = "honor honorem orator oratorem"
+#corpus3 = "bake baked charge charged"
+
+#test = relationships(corpus, 1, 2, 3)
+#for rel in test:
+#    print(rel)
+#    print(rel.rule())
+
+#applyrule("enception", ("*##ceive", "*##ception"))
+
+def test(filename, outname):
+    for x in range(1):
+        print("Loading words...")
+
+        complement = CorpusLoader.load("C:\\Users\\Joseph\\Desktop\\" + filename + ".txt").words
+
+        minicorpus = []
+
+        while len(minicorpus) < 1000:
+            word = complement.pop(random.randrange(len(complement)))
+
+            minicorpus.append(word)
+
+        timeA = time.process_time()
+
+        outset = []
+
+        relset = relationships(minicorpus, 1, 2, 3)
+
+        for rel in relset:        
+            for word in minicorpus:
+                out = applyrule(word, rel.rule())
+
+                if out != None and out not in minicorpus and out not in outset:
+                    outset.append(out)
+
+        timeB = time.process_time()
+        timeB = timeB - timeA
+
+        incomplement = 0
+
+        if len(outset) == 0:
+            genaccuracy = 0
+        else:
+            for word in outset:
+                if word in complement:
+                    incomplement += 1
+
+            genaccuracy = float(incomplement / len(outset))
+
+        with open("C:\\Users\\Joseph\\Desktop\\" + outname + "Run" + str(x + 1) + ".txt", "w") as file:
+            for word in outset:
+                file.write(word + "\n")
+
+            file.write("TIME: " + str(timeB) + "\n")
+            file.write("TOTALCOUNT: " + str(len(outset)) + "\n")
+            file.write("IN COMPLEMENT COUNT: " + str(incomplement) + "\n")
+            file.write("GENACCURACY: " + str(genaccuracy) + "\n\n")
+
+            for rel in relset:
+                file.write(str(rel.rule()) + "\n")
+
+            file.close()
+
+    input("[ENTER]: Close")
+
+def test2():
+    corpus = "receive reception conceive conception deceive deception honor honorem orator oratorem bake baked charge charged petor"
+    corpus = corpus.split()
+
+    relset = relationships(corpus, 1, 2, 3)
+
+    for rel in relset:
+        for word in corpus:
+            ech = applyrule(word, rel.rule())
+
+if __name__ == "__main__":
+    if os.name == "nt":
+        ctypes.windll.kernel32.SetConsoleMode(ctypes.windll.kernel32.GetStdHandle(-11), 7)
+        # Enable the console's handling of escape sequences (which are used to overwrite progress lines)
+
+    test("CornishCorpus9645", "CornishCorpus1000NeuvelFulopMin1Cache2Req3")
+
+    #test2()
+    #applyrule("petor", ('*###or', '*###orem'))
+    # Experiments are only run when this module is executed directly (with "python -m morphologylearner.NeuvelFulopImplementation")
@@ -0,0 +1,93 @@
+import sys
+import time
+
+SILENT = 0
+SUMMARY = 1
+PROGRESS = 2
+DETAIL = 3
+# Verbosity levels, each of which includes the output of every level below it
+# SILENT: Nothing is written
+# SUMMARY: Only the start and outcome of each method are written
+# PROGRESS: Progress counters are also written (overwriting each other, at most once every [INTERVAL] seconds)
+# DETAIL: Everything is written, including a line for every word, split, individual and child
+
+# Reports the progress and results of the package's methods
+# VERBOSITY: The level of output to write (see above)
+# STREAM: The file to write output to
+    # Standard output (as it is at the time of writing) is used when set to None
+# INTERVAL: The minimum number of seconds between two progress reports on the same task
+    # The last report on a task (once [COUNT] reaches [TOTAL]) is always made
+# CALLBACK: A function called as CALLBACK(task, count, total) alongside each progress report (regardless of verbosity)
+    # Feature disabled when set to None
+class Reporter:
+    def __init__(self, verbosity=DETAIL, stream=None, interval=0.1, callback=None):
+        self.verbosity = verbosity
+        self.stream = stream
+        self.interval = interval
+        self.callback = callback
+        self.reported = {}
+        self.overwrite = False
+
+    def enabled(self, level):
+        return self.verbosity >= level
+        # Methods check this before building their per-item lines, so that no time is spent on lines that won't be written
+
+    def log(self, message="", level=SUMMARY):
+        if self.verbosity < level:
+            return
+
+        self.write(message + "\n")
+
+        self.overwrite = False
+        # Writes a line of output if the verbosity is high enough for it
+
+    def progress(self, task, count, total=None, note=None):
+        if self.verbosity < PROGRESS and self.callback is None:
+            return
+
+        now = time.perf_counter()
+
+        if count != total and task in self.reported and now - self.reported[task] < self.interval:
+            return
+        # Reports made too soon after the last report on the same task are dropped (unless they complete it)
+
+        self.reported[task] = now
+
+        if self.callback is not None:
+            self.callback(task, count, total)
+
+        if self.verbosity < PROGRESS:
+            return
+
+        if total is None:
+            line = str(count) + " " + task
+        else:
+            line = str(count) + "/" + str(total) + " " + task
+
+        if note is not None:
+            line += " | " + note
+
+        if self.overwrite:
+            line = "\033[F\033[K" + line
+        # Each report on a task overwrites the one before it
+
+        self.write(line + "\n")
+
+        self.overwrite = True
+
+        if count == total:
+            del self.reported[task]
+            self.overwrite = False
+        # Reports the number of items of a task that have been completed (out of [TOTAL] if it's known)
+
+    def write(self, text):
+        if self.stream is None:
+            sys.stdout.write(text)
+        else:
+            self.stream.write(text)
+
+default = Reporter()
+# Used by every method that isn't given a reporter of its own
+# Its verbosity can be lowered to quieten the whole package
+
+silent = Reporter(SILENT)
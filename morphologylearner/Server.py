@@ -0,0 +1,475 @@
+import asyncio
+import json
+import os
+import signal
+import time
+from collections import deque
+from . import CorpusLoader
+from . import Reporting
+from .Sweep import defaults
+
+methods = ("harris", "neuvelfulop", "mdl")
+
+# Holds everything the algorithms learn from a corpus, so that words can be segmented (or used to generate new words) without rebuilding any of it
+# CORPUS: The corpus to learn from (as returned by CorpusLoader.load())
+# METHODS: The algorithms to prepare (see "methods" above)
+    # Every method draws on a single index of the corpus (see Indexing.CorpusIndex), which is built the first time one of them needs it
+    # Harris' method keeps its index and its ranking of eagerly-matched suffixes, Neuvel and Fulop's method keeps its mined rules and the genetic process keeps its best individual
+# SETTINGS: A dictionary of parameters for each algorithm, overriding those in Sweep.defaults
+# REPORTER: The Reporting.Reporter to write the progress of each build to
+    # Reporting.default is used when set to None
+class Model:
+    def __init__(self, corpus, methods=("harris",), settings=None, reporter=None):
+        if reporter is None:
+            reporter = Reporting.default
+
+        if type(corpus) is not CorpusLoader.Corpus:
+            corpus = CorpusLoader.Corpus(list(CorpusLoader.words(corpus)), None, False)
+
+        self.lowercase = corpus.lowercase
+        self.words = list(dict.fromkeys(corpus.words))
+        self.methods = tuple(methods)
+        self.index = None
+        self.settings = {}
+        self.times = {}
+
+        for method in self.methods:
+            self.settings[method] = dict(defaults[method], **(settings or {}).get(method, {}))
+
+            start = time.perf_counter()
+
+            getattr(self, "build" + method)(corpus, self.settings[method], reporter)
+
+            self.times[method] = time.perf_counter() - start
+
+            reporter.log("Prepared " + method + " in " + str(round(self.times[method], 3)) + "s")
+
+    def buildharris(self, corpus, settings, reporter):
+        from .HarrisImplementation import suffixranking
+
+        self.root = self.indexed(corpus)
+
+        if settings["ESM"] > 0:
+            self.ranks = {suffix: i for i, suffix in enumerate(suffixranking(self.words, settings["ESM"], settings["frequencymatching"], self.root))}
+        else:
+            self.ranks = {}
+
+        self.splits = {}
+
+        for c, word in enumerate(self.words):
+            self.splits[word] = self.harris(word)
+
+            reporter.progress("word(s) split", c + 1, len(self.words))
+        # Every word of the corpus is split up front, so that only unseen words are split while serving
+
+    def buildneuvelfulop(self, corpus, settings, reporter):
+        from .NeuvelFulopImplementation import relationships, consensus, compilerules
+
+        self.known = set(word.lower() for word in self.words)
+
+        self.rules = compilerules(consensus(relationships([word.lower() for word in self.words], settings["minmatch"], settings["cachereq"], settings["relreq"], reporter, corpusindex=self.indexed(corpus))))
+
+    def buildmdl(self, corpus, settings, reporter):
+        from .MDLImplementation import genetic
+
+        self.best = genetic(corpus.encoded(), reporter=reporter, corpusindex=self.indexed(corpus), **settings)
+
+    def indexed(self, corpus):
+        from .Indexing import index
+
+        if self.index is None:
+            self.index = index(corpus)
+
+        return self.index
+
+    def harris(self, word):
+        from .HarrisImplementation import maxima
+
+        index = None
+
+        if len(word) > 1:
+            for i in range(len(word) + 1):
+                if word[i:] in self.ranks and (index is None or self.ranks[word[i:]] < self.ranks[word[index:]]):
+                    index = i
+        # Match the word with the highest-ranked suffix that it ends with (which is the suffix that eagersuffixes() would match it with)
+
+        if index is not None and index > 0:
+            return maxima(self.root.distribution(word[:index])) + [index]
+
+        return maxima(self.root.distribution(word))
+        # Splits a word in the same way as harrissplits() (whether or not it's in the corpus)
+        # The index only gives branching factors for the longest start of an unseen word that the corpus holds
+
+    def segment(self, words, method):
+        if method == "harris":
+            return [self.splits[word] if word in self.splits else self.harris(word) for word in words]
+
+        if method == "mdl":
+            if self.best is None:
+                return [None] * len(words)
+
+            positions = self.best.index.positions
+            splits = self.best.splits
+
+            return [[abs(splits[positions[word]])] if word in positions else None for word in words]
+            # The genetic process only assigns boundaries to the words of its own corpus, so unseen words are given none
+
+        return None
+
+    def generate(self, words):
+        from .NeuvelFulopImplementation import applyrules
+
+        results = [[] for word in words]
+
+        for found in applyrules(words, self.rules):
+            for index, out in found:
+                if out not in self.known and out not in results[index]:
+                    results[index].append(out)
+
+        return results
+        # Applies every mined rule to each word, returning the new words that each of them generates
+
+# ---------------------------------------------------------------------------------------------------- #
+
+# Answers requests for a model over a local TCP or Unix socket
+# Each request and response is a single line of JSON, such as {"id": 1, "op": "segment", "method": "harris", "words": ["walked", "talking"]} and {"id": 1, "results": [[4], [4]]}
+# OP: "segment" (with a "method" of "harris" or "mdl"), "generate" (with Neuvel and Fulop's rules) or "stats"
+# Requests are answered in the order they're finished in (rather than the order they're sent in), so clients should tell them apart by their "id"
+# Requests that arrive together (from any connection) are answered in micro-batches, so that words requested more than once are only worked out once
+# MODEL: The Model to answer requests with
+# BATCHSIZE: The largest number of requests to answer at once
+# WINDOW: The number of seconds to wait for more requests to arrive once one has
+    # Feature disabled when set to 0
+# HISTORY: The number of recent requests whose latencies are kept for reporting
+# REPORTER: The Reporting.Reporter to write the server's address and each connection to
+    # Reporting.default is used when set to None
+class Server:
+    def __init__(self, model, batchsize=64, window=0.002, history=10000, reporter=None):
+        if reporter is None:
+            reporter = Reporting.default
+
+        self.model = model
+        self.batchsize = batchsize
+        self.window = window
+        self.reporter = reporter
+        self.latencies = deque(maxlen=history)
+        self.requests = 0
+        self.words = 0
+        self.batches = 0
+        self.started = time.perf_counter()
+        self.queue = None
+        self.server = None
+        self.batcher = None
+
+    async def start(self, host="127.0.0.1", port=0, path=None):
+        self.queue = asyncio.Queue()
+        self.batcher = asyncio.ensure_future(self.batch())
+
+        if path is not None:
+            self.server = await asyncio.start_unix_server(self.handle, path)
+
+            address = path
+        else:
+            self.server = await asyncio.start_server(self.handle, host, port)
+
+            address = self.server.sockets[0].getsockname()[:2]
+
+        self.started = time.perf_counter()
+
+        self.reporter.log("Serving on " + (address if path is not None else address[0] + ":" + str(address[1])))
+
+        return address
+        # Starts listening (on an unused port when [PORT] is 0) and returns the address being listened on
+
+    async def stop(self):
+        self.server.close()
+
+        await self.server.wait_closed()
+
+        self.batcher.cancel()
+
+    async def handle(self, reader, writer):
+        lock = asyncio.Lock()
+        tasks = set()
+
+        self.reporter.log("Connection opened", Reporting.PROGRESS)
+
+        while True:
+            line = await reader.readline()
+
+            if len(line) == 0:
+                break
+
+            task = asyncio.ensure_future(self.respond(line, writer, lock))
+
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+            # Each request is answered by its own task, so that requests sent down the same connection without waiting for replies can share a batch
+
+        if len(tasks) > 0:
+            await asyncio.wait(tasks)
+
+        writer.close()
+
+        self.reporter.log("Connection closed", Reporting.PROGRESS)
+
+    async def respond(self, line, writer, lock):
+        received = time.perf_counter()
+
+        try:
+            request = json.loads(line)
+        except ValueError:
+            request = None
+
+        if type(request) is not dict:
+            response = {"error": "Requests must be JSON objects"}
+        elif request.get("op") == "stats":
+            response = {"results": self.stats()}
+        else:
+            future = asyncio.get_event_loop().create_future()
+
+            await self.queue.put((request, future))
+
+            response = await future
+
+        if type(request) is dict and "id" in request:
+            response["id"] = request["id"]
+
+        async with lock:
+            writer.write((json.dumps(response) + "\n").encode("utf8"))
+
+            await writer.drain()
+
+        self.latencies.append(time.perf_counter() - received)
+        self.requests += 1
+
+    async def batch(self):
+        while True:
+            items = [await self.queue.get()]
+
+            if self.window > 0 and self.queue.qsize() < self.batchsize - 1:
+                await asyncio.sleep(self.window)
+            # Wait briefly for other requests to join the batch (unless there are already enough of them)
+
+            while len(items) < self.batchsize and not self.queue.empty():
+                items.append(self.queue.get_nowait())
+
+            requests = [request for request, future in items]
+
+            try:
+                responses = self.answer(requests)
+            except Exception:
+                responses = [self.attempt(request) for request in requests]
+            # If the batch can't be answered, each of its requests is answered alone, so that only the requests at fault are given errors (and the batcher keeps running)
+
+            for (request, future), response in zip(items, responses):
+                if not future.done():
+                    future.set_result(response)
+
+            self.batches += 1
+
+    def answer(self, requests):
+        groups = {}
+        responses = []
+
+        for request in requests:
+            op = request.get("op")
+            method = request.get("method", "harris" if "harris" in self.model.methods else "mdl")
+            words = request.get("words")
+
+            if type(words) is not list or not all(type(word) is str for word in words):
+                responses.append({"error": "Requests must give a list of words"})
+                continue
+
+            if self.model.lowercase:
+                words = [word.lower() for word in words]
+
+            if op == "generate":
+                method = "neuvelfulop"
+            elif op != "segment":
+                responses.append({"error": "'" + str(op) + "' is not a recognised operation"})
+                continue
+            elif method == "neuvelfulop" or method not in methods:
+                responses.append({"error": "'" + str(method) + "' is not a recognised segmentation method"})
+                continue
+
+            if method not in self.model.methods:
+                responses.append({"error": "The server hasn't prepared " + method})
+                continue
+
+            groups.setdefault(method, {}).update(dict.fromkeys(words))
+
+            responses.append((method, words))
+            # Gather the words of every request in the batch by method, leaving out repeats
+
+        for method, unique in groups.items():
+            if method == "neuvelfulop":
+                results = self.model.generate(list(unique))
+            else:
+                results = self.model.segment(list(unique), method)
+
+            groups[method] = dict(zip(unique, results))
+
+            self.words += len(unique)
+
+        return [{"results": [groups[response[0]][word] for word in response[1]]} if type(response) is tuple else response for response in responses]
+        # Answers a batch of requests, working out each word requested from each method only once
+
+    def attempt(self, request):
+        try:
+            return self.answer([request])[0]
+        except Exception as error:
+            self.reporter.log("Failed to answer a request (" + type(error).__name__ + ": " + str(error) + ")")
+
+            return {"error": "The request couldn't be answered (" + type(error).__name__ + ": " + str(error) + ")"}
+        # Answers a single request, giving an error in place of any exception raised while answering it
+
+    def stats(self):
+        latencies = sorted(self.latencies)
+        elapsed = time.perf_counter() - self.started
+
+        return {"requests": self.requests, "words": self.words, "batches": self.batches, "p50": percentile(latencies, 0.5), "p99": percentile(latencies, 0.99), "requestspersecond": self.requests / elapsed if elapsed > 0 else 0.0, "wordspersecond": self.words / elapsed if elapsed > 0 else 0.0, "uptime": elapsed}
+        # Latencies (in seconds) are taken from the most recent requests, while throughputs are averaged over the server's uptime
+        # Words that were answered from a batch more than once are only counted once
+
+def percentile(values, q):
+    if len(values) == 0:
+        return None
+
+    return values[min(len(values) - 1, int(round(q * (len(values) - 1))))]
+    # Returns the value at the [q] quantile of a sorted list (or None if it's empty)
+
+# ---------------------------------------------------------------------------------------------------- #
+
+# Sends requests to a server (such as one started by serve()) over a single connection
+# Several requests can be awaited at once, in which case they're sent without waiting for each other's replies
+class Client:
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.pending = {}
+        self.count = 0
+        self.listener = asyncio.ensure_future(self.listen())
+
+    @classmethod
+    async def connect(Client, host="127.0.0.1", port=None, path=None):
+        if path is not None:
+            reader, writer = await asyncio.open_unix_connection(path)
+        else:
+            reader, writer = await asyncio.open_connection(host, port)
+
+        return Client(reader, writer)
+
+    async def listen(self):
+        while True:
+            line = await self.reader.readline()
+
+            if len(line) == 0:
+                break
+
+            response = json.loads(line)
+
+            future = self.pending.pop(response.get("id"), None)
+
+            if future is not None and not future.done():
+                future.set_result(response)
+
+        for future in self.pending.values():
+            if not future.done():
+                future.set_exception(ConnectionError("The server closed the connection"))
+        # Futures whose requests were cancelled (or already answered) are left as they are
+
+    async def request(self, op, words=None, method=None):
+        self.count += 1
+
+        request = {"id": self.count, "op": op}
+
+        if words is not None:
+            request["words"] = list(words)
+
+        if method is not None:
+            request["method"] = method
+
+        future = asyncio.get_event_loop().create_future()
+
+        self.pending[self.count] = future
+
+        self.writer.write((json.dumps(request) + "\n").encode("utf8"))
+
+        await self.writer.drain()
+
+        response = await future
+
+        if "error" in response:
+            raise ValueError(response["error"])
+
+        return response["results"]
+
+    async def segment(self, words, method=None):
+        return await self.request("segment", words, method)
+
+    async def generate(self, words):
+        return await self.request("generate", words)
+
+    async def stats(self):
+        return await self.request("stats")
+
+    async def close(self):
+        self.writer.close()
+
+        await self.listener
+
+# ---------------------------------------------------------------------------------------------------- #
+
+# Prepares a model from a corpus and serves it until interrupted
+# CORPUS, METHODS, SETTINGS: As for Model
+# HOST, PORT: The address to listen on (an unused port is chosen when [PORT] is 0)
+# PATH: The location of a Unix socket to listen on instead
+    # Feature disabled when set to None
+# BATCHSIZE, WINDOW: As for Server
+# REPORTER: The Reporting.Reporter to write progress to
+    # Reporting.default is used when set to None
+def serve(corpus, methods=("harris",), settings=None, host="127.0.0.1", port=0, path=None, batchsize=64, window=0.002, reporter=None):
+    if reporter is None:
+        reporter = Reporting.default
+
+    for method in methods:
+        if method not in defaults:
+            print("'" + str(method) + "' is not a recognised algorithm")
+            return None
+
+    model = Model(corpus, methods, settings, reporter)
+
+    server = Server(model, batchsize, window, reporter=reporter)
+
+    async def main():
+        await server.start(host, port, path)
+
+        try:
+            asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, asyncio.current_task().cancel)
+        except (NotImplementedError, AttributeError):
+            pass
+        # Being terminated stops the server in the same way as being interrupted (where signal handlers are supported)
+
+        try:
+            await server.server.serve_forever()
+        finally:
+            if path is not None and os.path.exists(path):
+                os.remove(path)
+
+    try:
+        asyncio.run(main())
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        pass
+
+    stats = server.stats()
+
+    reporter.log(str(stats["requests"]) + " request(s) | p50 " + latency(stats["p50"]) + " | p99 " + latency(stats["p99"]) + " | " + str(round(stats["requestspersecond"], 1)) + " request(s)/s")
+
+    return stats
+
+def latency(seconds):
+    if seconds is None:
+        return "-"
+
+    return str(round(seconds * 1000, 3)) + "ms"
@@ -0,0 +1,326 @@
+import heapq
+import os
+import sys
+import tempfile
+import time
+import zipfile
+import zlib
+import numpy as np
+from . import Reporting
+from .HarrisImplementation import maxima
+from .Indexing import CorpusIndex
+
+# Runs Harris' method and builds entropy tables over corpora too large to hold in memory, by splitting them into shards on disk that are indexed one at a time
+# Every statistic either of them needs only compares words that share a prefix (successor varieties and next-letter entropies) or words that share a suffix (eagerly-matched suffixes and last-letter entropies)
+# Words are hash-partitioned by their first letter into "forward" shards, so every word starting with a given prefix is found in the same shard, and each word's forward statistics are then passed on to a "reverse" shard chosen by its last letter
+# Each shard's results are sorted by the position of each word in the corpus, so that all of them can be merged back into corpus order as they're read
+# Only one shard is held in memory at a time, so memory use is bounded by the largest shard rather than by the whole corpus
+# Shards aren't of equal size (so the largest can hold far more than an even share of the corpus, as some letters start or end many more words than others), and there can never be more non-empty shards than there are distinct first (or last) letters
+
+def shard(character, shards):
+    return zlib.crc32(character.lower().encode("utf8")) % shards
+    # Returns the shard that words starting (or ending) with a character belong in
+    # Characters are hashed in lowercase, as the index of each shard normalises its words to lowercase
+
+def partition(source, directory, shards, lowercase=True):
+    files = [open(os.path.join(directory, "forward" + str(i)), "w", encoding="utf8") for i in range(shards)]
+
+    position = 0
+
+    for line in source:
+        if lowercase:
+            line = line.lower()
+
+        fields = line.split(None, 1)
+
+        if len(fields) == 0:
+            continue
+
+        files[shard(fields[0][0], shards)].write(str(position) + " " + fields[0] + "\n")
+
+        position += 1
+    # Read the corpus in the same way as CorpusLoader.load(), taking the first word from every non-blank line (but one line at a time)
+
+    for file in files:
+        file.close()
+
+    return position
+    # Writes every word of the corpus to its forward shard (with its position in the corpus), returning the number of words read
+    # SOURCE: An open text file (or any other iterable of lines) holding the corpus
+
+def records(path):
+    with open(path, encoding="utf8") as file:
+        for line in file:
+            yield line.split()
+    # Reads the fields of every record in a shard
+
+def unique(path):
+    positions = {}
+
+    for fields in records(path):
+        if fields[1] not in positions:
+            positions[fields[1]] = int(fields[0])
+
+    return positions
+    # Returns the position of the first occurrence of every word in a forward shard (in the order they were first seen)
+    # Every occurrence of a word is found in the same shard, so each word is only kept once across the whole corpus
+
+def merge(paths):
+    files = [open(path, encoding="utf8") for path in paths]
+
+    try:
+        for line in heapq.merge(*files, key=lambda line: int(line.split(None, 1)[0])):
+            yield line.split()
+    finally:
+        for file in files:
+            file.close()
+    # Reads the records of every shard in a single pass (in corpus order), provided that each shard's records are sorted by position
+
+def results(path, found):
+    found.sort(key=lambda record: record[0])
+
+    with open(path, "w", encoding="utf8") as file:
+        for record in found:
+            file.write(" ".join(str(field) for field in record) + "\n")
+    # Writes a shard's results sorted by position, ready to be merged
+
+def opener(source):
+    if type(source) is str:
+        if source == "-":
+            return sys.stdin
+
+        return open(source, encoding="utf8")
+
+    return source
+    # Opens a corpus file (or standard input, as "-") for partition()
+
+# ---------------------------------------------------------------------------------------------------- #
+
+# Splits every word of a corpus with Harris' method (giving the same splits as HarrisImplementation.Harris()) one shard at a time, yielding each word and its split indexes in corpus order
+# SOURCE: The path of the corpus file ("-" for standard input) or an open text file holding it
+# ESM, FREQUENCYMATCHING: As for HarrisImplementation.Harris()
+# SHARDS: The number of shards to partition the corpus into
+    # Memory use is bounded by the largest shard, which holds every word sharing a first (or last) letter, so shards beyond the number of distinct letters are left empty
+# DIRECTORY: Where to keep the shards while they're processed (which are deleted afterwards)
+    # The system's temporary directory is used when set to None
+# LOWERCASE: Whether to normalise the words to lowercase as they're read (as CorpusLoader.load() does)
+# REPORTER: The Reporting.Reporter to write progress to
+    # Reporting.default is used when set to None
+# If an Instrumentation.Stats object is supplied, the number of words and unique words and the time spent in each pass are recorded in it
+def harris(source, ESM, frequencymatching, shards=16, directory=None, lowercase=True, reporter=None, stats=None):
+    if reporter is None:
+        reporter = Reporting.default
+
+    with tempfile.TemporaryDirectory(dir=directory) as directory:
+        start = time.perf_counter()
+
+        with opener(source) as file:
+            count = partition(file, directory, shards, lowercase)
+
+        if stats is not None:
+            start = stats.lap("partition", start)
+            stats.count("shards.words", count)
+
+        reverse = [open(os.path.join(directory, "reverse" + str(i)), "w", encoding="utf8") for i in range(shards)]
+
+        for i in range(shards):
+            positions = unique(os.path.join(directory, "forward" + str(i)))
+
+            root = CorpusIndex(positions)
+
+            found = []
+
+            for word, position in positions.items():
+                flat = root.distribution(word)
+
+                if ESM > 0:
+                    reverse[shard(word[-1], shards)].write(str(position) + " " + word + " " + str(root.finalbranch(word) or 0) + " " + " ".join(str(n) for n in flat) + "\n")
+                else:
+                    found.append((position, word) + tuple(maxima(flat)))
+                # Each word's successor varieties are found in its forward shard, alongside the start of the suffix after its final branch (which eager suffix matching ranks)
+
+            if ESM == 0:
+                results(os.path.join(directory, "results" + str(i)), found)
+
+            os.remove(os.path.join(directory, "forward" + str(i)))
+
+            if stats is not None:
+                stats.count("shards.unique", len(positions))
+
+            reporter.progress("forward shard(s) indexed", i + 1, shards)
+
+        for file in reverse:
+            file.close()
+
+        if stats is not None:
+            start = stats.lap("forward", start)
+
+        if ESM > 0:
+            for i in range(shards):
+                path = os.path.join(directory, "reverse" + str(i))
+
+                entries = [(int(fields[0]), fields[1], int(fields[2]), [int(n) for n in fields[3:]]) for fields in records(path)]
+
+                suffixlog = {}
+
+                for position, word, branch, flat in entries:
+                    suffix = word[branch:]
+
+                    if frequencymatching and len(suffix) < ESM:
+                        continue
+
+                    if suffix not in suffixlog:
+                        suffixlog[suffix] = [0, position]
+
+                    suffixlog[suffix][0] += 1
+                    suffixlog[suffix][1] = min(suffixlog[suffix][1], position)
+                # Every suffix that a word could be eagerly matched with ends with the word's last letter, so all of its occurrences are counted in this shard
+
+                if frequencymatching:
+                    suffixes = sorted(suffixlog, key=lambda suffix: (-suffixlog[suffix][0], -suffixlog[suffix][1]))
+                else:
+                    suffixes = sorted(suffixlog, key=lambda suffix: (-len(suffix), -suffixlog[suffix][1]))
+                # Rank the suffixes in the same order as suffixranking(), which breaks ties in favour of the suffix first seen latest in the corpus
+
+                ranks = {suffix: j for j, suffix in enumerate(suffixes)}
+
+                found = []
+
+                for position, word, branch, flat in entries:
+                    index = None
+
+                    if len(word) > 1:
+                        for j in range(len(word)):
+                            if word[j:] in ranks and (index is None or ranks[word[j:]] < ranks[word[index:]]):
+                                index = j
+                    # Match the word with the highest-ranked suffix that it ends with (as eagersuffixes() would)
+
+                    if index is not None and index > 0:
+                        found.append((position, word) + tuple(maxima(flat[:index]) + [index]))
+                    else:
+                        found.append((position, word) + tuple(maxima(flat)))
+                    # The successor varieties before a matched suffix are the start of the word's own
+
+                results(os.path.join(directory, "results" + str(i)), found)
+
+                os.remove(path)
+
+                reporter.progress("reverse shard(s) matched", i + 1, shards)
+
+            if stats is not None:
+                start = stats.lap("reverse", start)
+
+        for fields in merge([os.path.join(directory, "results" + str(i)) for i in range(shards)]):
+            yield fields[1], [int(n) for n in fields[2:]]
+
+        if stats is not None:
+            stats.lap("merge", start)
+
+# Builds the entropy table of a corpus (see MDLImplementation.EntropyTable) one shard at a time, saving it to a file that can be reused by genetic()
+# The table is written to the file as it's merged, so it's never held in memory as a whole
+# SOURCE, SHARDS, DIRECTORY, REPORTER: As for harris()
+# PATH: The location to save the table to (in the same format as EntropyTable.save())
+# If an Instrumentation.Stats object is supplied, the number of words and unique words and the time spent in each pass are recorded in it
+def entropytable(source, path, shards=16, directory=None, reporter=None, stats=None):
+    if reporter is None:
+        reporter = Reporting.default
+
+    with tempfile.TemporaryDirectory(dir=directory) as directory:
+        start = time.perf_counter()
+
+        with opener(source) as file:
+            count = partition(file, directory, shards)
+            # Entropy tables are always built from lowercase words
+
+        if stats is not None:
+            start = stats.lap("partition", start)
+            stats.count("shards.words", count)
+
+        reverse = [open(os.path.join(directory, "reverse" + str(i)), "w", encoding="utf8") for i in range(shards)]
+
+        for i in range(shards):
+            positions = unique(os.path.join(directory, "forward" + str(i)))
+
+            root = CorpusIndex(positions)
+
+            stementropies = root.entropies()[0]
+
+            values = stementropies[root.stems].tolist()
+            offsets = root.offsets.tolist()
+
+            for j, word in enumerate(root.words):
+                reverse[shard(word[-1], shards)].write(str(positions[word]) + " " + word + " " + " ".join(repr(value) for value in values[offsets[j]:offsets[j + 1]]) + "\n")
+            # Every stem's next-letter entropy is found in its forward shard (with the empty stem's defined as 0, as it is across the whole corpus)
+
+            os.remove(os.path.join(directory, "forward" + str(i)))
+
+            if stats is not None:
+                stats.count("shards.unique", len(positions))
+
+            reporter.progress("forward shard(s) indexed", i + 1, shards)
+
+        for file in reverse:
+            file.close()
+
+        if stats is not None:
+            start = stats.lap("forward", start)
+
+        count = 0
+        longest = 1
+        slots = 0
+
+        for i in range(shards):
+            entries = list(records(os.path.join(directory, "reverse" + str(i))))
+
+            root = CorpusIndex([fields[1] for fields in entries])
+
+            suffixentropies = root.entropies()[1]
+
+            values = suffixentropies[root.suffixes].tolist()
+            offsets = root.offsets.tolist()
+
+            found = []
+
+            for j, fields in enumerate(entries):
+                found.append((int(fields[0]), fields[1]) + tuple(repr(float(stem) + suffix) for stem, suffix in zip(fields[2:], values[offsets[j]:offsets[j + 1]])))
+
+                longest = max(longest, len(fields[1]))
+                slots += offsets[j + 1] - offsets[j]
+            # Likewise, every suffix's last-letter entropy is found in its reverse shard, and is added to the stem entropy on the other side of each split position
+
+            count += len(entries)
+
+            results(os.path.join(directory, "results" + str(i)), found)
+
+            os.remove(os.path.join(directory, "reverse" + str(i)))
+
+            reporter.progress("reverse shard(s) indexed", i + 1, shards)
+
+        if stats is not None:
+            start = stats.lap("reverse", start)
+
+        paths = [os.path.join(directory, "results" + str(i)) for i in range(shards)]
+
+        with zipfile.ZipFile(path + ".tmp", "w", allowZip64=True) as archive:
+            for name, dtype, length, fields in (("words", np.dtype("<U" + str(longest)), count, lambda fields: fields[1:2]), ("values", np.dtype("<f8"), slots, lambda fields: [float(value) for value in fields[2:]])):
+                with archive.open(name + ".npy", "w", force_zip64=True) as member:
+                    np.lib.format.write_array_header_2_0(member, {"descr": np.lib.format.dtype_to_descr(dtype), "fortran_order": False, "shape": (length,)})
+
+                    chunk = []
+
+                    for record in merge(paths):
+                        chunk += fields(record)
+
+                        if len(chunk) >= 65536:
+                            member.write(np.array(chunk, dtype=dtype).tobytes())
+                            chunk = []
+
+                    member.write(np.array(chunk, dtype=dtype).tobytes())
+            # Each array is streamed into the archive in chunks (as np.savez() would write it) once its length is known
+
+        os.replace(path + ".tmp", path)
+
+        if stats is not None:
+            stats.lap("merge", start)
+
+    reporter.log("Built the entropy table of " + str(count) + " word(s) across " + str(shards) + " shard(s)")
@@ -0,0 +1,313 @@
+import hashlib
+import itertools
+import json
+import multiprocessing
+import os
+import time
+from . import CorpusLoader
+from . import Reporting
+
+defaults = {
+    "harris": {"ESM": 1, "frequencymatching": True},
+    "neuvelfulop": {"minmatch": 1, "cachereq": 2, "relreq": 3},
+    "mdl": {"popcount": 32, "gencount": 100, "mutprob": 0.01, "tournamentsize": 8, "fitnessthreshold": 0, "entropythreshold": 0, "seek": True, "rng": 0}
+}
+# The parameters each algorithm is run with unless a grid overrides them (matching those used by each module's test())
+# Any other parameter of genetic() can also be swept
+# Genetic runs are seeded, so that their results can be cached
+
+shared = {}
+# Structures built by a worker process that later configurations in the same process can reuse (such as corpus indexes and entropy tables)
+
+def fingerprint(words):
+    return hashlib.sha256("\n".join(words).encode("utf8")).hexdigest()
+    # Identifies a corpus by its words (in order)
+
+def key(corpushash, algorithm, parameters):
+    return hashlib.sha256((corpushash + "\n" + algorithm + "\n" + json.dumps(parameters, sort_keys=True)).encode("utf8")).hexdigest()
+    # Identifies a configuration of an algorithm run over a corpus
+
+def configurations(algorithm, grid):
+    names = list(grid)
+
+    return [dict(defaults[algorithm], **dict(zip(names, values))) for values in itertools.product(*[grid[name] for name in names])]
+    # Expands a grid (a dictionary of lists of values for each parameter) into every combination of its values
+
+# ---------------------------------------------------------------------------------------------------- #
+
+def setup(words):
+    shared.clear()
+    shared["words"] = words
+    # Gives each worker process its own copy of the corpus once (instead of once per task)
+
+def runharris(batch):
+    from .Indexing import CorpusIndex
+    from .HarrisImplementation import eagersuffixes, harrissplits
+
+    words = shared["words"]
+
+    start = time.perf_counter()
+
+    root = CorpusIndex(words)
+    root.varieties()
+
+    built = (time.perf_counter() - start) / len(batch)
+    # The index is built once and shared by every configuration in the batch, which are each charged an equal part of it
+
+    results = []
+
+    for parameters in batch:
+        start = time.perf_counter()
+
+        if parameters["ESM"] > 0:
+            indexes = eagersuffixes(words, parameters["ESM"], parameters["frequencymatching"], root, Reporting.silent)
+        else:
+            indexes = {}
+
+        splits = harrissplits(words, parameters["ESM"], indexes, root, Reporting.silent)
+
+        results.append((parameters, [splits[word] for word in words], built + time.perf_counter() - start))
+
+    return results
+
+def runneuvelfulop(batch):
+    from .Indexing import CorpusIndex
+    from .NeuvelFulopImplementation import components, stemrelationships, endingrelationships, consensus, applyrules
+
+    words = [word.lower() for word in shared["words"]]
+
+    start = time.perf_counter()
+
+    if "index" not in shared:
+        shared["index"] = CorpusIndex(words)
+
+    corpusindex = shared["index"]
+    # The index only depends on the corpus, so it's built once per worker process and lets every batch skip the full scans for stems and endings
+
+    minmatch = max(batch[0]["minmatch"], 1)
+
+    stems, endings = components(words, minmatch, max(batch[0]["cachereq"], minmatch), Reporting.silent, None, corpusindex)
+
+    relreq = max(min(parameters["relreq"] for parameters in batch), 1)
+
+    relset = stemrelationships(words, stems, endings, relreq, Reporting.silent, None, corpusindex) + endingrelationships(words, stems, endings, relreq, Reporting.silent, None, corpusindex)
+
+    rules = consensus(relset)
+
+    outputs = applyrules(words, rules)
+
+    built = (time.perf_counter() - start) / len(batch)
+    # Every configuration in a batch shares its minmatch and cachereq, so the stems and endings are only found once
+    # Pairs are only mined once too (with the lowest relreq in the batch), as those tying together at least [relreq] substrings are a subset of them
+    # Likewise, every rule is only applied once, and each configuration picks out the words generated by the rules it keeps
+
+    known = set(words)
+
+    results = []
+
+    for parameters in batch:
+        start = time.perf_counter()
+
+        kept = []
+        generated = []
+
+        seen = set(known)
+
+        for rel, rule, found in zip(relset, rules, outputs):
+            if len(rel.related) < parameters["relreq"]:
+                continue
+
+            kept.append(list(rule))
+
+            for index, out in found:
+                if out not in seen:
+                    seen.add(out)
+                    generated.append(out)
+
+        results.append((parameters, {"rules": kept, "generated": generated}, built + time.perf_counter() - start))
+
+    return results
+
+def runmdl(batch):
+    from .Indexing import CorpusIndex
+    from .MDLImplementation import Population, entropytable, genetic
+
+    words = shared["words"]
+
+    if "index" not in shared:
+        shared["index"] = CorpusIndex(words)
+    # Every genetic run in a worker process draws its split table from the same index of the corpus
+
+    results = []
+
+    for parameters in batch:
+        start = time.perf_counter()
+
+        arguments = dict(parameters)
+
+        if arguments["entropythreshold"] > 0 and arguments.get("entropies") is None:
+            if "entropies" not in shared:
+                population = Population(words, 1, corpusindex=shared["index"])
+
+                shared["entropies"] = entropytable(population.words, None, population.table)
+
+            arguments["entropies"] = shared["entropies"]
+            # The entropy table only depends on the corpus, so it's built once per worker process
+
+        best = genetic(words, reporter=Reporting.silent, corpusindex=shared["index"], **arguments)
+
+        if best is None:
+            output = None
+        else:
+            output = {"splits": [best.boundary(word) for word in words], "fitness": best.fitnessabsolute()}
+
+        results.append((parameters, output, time.perf_counter() - start))
+
+    return results
+
+runners = {"harris": runharris, "neuvelfulop": runneuvelfulop, "mdl": runmdl}
+
+def batches(algorithm, pending, processes):
+    if algorithm == "harris":
+        return [pending[i::processes] for i in range(min(processes, len(pending)))]
+        # The index is shared by every ESM setting, so each process is given an even share of the configurations (and builds the index once)
+
+    if algorithm == "neuvelfulop":
+        groups = {}
+
+        for parameters in pending:
+            groups.setdefault((parameters["minmatch"], parameters["cachereq"]), []).append(parameters)
+
+        return list(groups.values())
+        # Configurations that only differ in relreq share their stems, endings and pairs
+
+    return [[parameters] for parameters in pending]
+    # Each genetic run is independent (though entropy tables are shared within each process)
+
+# ---------------------------------------------------------------------------------------------------- #
+
+# Runs an algorithm over a corpus with every combination of a grid of parameters, spread across a pool of processes
+# Structures that several configurations need are built once and shared between them (see batches())
+# CORPUS: The corpus to run over (in any form supported by CorpusLoader.words())
+# ALGORITHM: "harris", "neuvelfulop" or "mdl"
+# GRID: A dictionary of lists of values for each parameter to sweep (see "defaults" above for the parameters of each algorithm)
+# PROCESSES: The number of worker processes to use
+    # All available cores are used when set to 0, and configurations are run in this process when set to 1
+# CACHE: The directory to store the result of each configuration in, keyed by the corpus' hash and the parameters
+    # Configurations whose results are already stored there are skipped
+    # Feature disabled when set to None
+# GOLD: A segmentation (see Evaluation.load()) to score the boundaries found by Harris' method or the genetic process against
+    # Feature disabled when set to None
+# REPORTER: The Reporting.Reporter to write progress and results to
+    # Reporting.default is used when set to None
+# Returns a list of the results of each configuration (in the order of the grid)
+def sweep(corpus, algorithm, grid, processes=0, cache=None, gold=None, reporter=None):
+    if algorithm not in runners:
+        print("'" + str(algorithm) + "' is not a recognised algorithm")
+        return None
+
+    if reporter is None:
+        reporter = Reporting.default
+
+    if processes < 1:
+        processes = os.cpu_count() or 1
+
+    words = list(CorpusLoader.words(corpus))
+
+    corpushash = fingerprint(words)
+
+    if cache is not None:
+        os.makedirs(cache, exist_ok=True)
+
+    results = {}
+    pending = []
+
+    for parameters in configurations(algorithm, grid):
+        identifier = key(corpushash, algorithm, parameters)
+
+        if identifier in results:
+            continue
+
+        path = None if cache is None else os.path.join(cache, identifier + ".json")
+
+        if path is not None and os.path.exists(path):
+            with open(path, encoding="utf8") as file:
+                results[identifier] = json.load(file)
+
+            results[identifier]["cached"] = True
+        else:
+            results[identifier] = None
+            pending.append(parameters)
+
+    reporter.log(str(len(results)) + " configuration(s) | " + str(len(results) - len(pending)) + " cached | " + str(len(pending)) + " to run")
+
+    tasks = batches(algorithm, pending, processes)
+
+    if processes == 1 or len(tasks) <= 1:
+        setup(words)
+
+        finished = map(runners[algorithm], tasks)
+        pool = None
+    else:
+        pool = multiprocessing.Pool(min(processes, len(tasks)), setup, (words,))
+
+        finished = pool.imap_unordered(runners[algorithm], tasks)
+
+    c = 0
+
+    for batch in finished:
+        for parameters, output, elapsed in batch:
+            identifier = key(corpushash, algorithm, parameters)
+
+            record = {"algorithm": algorithm, "parameters": parameters, "corpus": corpushash, "output": output, "time": elapsed}
+
+            if cache is not None:
+                path = os.path.join(cache, identifier + ".json")
+
+                with open(path + ".tmp", "w", encoding="utf8") as file:
+                    json.dump(record, file)
+
+                os.replace(path + ".tmp", path)
+                # Results are written as soon as they're finished, so an interrupted sweep loses as little as possible
+
+            record["cached"] = False
+
+            results[identifier] = record
+
+            c += 1
+
+            reporter.progress("configuration(s) run", c, len(pending))
+
+    if pool is not None:
+        pool.close()
+        pool.join()
+
+    if algorithm != "neuvelfulop" and gold is not None:
+        from . import Evaluation
+
+        for record in results.values():
+            if record["output"] is not None:
+                if algorithm == "harris":
+                    boundaries = record["output"]
+                else:
+                    boundaries = [[abs(split)] for split in record["output"]["splits"]]
+
+                record["scores"] = Evaluation.evaluate(gold, dict(zip(words, boundaries)), False)
+        # Scoring is cheap enough to repeat for every result (including cached ones), so scores aren't stored in the cache
+
+    for record in results.values():
+        line = json.dumps(record["parameters"], sort_keys=True) + " | " + str(round(record["time"], 3)) + "s"
+
+        if record["cached"]:
+            line += " (cached)"
+
+        if "scores" in record:
+            line += " | F1 " + str(round(record["scores"]["f1"], 4))
+        elif algorithm == "mdl" and record["output"] is not None:
+            line += " | Fitness " + str(record["output"]["fitness"])
+        elif algorithm == "neuvelfulop":
+            line += " | " + str(len(record["output"]["rules"])) + " rule(s) | " + str(len(record["output"]["generated"])) + " word(s) generated"
+
+        reporter.log(line)
+
+    return list(results.values())
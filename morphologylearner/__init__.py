@@ -0,0 +1,11 @@
+import importlib
+
+modules = ("Benchmark", "Columnar", "CorpusLoader", "Evaluation", "HarrisImplementation", "Indexing", "Instrumentation", "MDLImplementation", "NeuvelFulopImplementation", "Reporting", "Server", "Sharding", "Sweep")
+
+def __getattr__(name):
+    if name in modules:
+        return importlib.import_module("." + name, __name__)
+
+    raise AttributeError("module '" + __name__ + "' has no attribute '" + name + "'")
+    # Imports the package's modules the first time they're accessed
+    # Importing the package itself does no work, so NumPy (and everything else) is only loaded once a module that needs it is used
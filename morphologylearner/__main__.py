@@ -0,0 +1,368 @@
+import argparse
+import contextlib
+import importlib
+import json
+import os
+import sys
+import time
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(prog="morphologylearner", description="Unsupervised learning of word morphology from a corpus of words (one per line).")
+
+    subparsers = parser.add_subparsers(dest="algorithm", required=True)
+
+    verbosity = argparse.ArgumentParser(add_help=False)
+    verbosity.add_argument("-v", "--verbosity", type=int, choices=range(4), default=2, help="0: silent, 1: summaries, 2: progress counters (default), 3: every word, split and individual")
+    verbosity.add_argument("-q", "--quiet", dest="verbosity", action="store_const", const=0, help="same as --verbosity 0")
+
+    common = argparse.ArgumentParser(add_help=False, parents=[verbosity])
+    common.add_argument("input", nargs="?", default="-", help="the corpus file to read (or - for standard input)")
+    common.add_argument("-o", "--output", default="-", help="the file to write results to (or - for standard output)")
+    common.add_argument("--keep-case", action="store_true", help="don't normalise the corpus' words to lowercase")
+    common.add_argument("--stats", default=None, metavar="PATH", help="record instrumentation counters and phase timers and write them to this file as JSON")
+    common.add_argument("--format", choices=("text", "npz", "binary"), default="text", help="write results as lines of text, or as columnar arrays in a NumPy archive or a memory-mappable binary file (with the run's details in [output].json)")
+
+    harris = subparsers.add_parser("harris", parents=[common], help="segment words with Harris' successor-variety method (writes 'word index index ...')")
+    harris.add_argument("--esm", type=int, default=1, help="minimum suffix length for eager suffix matching (0 disables it)")
+    harris.add_argument("--no-frequency-matching", dest="frequencymatching", action="store_false", help="rank eagerly-matched suffixes by length instead of frequency")
+    harris.add_argument("--shards", type=int, default=0, help="split the corpus into this many shards (by first/last letter) and process one at a time, so memory is bounded by the largest shard (0 holds it all in memory)")
+    harris.add_argument("--shard-directory", default=None, help="the directory to keep shards in while they're processed (defaults to the system's temporary directory)")
+
+    neuvelfulop = subparsers.add_parser("neuvel-fulop", parents=[common], help="generate new words from rules mined with Neuvel and Fulop's method (writes one word per line)")
+    neuvelfulop.add_argument("--minmatch", type=int, default=1)
+    neuvelfulop.add_argument("--cachereq", type=int, default=2)
+    neuvelfulop.add_argument("--relreq", type=int, default=3)
+    neuvelfulop.add_argument("--rules", action="store_true", help="write the mined rules instead of the generated words")
+
+    mdl = subparsers.add_parser("mdl", parents=[common], help="segment words with Kazakov's MDL genetic search (writes 'word index')")
+    mdl.add_argument("--popcount", type=int, default=32)
+    mdl.add_argument("--gencount", type=int, default=100)
+    mdl.add_argument("--mutprob", type=float, default=0.01)
+    mdl.add_argument("--tournament-size", type=int, default=8)
+    mdl.add_argument("--fitness-threshold", type=int, default=0)
+    mdl.add_argument("--entropy-threshold", type=float, default=0)
+    mdl.add_argument("--no-seek", dest="seek", action="store_false")
+    mdl.add_argument("--entropies", default=None, help="path of a stored entropy table to reuse (or create)")
+    mdl.add_argument("--local-search", type=int, default=0)
+    mdl.add_argument("--local-passes", type=int, default=1)
+    mdl.add_argument("--plateau", type=int, default=0)
+    mdl.add_argument("--diversity-floor", type=float, default=0)
+    mdl.add_argument("--time-budget", type=float, default=0)
+    mdl.add_argument("--harris-seed", type=float, default=0)
+    mdl.add_argument("--harris-esm", type=int, default=0)
+    mdl.add_argument("--seed", type=int, default=None)
+    mdl.add_argument("--checkpoint", default=None)
+    mdl.add_argument("--checkpoint-interval", type=int, default=10)
+    mdl.add_argument("--sample-size", type=int, default=0)
+    mdl.add_argument("--exact-interval", type=int, default=10)
+    mdl.add_argument("--islands", type=int, default=None, help="evolve this many island populations in parallel (0 uses every core)")
+    mdl.add_argument("--migration-interval", type=int, default=10)
+    mdl.add_argument("--migrants", type=int, default=2)
+
+    entropies = subparsers.add_parser("entropies", parents=[verbosity], help="build the entropy table of a corpus out of memory, for reuse by mdl --entropies")
+    entropies.add_argument("input", nargs="?", default="-", help="the corpus file to read (or - for standard input)")
+    entropies.add_argument("-o", "--output", required=True, help="the file to write the table to (ending in .npz)")
+    entropies.add_argument("--shards", type=int, default=16, help="split the corpus into this many shards (by first/last letter) and process one at a time, so memory is bounded by the largest shard")
+    entropies.add_argument("--shard-directory", default=None, help="the directory to keep shards in while they're processed (defaults to the system's temporary directory)")
+    entropies.add_argument("--stats", default=None, metavar="PATH", help="record instrumentation counters and phase timers and write them to this file as JSON")
+
+    benchmark = subparsers.add_parser("benchmark", parents=[verbosity], help="measure each phase of the algorithms over the bundled corpora (writes the results as JSON)")
+    benchmark.add_argument("-o", "--output", default="-", help="the file to write results to (or - for standard output)")
+    benchmark.add_argument("--languages", nargs="+", default=None, help="the corpus ladders to run over (EnglishCorpus, CornishCorpus)")
+    benchmark.add_argument("--sizes", nargs="+", type=int, default=None, help="the corpus sizes to run over")
+    benchmark.add_argument("--algorithms", nargs="+", choices=("harris", "neuvelfulop", "mdl"), default=("harris", "neuvelfulop", "mdl"))
+    benchmark.add_argument("--timeout", type=float, default=300, help="the number of seconds each run may take before larger corpora are skipped (0 disables it)")
+    benchmark.add_argument("--gencount", type=int, default=10)
+    benchmark.add_argument("--label", default=None, help="a name for the version being measured (defaults to the current commit)")
+    benchmark.add_argument("--directory", default=None, help="the directory the corpora are kept in")
+
+    compare = subparsers.add_parser("compare", parents=[verbosity], help="compare two sets of saved benchmark results and report regressions")
+    compare.add_argument("old")
+    compare.add_argument("new")
+    compare.add_argument("--threshold", type=float, default=1.25, help="the slowdown ratio beyond which a phase counts as a regression")
+
+    evaluate = subparsers.add_parser("evaluate", parents=[verbosity], help="score segmented words (as written by harris or mdl) against gold standard boundaries (writes the scores as JSON)")
+    evaluate.add_argument("gold", help="the gold standard file (such as one of the English corpora)")
+    evaluate.add_argument("input", nargs="?", default="-", help="the segmented words to score (or - for standard input)")
+    evaluate.add_argument("-o", "--output", default="-", help="the file to write results to (or - for standard output)")
+    evaluate.add_argument("--suffixes", type=int, default=20, help="the number of final suffixes to list scores for")
+
+    sweep = subparsers.add_parser("sweep", parents=[verbosity], help="run an algorithm with every combination of a grid of parameters (writes the results as JSON)")
+    sweep.add_argument("method", choices=("harris", "neuvelfulop", "mdl"))
+    sweep.add_argument("input", help="the corpus file to read")
+    sweep.add_argument("-o", "--output", default="-", help="the file to write results to (or - for standard output)")
+    sweep.add_argument("-g", "--grid", nargs="+", default=[], metavar="NAME=VALUE,VALUE,...", help="the values to sweep each parameter over (such as ESM=0,1,2 or frequencymatching=true,false)")
+    sweep.add_argument("--processes", type=int, default=0, help="the number of worker processes (0 uses every core)")
+    sweep.add_argument("--cache", default=None, help="a directory to store results in, so that reruns skip finished configurations")
+    sweep.add_argument("--gold", default=None, help="a gold standard file to score boundaries against")
+
+    serve = subparsers.add_parser("serve", parents=[verbosity], help="prepare the algorithms over a corpus once and answer requests for them over a local socket (one JSON object per line)")
+    serve.add_argument("input", help="the corpus file to read")
+    serve.add_argument("--methods", nargs="+", choices=("harris", "neuvelfulop", "mdl"), default=("harris",), help="the algorithms to prepare")
+    serve.add_argument("-p", "--parameter", nargs="+", default=[], metavar="NAME=VALUE", help="override a parameter of whichever algorithm takes it (such as ESM=2 or gencount=50)")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=0, help="the port to listen on (0 chooses an unused one)")
+    serve.add_argument("--socket", default=None, metavar="PATH", help="listen on a Unix socket at this path instead")
+    serve.add_argument("--batch-size", type=int, default=64, help="the largest number of requests to answer at once")
+    serve.add_argument("--window", type=float, default=2, help="the number of milliseconds to wait for more requests to join a batch")
+    serve.add_argument("--keep-case", action="store_true", help="don't normalise the corpus' (or the requests') words to lowercase")
+
+    arguments = parser.parse_args(arguments)
+    # Only the standard library has been loaded up to this point
+
+    if os.name == "nt":
+        import ctypes
+
+        ctypes.windll.kernel32.SetConsoleMode(ctypes.windll.kernel32.GetStdHandle(-11), 7)
+
+    Reporting = importlib.import_module(".Reporting", __package__)
+
+    reporter = Reporting.Reporter(arguments.verbosity, sys.stderr)
+
+    if arguments.algorithm == "benchmark":
+        Benchmark = importlib.import_module(".Benchmark", __package__)
+
+        results = Benchmark.benchmark(arguments.languages, arguments.sizes, arguments.algorithms, arguments.timeout, {"gencount": arguments.gencount}, arguments.label, arguments.directory or Benchmark.directory, reporter)
+
+        if arguments.output == "-":
+            json.dump(results, sys.stdout, indent=1)
+        else:
+            Benchmark.save(results, arguments.output)
+
+        return
+
+    if arguments.algorithm == "compare":
+        Benchmark = importlib.import_module(".Benchmark", __package__)
+
+        regressions = Benchmark.compare(arguments.old, arguments.new, arguments.threshold, 0.3, reporter)
+
+        sys.exit(1 if len(regressions) > 0 else 0)
+        # Regressions are signalled through the exit status, so that comparisons can gate automated builds
+
+    if arguments.algorithm == "evaluate":
+        Evaluation = importlib.import_module(".Evaluation", __package__)
+
+        gold = Evaluation.load(arguments.gold)
+
+        if arguments.input == "-":
+            predicted = Evaluation.read(sys.stdin)
+        else:
+            predicted = Evaluation.load(arguments.input)
+
+        results = Evaluation.evaluate(gold, predicted)
+
+        Evaluation.report(results, arguments.suffixes, reporter)
+
+        if arguments.output == "-":
+            json.dump(results, sys.stdout, indent=1)
+        else:
+            with open(arguments.output, "w", encoding="utf8") as file:
+                json.dump(results, file, indent=1)
+
+        return
+
+    if arguments.algorithm == "sweep":
+        Sweep = importlib.import_module(".Sweep", __package__)
+        CorpusLoader = importlib.import_module(".CorpusLoader", __package__)
+
+        grid = {}
+
+        for entry in arguments.grid:
+            name, values = entry.split("=", 1)
+
+            grid[name] = [value(text) for text in values.split(",")]
+
+        gold = None
+
+        if arguments.gold is not None:
+            gold = importlib.import_module(".Evaluation", __package__).load(arguments.gold)
+
+        results = Sweep.sweep(CorpusLoader.load(arguments.input), arguments.method, grid, arguments.processes, arguments.cache, gold, reporter)
+
+        if results is None:
+            sys.exit(1)
+
+        if arguments.output == "-":
+            json.dump(results, sys.stdout)
+        else:
+            with open(arguments.output, "w", encoding="utf8") as file:
+                json.dump(results, file)
+
+        return
+
+    if arguments.algorithm == "serve":
+        Server = importlib.import_module(".Server", __package__)
+        CorpusLoader = importlib.import_module(".CorpusLoader", __package__)
+
+        settings = {}
+
+        for entry in arguments.parameter:
+            name, text = entry.split("=", 1)
+
+            for method in arguments.methods:
+                if name in Server.defaults[method]:
+                    settings.setdefault(method, {})[name] = value(text)
+
+        with contextlib.redirect_stdout(sys.stderr):
+            stats = Server.serve(CorpusLoader.load(arguments.input, not arguments.keep_case), arguments.methods, settings, arguments.host, arguments.port, arguments.socket, arguments.batch_size, arguments.window / 1000, reporter)
+
+        if stats is None:
+            sys.exit(1)
+
+        return
+
+    stats = None
+
+    if arguments.stats is not None:
+        stats = importlib.import_module(".Instrumentation", __package__).Stats()
+
+    if arguments.algorithm == "entropies":
+        Sharding = importlib.import_module(".Sharding", __package__)
+
+        if arguments.shards < 1:
+            parser.error("entropy tables need at least one shard")
+
+        Sharding.entropytable(arguments.input, arguments.output, arguments.shards, arguments.shard_directory, reporter, stats)
+
+        if stats is not None:
+            stats.dump(arguments.stats)
+
+            reporter.log(str(stats), Reporting.PROGRESS)
+
+        return
+
+    if arguments.algorithm == "harris" and arguments.shards > 0:
+        corpus = None
+        # Sharded runs read the corpus as they partition it (see outputs())
+
+        if arguments.format != "text":
+            parser.error("sharded runs can only write text (as their results are never held in memory)")
+    else:
+        CorpusLoader = importlib.import_module(".CorpusLoader", __package__)
+
+        if arguments.input == "-":
+            corpus = CorpusLoader.read(sys.stdin, not arguments.keep_case)
+        else:
+            corpus = CorpusLoader.load(arguments.input, not arguments.keep_case)
+
+    if arguments.format != "text":
+        if arguments.output == "-":
+            parser.error("columnar formats must be written to a file (with -o)")
+
+        Columnar = importlib.import_module(".Columnar", __package__)
+
+        metadata = {"algorithm": arguments.algorithm, "parameters": {name: setting for name, setting in vars(arguments).items() if name not in ("algorithm", "input", "output", "verbosity", "stats", "format")}, "input": arguments.input}
+
+        start = time.perf_counter()
+
+        with contextlib.redirect_stdout(sys.stderr):
+            found = list(outputs(arguments, corpus, reporter, stats, metadata))
+
+        metadata["time"] = time.perf_counter() - start
+
+        path = arguments.output
+
+        if arguments.format == "npz" and not path.endswith(".npz"):
+            path += ".npz"
+        # Archives are told apart from the binary format by their extension
+
+        if arguments.algorithm == "neuvel-fulop":
+            Columnar.save(path, [word for word, boundaries in found], None, metadata)
+        else:
+            Columnar.save(path, [word for word, boundaries in found], [boundaries for word, boundaries in found], metadata)
+        # Run details (such as the time taken and the best fitness found) are kept in the sidecar file rather than mixed in with the results
+    else:
+        if arguments.output == "-":
+            output = sys.stdout
+        else:
+            output = open(arguments.output, "w", encoding="utf8")
+
+        with output, contextlib.redirect_stdout(sys.stderr):
+            # Progress reports (and errors) are sent to standard error so that standard output only carries results
+            for line in run(arguments, corpus, reporter, stats):
+                output.write(line + "\n")
+
+    if stats is not None:
+        stats.dump(arguments.stats)
+
+        reporter.log(str(stats), Reporting.PROGRESS)
+
+def value(text):
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+    # Reads a parameter value given on the command line as a number, true, false or null (or otherwise as a string)
+
+def run(arguments, corpus, reporter, stats=None):
+    for word, boundaries in outputs(arguments, corpus, reporter, stats):
+        if boundaries is None:
+            yield word
+        else:
+            yield " ".join([word] + [str(index) for index in boundaries])
+    # Runs the selected algorithm over a corpus and yields each line of its results as soon as it's available
+
+def outputs(arguments, corpus, reporter, stats=None, metadata=None):
+    if arguments.algorithm == "harris" and arguments.shards > 0:
+        Sharding = importlib.import_module(".Sharding", __package__)
+
+        yield from Sharding.harris(arguments.input, arguments.esm, arguments.frequencymatching, arguments.shards, arguments.shard_directory, not arguments.keep_case, reporter, stats)
+    elif arguments.algorithm == "harris":
+        HarrisImplementation = importlib.import_module(".HarrisImplementation", __package__)
+
+        splits = HarrisImplementation.Harris(corpus, arguments.esm, arguments.frequencymatching, None, reporter, stats)
+
+        for word in corpus.words:
+            yield word, splits[word]
+    elif arguments.algorithm == "neuvel-fulop":
+        NeuvelFulopImplementation = importlib.import_module(".NeuvelFulopImplementation", __package__)
+
+        relset = NeuvelFulopImplementation.relationships(corpus, arguments.minmatch, arguments.cachereq, arguments.relreq, reporter, stats)
+
+        rules = NeuvelFulopImplementation.consensus(relset)
+
+        if metadata is not None:
+            metadata["rules"] = [list(rule) for rule in rules]
+
+        if arguments.rules:
+            for rule in rules:
+                yield str(rule), None
+        else:
+            words = [word.lower() for word in corpus.words]
+
+            known = set(words)
+
+            Reporting = importlib.import_module(".Reporting", __package__)
+
+            detail = reporter.enabled(Reporting.DETAIL)
+
+            for rule, found in zip(rules, NeuvelFulopImplementation.applyrules(words, rules, stats)):
+                for index, out in found:
+                    if detail:
+                        reporter.log(words[index] + " → " + out + " | " + str(rule), Reporting.DETAIL)
+
+                    if out not in known:
+                        known.add(out)
+
+                        yield out, None
+    else:
+        MDLImplementation = importlib.import_module(".MDLImplementation", __package__)
+
+        if arguments.islands is not None:
+            best = MDLImplementation.islands(corpus.encoded(), arguments.islands, arguments.migration_interval, arguments.migrants, arguments.popcount, arguments.gencount, arguments.mutprob, arguments.tournament_size, arguments.fitness_threshold, arguments.entropy_threshold, arguments.seek, arguments.entropies, arguments.seed, reporter)
+        else:
+            best = MDLImplementation.genetic(corpus.encoded(), arguments.popcount, arguments.gencount, arguments.mutprob, arguments.tournament_size, arguments.fitness_threshold, arguments.entropy_threshold, arguments.seek, arguments.entropies, arguments.local_search, arguments.local_passes, arguments.plateau, arguments.diversity_floor, arguments.time_budget, arguments.harris_seed, arguments.harris_esm, arguments.seed, arguments.checkpoint, arguments.checkpoint_interval, arguments.sample_size, arguments.exact_interval, reporter, stats)
+
+        if best is None:
+            return
+
+        if metadata is not None:
+            metadata["fitness"] = best.fitnessabsolute()
+
+        for word in corpus.words:
+            yield word, [best.boundaryabsolute(word)]
+    # Runs the selected algorithm over a corpus and yields each word it produces with its boundaries (or None for words generated by Neuvel and Fulop's rules)
+    # Details of the run (such as the mined rules or the best fitness found) are added to [METADATA] when it's given
+
+if __name__ == "__main__":
+    main()
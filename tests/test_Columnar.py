@@ -0,0 +1,77 @@
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+import numpy as np
+from morphologylearner import Columnar, CorpusLoader, HarrisImplementation, MDLImplementation, Reporting
+
+directory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+class RoundTripTest(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.corpus = CorpusLoader.load(os.path.join(directory, "CornishCorpus", "CornishCorpus500.txt"))
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def roundtrip(self, name, words, boundaries=None, metadata=None, mapped=True):
+        path = os.path.join(self.folder.name, name)
+
+        Columnar.save(path, words, boundaries, metadata)
+
+        results = Columnar.load(path, mapped)
+
+        self.assertTrue(os.path.exists(path + ".json"))
+        self.assertFalse(os.path.exists(path + ".tmp"))
+
+        return results
+
+    def test_harris(self):
+        splits = HarrisImplementation.Harris(self.corpus, 1, True, None, Reporting.silent)
+
+        for name, mapped in (("harris.bin", True), ("harris.bin", False), ("harris.npz", True)):
+            with self.subTest(name=name, mapped=mapped):
+                results = self.roundtrip(name, self.corpus.words, splits, {"algorithm": "harris"}, mapped)
+
+                self.assertEqual(results.words(), self.corpus.words)
+                self.assertEqual(results.boundaries(), splits)
+                self.assertEqual(results.word(3), self.corpus.words[3])
+                self.assertEqual(results.metadata, {"algorithm": "harris", "words": len(self.corpus.words)})
+
+                del results
+
+    def test_genetic(self):
+        best = MDLImplementation.genetic(self.corpus.words, 8, 3, 0.01, 4, 0, 0, True, rng=0, reporter=Reporting.silent)
+
+        results = self.roundtrip("mdl.bin", best)
+
+        self.assertEqual(results.words(), best.wordlist())
+        self.assertEqual(results.boundaries(), {word: [best.boundaryabsolute(word)] for word in best.wordlist()})
+
+    def test_words_only(self):
+        words = ["ÿn", "kernewek", "", "tasek", "ŵy", "gwrës"]
+        # Multi-byte characters (and empty words) must keep their offsets
+
+        results = self.roundtrip("words.bin", words)
+
+        self.assertEqual(results.words(), words)
+        self.assertIsNone(results.splits)
+        self.assertEqual(len(results), len(words))
+
+    def test_columns_match(self):
+        columns = Columnar.columns(["ab", "cde"], [[1], [1, 2]])
+
+        self.assertTrue(np.array_equal(columns.wordoffsets, [0, 2, 5]))
+        self.assertTrue(np.array_equal(columns.splitoffsets, [0, 1, 3]))
+        self.assertTrue(np.array_equal(columns.splits, [1, 1, 2]))
+
+    def test_rejects_other_files(self):
+        path = os.path.join(self.folder.name, "other.bin")
+
+        with open(path, "wb") as file:
+            file.write(b"not columns")
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertIsNone(Columnar.load(path))
@@ -0,0 +1,87 @@
+import io
+import os
+import tempfile
+import unittest
+from morphologylearner import CorpusLoader, HarrisImplementation, MDLImplementation, Reporting
+
+text = "Walking 4\n\nwalked 4\nWALKING\n   \nnaïve 2\ntalks\r\nwalked\nNaïve\n"
+
+class LoadTest(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.folder.name, "corpus.txt")
+
+        with open(self.path, "w", encoding="utf8", newline="") as file:
+            file.write(text)
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def test_normalised(self):
+        corpus = CorpusLoader.load(self.path)
+
+        self.assertEqual(corpus.words, ["walking", "walked", "naïve", "talks"])
+        self.assertEqual(corpus.frequencies, [2, 2, 2, 1])
+        self.assertTrue(corpus.lowercase)
+        # Words are lowercased and kept once each (in the order they were first seen), with the boundary indexes and blank lines left out
+
+    def test_keep_case(self):
+        corpus = CorpusLoader.load(self.path, False)
+
+        self.assertEqual(corpus.words, ["Walking", "walked", "WALKING", "naïve", "talks", "Naïve"])
+        self.assertFalse(corpus.lowercase)
+
+    def test_sources_agree(self):
+        corpus = CorpusLoader.load(self.path)
+
+        for other in (CorpusLoader.load(self.path, True, True), CorpusLoader.read(io.StringIO(text))):
+            self.assertEqual(other.words, corpus.words)
+            self.assertEqual(other.frequencies, corpus.frequencies)
+        # Memory-mapped files and open text files are read in exactly the same way
+
+    def test_empty(self):
+        path = os.path.join(self.folder.name, "empty.txt")
+
+        open(path, "w").close()
+
+        self.assertEqual(CorpusLoader.load(path, True, True).words, [])
+
+class EncodeTest(unittest.TestCase):
+    def test_roundtrip(self):
+        words = ["naïve", "café", "ŵy", "", "kernewek"]
+
+        encoded = CorpusLoader.encode(words)
+
+        self.assertEqual(encoded.words(), words)
+        self.assertEqual([encoded.word(i) for i in range(len(words))], words)
+        self.assertEqual(encoded.lengths().tolist(), [len(word) for word in words])
+        self.assertEqual(len(encoded.alphabet), len(set("".join(words))))
+        # The alphabet holds exactly the characters that appear in the words, however they're encoded in UTF-8
+
+    def test_cached(self):
+        corpus = CorpusLoader.read(io.StringIO(text))
+
+        self.assertIs(corpus.encoded(), corpus.encoded())
+        self.assertEqual(corpus.encoded().frequencies.tolist(), corpus.frequencies)
+
+    def test_words(self):
+        corpus = CorpusLoader.read(io.StringIO(text))
+
+        for form in (corpus, corpus.encoded(), corpus.words, " ".join(corpus.words)):
+            self.assertEqual(list(CorpusLoader.words(form)), corpus.words)
+        # Every supported form of a corpus gives the same words
+
+class AlgorithmsTest(unittest.TestCase):
+    def test_forms_agree(self):
+        corpus = CorpusLoader.read(io.StringIO("walking\nwalked\nwalks\ntalking\ntalked\ntalks\njumping\njumped\n"))
+
+        splits = HarrisImplementation.Harris(corpus, 1, True, None, Reporting.silent)
+
+        self.assertEqual(HarrisImplementation.Harris(corpus.words, 1, True, None, Reporting.silent), splits)
+        self.assertEqual(HarrisImplementation.Harris(corpus.encoded(), 1, True, None, Reporting.silent), splits)
+
+        best = MDLImplementation.genetic(corpus.encoded(), 8, 3, 0.01, 4, 0, 0, True, rng=0, reporter=Reporting.silent)
+        other = MDLImplementation.genetic(corpus.words, 8, 3, 0.01, 4, 0, 0, True, rng=0, reporter=Reporting.silent)
+
+        self.assertEqual(best.splitlist(), other.splitlist())
+        # The algorithms give the same results whichever form of the corpus they're given
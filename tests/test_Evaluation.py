@@ -0,0 +1,95 @@
+import io
+import os
+import tempfile
+import unittest
+from morphologylearner import Columnar, CorpusLoader, Evaluation, HarrisImplementation, MDLImplementation, Reporting
+
+directory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+class ScoreTest(unittest.TestCase):
+    def setUp(self):
+        self.gold = Evaluation.read(io.StringIO("walking 4\ntalked 4\nunkind 2\ncat 0\nWalking 2\n"))
+
+    def test_parsed(self):
+        self.assertEqual(self.gold.words, ("walking", "talked", "unkind", "cat"))
+        self.assertEqual(self.gold.boundaries(), {"walking": [4], "talked": [4], "unkind": [2], "cat": []})
+        # Repeated words keep their first boundaries, and the 0 marking a word without one is ignored
+
+    def test_perfect(self):
+        results = Evaluation.evaluate(self.gold, self.gold.boundaries())
+
+        self.assertEqual((results["tp"], results["fp"], results["fn"]), (3, 0, 0))
+        self.assertEqual((results["precision"], results["recall"], results["f1"]), (1.0, 1.0, 1.0))
+
+    def test_counts(self):
+        results = Evaluation.evaluate(self.gold, {"walking": [4, 6], "talked": [3], "cat": [1], "other": [2]})
+
+        self.assertEqual((results["tp"], results["fp"], results["fn"]), (1, 3, 2))
+        self.assertAlmostEqual(results["precision"], 1 / 4)
+        self.assertAlmostEqual(results["recall"], 1 / 3)
+        self.assertAlmostEqual(results["f1"], 2 / 7)
+        # Words outside the reference are ignored, and every other boundary is scored against the reference's
+
+    def test_out_of_range(self):
+        results = Evaluation.evaluate(self.gold, [[0, 4, 7], [6], [2, 9], [3]])
+
+        self.assertEqual((results["tp"], results["fp"], results["fn"]), (2, 0, 1))
+        # Boundaries at (or beyond) the ends of a word are ignored
+
+    def test_breakdowns(self):
+        results = Evaluation.evaluate(self.gold, {"walking": [4], "talked": [2], "unkind": [2]})
+
+        self.assertEqual(results["lengths"][7], {"tp": 1, "fp": 0, "fn": 0, "precision": 1.0, "recall": 1.0, "f1": 1.0})
+        self.assertEqual((results["lengths"][6]["tp"], results["lengths"][6]["fp"], results["lengths"][6]["fn"]), (1, 1, 1))
+        self.assertEqual(set(results["suffixes"]), {"ing", "ed", "kind", ""})
+        self.assertEqual(results["suffixes"]["ed"]["fn"], 1)
+        # Boundaries are grouped by the length and the final gold suffix of the word they're found in
+
+    def test_empty(self):
+        results = Evaluation.evaluate(self.gold, {})
+
+        self.assertEqual((results["precision"], results["recall"], results["f1"]), (0.0, 0.0, 0.0))
+
+class OutputsTest(unittest.TestCase):
+    def setUp(self):
+        self.gold = Evaluation.load(os.path.join(directory, "EnglishCorpus", "EnglishCorpus500.txt"))
+        self.corpus = CorpusLoader.load(os.path.join(directory, "EnglishCorpus", "EnglishCorpus500.txt"))
+
+    def test_matches_counting(self):
+        splits = HarrisImplementation.Harris(self.corpus, 1, True, None, Reporting.silent)
+        gold = self.gold.boundaries()
+
+        tp = sum(len(set(splits[word]) & set(gold[word])) for word in gold)
+        fp = sum(len(set(position for position in splits[word] if 0 < position < len(word)) - set(gold[word])) for word in gold)
+        fn = sum(len(set(gold[word]) - set(splits[word])) for word in gold)
+
+        results = Evaluation.evaluate(self.gold, splits, False)
+
+        self.assertEqual((results["tp"], results["fp"], results["fn"]), (tp, fp, fn))
+        self.assertNotIn("lengths", results)
+        # The masked counts agree with comparing every word's boundaries one at a time
+
+    def test_forms_agree(self):
+        splits = HarrisImplementation.Harris(self.corpus, 1, True, None, Reporting.silent)
+        expected = Evaluation.evaluate(self.gold, splits)
+
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "harris.bin")
+
+            Columnar.save(path, self.corpus.words, splits)
+
+            columnar = Columnar.load(path)
+
+            for output in (Evaluation.Segmentation(self.corpus.words, [splits[word] for word in self.corpus.words]), columnar, [splits[word] for word in self.gold.words]):
+                self.assertEqual(Evaluation.evaluate(self.gold, output), expected)
+
+            del columnar
+        # Every form of output is scored in the same way
+
+    def test_genetic(self):
+        best = MDLImplementation.genetic(self.corpus.words, 8, 3, 0.01, 4, 0, 0, True, rng=0, reporter=Reporting.silent)
+
+        splits = {word: [best.boundaryabsolute(word)] for word in best.wordlist()}
+
+        self.assertEqual(Evaluation.evaluate(self.gold, best), Evaluation.evaluate(self.gold, splits))
+        # Individuals are scored by their single boundary in each word
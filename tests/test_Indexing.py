@@ -0,0 +1,66 @@
+import os
+import unittest
+from morphologylearner import CorpusLoader, HarrisImplementation, Indexing, NeuvelFulopImplementation, Reporting
+
+directory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+class TrieTest(unittest.TestCase):
+    def setUp(self):
+        self.words = CorpusLoader.load(os.path.join(directory, "CornishCorpus", "CornishCorpus1000.txt")).words + ["Walking", "WALKED", "walks", "naïve", "Naïvety"]
+        # Mixed case and repeated words are normalised alike by both
+
+        self.root = HarrisImplementation.trie(self.words)
+        self.corpusindex = Indexing.CorpusIndex(self.words)
+
+    def test_distribution(self):
+        for word in self.words:
+            self.assertEqual(self.corpusindex.distribution(word), self.root.distribution(word), word)
+            self.assertEqual(self.corpusindex.finalbranch(word), self.root.finalbranch(word), word)
+        # The index gives every word the same branching factors (and final branch) as the trie
+
+    def test_prefixes(self):
+        for word in self.words[::7]:
+            for k in range(1, len(word)):
+                self.assertEqual(self.corpusindex.distribution(word[:k]), self.root.distribution(word[:k]))
+                self.assertEqual(self.corpusindex.distribution(word[:k].upper()), self.root.distribution(word[:k].upper()))
+        # Prefixes that aren't words themselves are looked up through their stem IDs, whatever their case
+
+    def test_unseen(self):
+        self.assertEqual(self.corpusindex.distribution("walkzzz"), self.corpusindex.distribution("walk"))
+        self.assertEqual(self.corpusindex.distribution("qqq"), [])
+        # Distributions stop at the longest prefix that the corpus holds
+
+    def test_harris(self):
+        corpus = CorpusLoader.load(os.path.join(directory, "EnglishCorpus", "EnglishCorpus1000.txt"))
+
+        for ESM in (0, 1, 3):
+            with self.subTest(ESM=ESM):
+                self.assertEqual(HarrisImplementation.Harris(corpus.words, ESM, True, Indexing.CorpusIndex(corpus.words), Reporting.silent), HarrisImplementation.Harris(corpus.words, ESM, True, HarrisImplementation.trie(corpus.words), Reporting.silent))
+        # Harris' method finds the same splits from either
+
+class PostingsTest(unittest.TestCase):
+    def setUp(self):
+        self.corpusindex = Indexing.CorpusIndex(CorpusLoader.load(os.path.join(directory, "EnglishCorpus", "EnglishCorpus500.txt")))
+
+    def test_holding(self):
+        words = self.corpusindex.words
+
+        for stem, suffix in (("a", None), (None, "ing"), ("re", "ed"), ("zzz", None), (None, None)):
+            expected = [j for j, word in enumerate(words) if (stem is not None and word.startswith(stem)) or (suffix is not None and word.endswith(suffix))]
+
+            self.assertEqual(self.corpusindex.holding(stem, suffix).tolist(), expected)
+        # The postings hold every word starting with a stem or ending with a suffix, in corpus order
+
+    def test_counts(self):
+        for stem in ("a", "un", "the"):
+            self.assertEqual(int(self.corpusindex.stemcounts[self.corpusindex.stemids[stem]]), sum(word.startswith(stem) for word in self.corpusindex.words))
+
+class ComponentsTest(unittest.TestCase):
+    def test_index_agrees(self):
+        words = CorpusLoader.load(os.path.join(directory, "EnglishCorpus", "EnglishCorpus500.txt")).words
+
+        expected = NeuvelFulopImplementation.components(words, 2, 4, Reporting.silent)
+        found = NeuvelFulopImplementation.components(words, 2, 4, Reporting.silent, None, Indexing.CorpusIndex(words))
+
+        self.assertEqual(found, expected)
+        # Components drawn from the index are the same as those found by comparing every pair of words
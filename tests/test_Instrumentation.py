@@ -0,0 +1,116 @@
+import json
+import os
+import tempfile
+import unittest
+from morphologylearner import CorpusLoader, HarrisImplementation, Instrumentation, MDLImplementation, NeuvelFulopImplementation, Reporting
+
+directory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def nodes(node):
+    return 1 + sum(nodes(child) for child in node.successors)
+    # Counts the nodes of a trie
+
+class StatsTest(unittest.TestCase):
+    def test_rates(self):
+        stats = Instrumentation.Stats()
+
+        stats.count("stemcache.hits", 3)
+        stats.count("stemcache.misses")
+        stats.count("esm.attempts", 10)
+        stats.count("esm.matches", 4)
+        stats.count("trie.nodes", 50)
+        stats.time("trie", 2)
+
+        rates = stats.rates()
+
+        self.assertEqual(rates["stemcache.hitrate"], 0.75)
+        self.assertEqual(rates["esm.matchrate"], 0.4)
+        self.assertEqual(rates["trie.nodes.persecond"], 25)
+        self.assertNotIn("esm.attempts.persecond", rates)
+        # Throughputs are only derived for subjects with a timer
+
+    def test_lap(self):
+        stats = Instrumentation.Stats()
+
+        mark = stats.lap("first", 0)
+
+        self.assertEqual(stats.timers["first"], mark)
+        self.assertGreaterEqual(stats.lap("second", mark), mark)
+
+    def test_dump(self):
+        stats = Instrumentation.Stats()
+
+        stats.count("applyrule.attempts", 2)
+        stats.time("applyrules", 0.5)
+
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "stats.json")
+
+            stats.dump(path)
+
+            with open(path, encoding="utf8") as file:
+                self.assertEqual(json.load(file), stats.record())
+
+        self.assertIn("applyrule.attempts: 2", str(stats))
+
+    def test_counting(self):
+        stats = Instrumentation.Stats()
+
+        counted = Instrumentation.counting(HarrisImplementation.HarrisNode, stats, {"__init__": "trie.nodes"})
+
+        root = counted.start()
+        root.appendstrings(["walk", "walks"])
+
+        self.assertEqual(stats.counters["trie.nodes"], nodes(root))
+        self.assertIsNot(counted, HarrisImplementation.HarrisNode)
+        self.assertIsInstance(root.successors[0], counted)
+        # Every node made by a counting trie is counted, and its children are counted too
+
+class MethodsTest(unittest.TestCase):
+    def setUp(self):
+        self.words = CorpusLoader.load(os.path.join(directory, "EnglishCorpus", "EnglishCorpus500.txt")).words
+
+    def test_harris(self):
+        stats = Instrumentation.Stats()
+
+        root = HarrisImplementation.trie(self.words, stats)
+
+        self.assertEqual(stats.counters["trie.nodes"], nodes(root))
+
+        splits = HarrisImplementation.Harris(self.words, 1, True, root, Reporting.silent, stats)
+
+        self.assertEqual(splits, HarrisImplementation.Harris(self.words, 1, True, None, Reporting.silent))
+        self.assertEqual(stats.counters["esm.attempts"], sum(1 for word in self.words if len(word) > 1))
+        self.assertLessEqual(stats.counters["esm.matches"], stats.counters["esm.attempts"])
+        self.assertGreater(stats.counters["trie.lookups"], 0)
+        # Recording stats leaves the splits unchanged
+
+    def test_index(self):
+        stats = Instrumentation.Stats()
+
+        corpusindex = HarrisImplementation.index(self.words, stats)
+
+        self.assertEqual(stats.counters["index.stems"], len(corpusindex.stemids))
+        self.assertEqual(stats.counters["index.suffixes"], len(corpusindex.suffixids))
+        self.assertIn("index", stats.timers)
+
+    def test_neuvelfulop(self):
+        stats = Instrumentation.Stats()
+
+        found = NeuvelFulopImplementation.relationships(self.words, 1, 2, 1, Reporting.silent, stats)
+
+        self.assertEqual([str(rel) for rel in found], [str(rel) for rel in NeuvelFulopImplementation.relationships(self.words, 1, 2, 1, Reporting.silent)])
+        self.assertGreater(stats.counters["stempairs.evaluated"], 0)
+        self.assertEqual(stats.counters["stempairs.related"] + stats.counters["endingpairs.related"], len(found))
+
+    def test_genetic(self):
+        stats = Instrumentation.Stats()
+
+        best = MDLImplementation.genetic(self.words, 8, 5, 0.01, 4, 0, 0, True, rng=1, reporter=Reporting.silent, stats=stats)
+
+        self.assertEqual(stats.counters["generations"], len(MDLImplementation.statslist))
+        # Every generation recorded (including the first, random one) is counted
+
+        self.assertEqual(best.splitlist(), MDLImplementation.genetic(self.words, 8, 5, 0.01, 4, 0, 0, True, rng=1, reporter=Reporting.silent).splitlist())
+        self.assertGreater(stats.counters["fitness.evaluations"], 0)
+        self.assertGreater(stats.timers["fitness"], 0)
@@ -0,0 +1,170 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+import numpy as np
+from morphologylearner import CorpusLoader, Instrumentation, MDLImplementation, Reporting
+
+directory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+class Interrupted(Exception):
+    pass
+
+def records():
+    return [{name: value for name, value in record.items() if name != "time"} for record in MDLImplementation.statslist]
+    # Returns the statistics of the latest genetic process, leaving out the time taken (which differs between runs)
+
+class EntropyTableTest(unittest.TestCase):
+    def test_matches_collectiveentropy(self):
+        words = CorpusLoader.load(os.path.join(directory, "EnglishCorpus", "EnglishCorpus100.txt")).words + ["naïve", "naïvety", "café", "cafés"]
+
+        table = MDLImplementation.entropytable(words)
+
+        for i, word in enumerate(words):
+            for index in range(len(word) + 1):
+                self.assertAlmostEqual(float(table.collective([i], [index])[0]), MDLImplementation.collectiveentropy(words, word, index), 9)
+        # The one-pass table gives the same collective entropies as working each of them out from the corpus
+
+    def test_reused(self):
+        corpus = CorpusLoader.load(os.path.join(directory, "CornishCorpus", "CornishCorpus500.txt"))
+
+        with tempfile.TemporaryDirectory() as folder:
+            for name in ("entropies", "entropies.npz"):
+                with self.subTest(name=name):
+                    stats = Instrumentation.Stats()
+
+                    first = MDLImplementation.entropytable(corpus, os.path.join(folder, name), None, stats)
+                    second = MDLImplementation.entropytable(corpus, os.path.join(folder, name), None, stats)
+
+                    self.assertEqual(stats.counters["entropytable.misses"], 1)
+                    self.assertEqual(stats.counters["entropytable.hits"], 1)
+                    self.assertTrue((first.values == second.values).all())
+                    # Stored tables are found again whether or not their path ends in ".npz"
+
+    def test_other_corpus(self):
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "entropies.npz")
+
+            MDLImplementation.entropytable(["walking", "walked"], path)
+
+            stats = Instrumentation.Stats()
+
+            with mock.patch("builtins.print"):
+                table = MDLImplementation.entropytable(["talking", "talked"], path, None, stats)
+
+            self.assertEqual(stats.counters["entropytable.misses"], 1)
+            self.assertEqual(table.words, ["talking", "talked"])
+            # A table stored for another corpus is rebuilt rather than reused
+
+class IslandsTest(unittest.TestCase):
+    def test_entropies_shared(self):
+        corpus = CorpusLoader.load(os.path.join(directory, "EnglishCorpus", "EnglishCorpus100.txt"))
+
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "entropies")
+
+            best = MDLImplementation.islands(corpus.words, 2, 2, 1, 8, 4, 0.01, 4, 0, 0.5, True, path, 1, Reporting.silent)
+
+            self.assertIsNotNone(best)
+            self.assertEqual(best.wordlist(), corpus.words)
+            self.assertTrue(os.path.exists(path))
+            # The coordinating process stores the table once, at the path given
+
+    def test_seeded(self):
+        corpus = CorpusLoader.load(os.path.join(directory, "EnglishCorpus", "EnglishCorpus100.txt"))
+
+        first = MDLImplementation.islands(corpus.words, 2, 2, 1, 8, 4, 0.01, 4, 0, 0, True, None, 7, Reporting.silent)
+        second = MDLImplementation.islands(corpus.words, 2, 2, 1, 8, 4, 0.01, 4, 0, 0, True, None, 7, Reporting.silent)
+
+        self.assertEqual(first.splitlist(), second.splitlist())
+        self.assertEqual(first.fitnessabsolute(), max(MDLImplementation.bestlist))
+        # Islands seeded alike evolve alike, and the individual returned is the healthiest one recorded
+
+    def test_no_fitness(self):
+        with mock.patch("builtins.print"):
+            best = MDLImplementation.islands(["a", "b"], 2, 2, 1, 4, 3, 0.01, 2, 0, 0, True, None, 1, Reporting.silent)
+
+        self.assertIsNone(best)
+        # Islands that never find a healthy individual are skipped rather than crashing the coordinating process
+
+class CheckpointTest(unittest.TestCase):
+    def setUp(self):
+        self.corpus = CorpusLoader.load(os.path.join(directory, "EnglishCorpus", "EnglishCorpus1000.txt"))
+        self.folder = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.folder.name, "checkpoint.npz")
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def arguments(self, **settings):
+        return dict(dict(popcount=16, gencount=25, mutprob=0.01, tournamentsize=4, fitnessthreshold=0, entropythreshold=0, seek=True, rng=3, reporter=Reporting.silent), **settings)
+
+    def interrupt(self, generation, **arguments):
+        save = MDLImplementation.savecheckpoint
+
+        def interrupted(*arguments):
+            save(*arguments)
+
+            if arguments[2] == generation:
+                raise Interrupted()
+        # Stop the process straight after it saves its checkpoint at the given generation
+
+        with mock.patch.object(MDLImplementation, "savecheckpoint", interrupted):
+            with self.assertRaises(Interrupted):
+                MDLImplementation.genetic(self.corpus.words, checkpoint=self.path, checkpointinterval=5, **arguments)
+
+    def resume(self, **settings):
+        arguments = self.arguments(**settings)
+
+        best = MDLImplementation.genetic(self.corpus.words, **arguments)
+        expected = records()
+
+        self.interrupt(10, **arguments)
+
+        resumed = MDLImplementation.genetic(self.corpus.words, checkpoint=self.path, checkpointinterval=5, **arguments)
+
+        self.assertEqual(records(), expected)
+        self.assertEqual(resumed.splitlist(), best.splitlist())
+        # A resumed process records the same statistics and finds the same individual as one that was never interrupted
+
+    def test_seeded(self):
+        first = MDLImplementation.genetic(self.corpus.words, **self.arguments(gencount=10))
+        second = MDLImplementation.genetic(self.corpus.words, **self.arguments(gencount=10))
+
+        self.assertEqual(first.splitlist(), second.splitlist())
+
+    def test_resume(self):
+        self.resume()
+
+    def test_resume_entropic(self):
+        self.resume(entropythreshold=0.5)
+
+    def test_resume_sampled(self):
+        self.resume(samplesize=200, exactinterval=7)
+        # The calibration of sampled fitness estimates is restored along with everything else
+
+    def test_resume_finished(self):
+        self.interrupt(20, **self.arguments())
+
+        best = MDLImplementation.genetic(self.corpus.words, checkpoint=self.path, **self.arguments(gencount=15))
+
+        self.assertIsNotNone(best)
+        self.assertEqual(best.fitnessabsolute(), max(MDLImplementation.bestlist))
+        # Resuming a checkpoint taken beyond the requested generations returns the healthiest individual it holds
+
+class SampleTest(unittest.TestCase):
+    def test_estimate(self):
+        population = MDLImplementation.Population(CorpusLoader.load(os.path.join(directory, "CornishCorpus", "CornishCorpus500.txt")), 8, None, 0)
+
+        everything = np.arange(len(population.words))
+
+        self.assertTrue(np.allclose(population.table.estimate(population.splits, everything), population.fitnesses()))
+        # A sample of every word estimates each individual's fitness exactly
+
+    def test_rotation(self):
+        population = MDLImplementation.Population(["walking", "walked", "talking", "talked", "walks", "talks"], 2, None, 0)
+
+        columns = np.concatenate([population.sample(2) for i in range(3)])
+
+        self.assertEqual(sorted(columns.tolist()), list(range(6)))
+        # Every word is sampled once before any word is sampled again
@@ -0,0 +1,85 @@
+import os
+import unittest
+from morphologylearner import CorpusLoader, Instrumentation, NeuvelFulopImplementation, Reporting
+
+directory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def mined(name, minmatch, cachereq, relreq):
+    words = CorpusLoader.load(os.path.join(directory, name)).words
+
+    return words, NeuvelFulopImplementation.relationships(words, minmatch, cachereq, relreq, Reporting.silent)
+    # Loads a corpus and the relationships found across it
+
+class ApplyRulesTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(ApplyRulesTest):
+        ApplyRulesTest.words, relset = mined(os.path.join("CornishCorpus", "CornishCorpus1000.txt"), 2, 2, 1)
+
+        ApplyRulesTest.rules = [rel.rule() for rel in relset] + [("*##ceive", "*##ception"), ("*###ed", "*###ing"), ("ŵ#", "w#")]
+        # Alongside the rules mined from the corpus are some of Neuvel and Fulop's own (and a non-ASCII one)
+
+        ApplyRulesTest.words += ["receive", "deceive", "conception", "walked", "talking", "ŵy", "a"]
+
+    def test_matches_applyrule(self):
+        results = NeuvelFulopImplementation.applyrules(self.words, self.rules)
+
+        self.assertEqual(len(results), len(self.rules))
+
+        for rule, found in zip(self.rules, results):
+            expected = [(index, NeuvelFulopImplementation.applyrule(word, rule, Reporting.silent)) for index, word in enumerate(self.words)]
+
+            self.assertEqual(found, [(index, out) for index, out in expected if out is not None], rule)
+        # Every rule transforms the same words (in the same order) into the same outputs as applying it to one word at a time
+
+    def test_compiled(self):
+        compiled = NeuvelFulopImplementation.compilerules(self.rules)
+
+        self.assertIs(NeuvelFulopImplementation.compilerules(compiled)[0], compiled[0])
+        self.assertEqual(NeuvelFulopImplementation.applyrules(self.words, compiled), NeuvelFulopImplementation.applyrules(self.words, self.rules))
+        # Rules compiled in advance are used as they are
+
+    def test_stats(self):
+        stats = Instrumentation.Stats()
+
+        results = NeuvelFulopImplementation.applyrules(self.words, self.rules, stats)
+
+        self.assertEqual(stats.counters["applyrules.matches"], sum(len(found) for found in results))
+        self.assertLessEqual(stats.counters["applyrules.attempts"], len(self.words) * len(self.rules))
+        # Words too long or too short for a rule are never attempted
+
+class ConsensusTest(unittest.TestCase):
+    def fresh(self, relset):
+        return [NeuvelFulopImplementation.Relationship(rel.related, rel.A, rel.B, rel.orientation) for rel in relset]
+        # Copies relationships without the rules they've already worked out
+
+    def test_matches_rule(self):
+        for name, minmatch in ((os.path.join("EnglishCorpus", "EnglishCorpus500.txt"), 1), (os.path.join("CornishCorpus", "CornishCorpus1000.txt"), 2)):
+            with self.subTest(name=name):
+                relset = mined(name, minmatch, 2, 1)[1]
+
+                self.assertEqual({rel.orientation for rel in relset}, {True, False})
+
+                self.assertEqual(NeuvelFulopImplementation.consensus(self.fresh(relset)), [rel.rule() for rel in self.fresh(relset)])
+        # Working out every rule at once gives the same rules as working them out one at a time, for stems and endings alike
+
+    def test_orientation(self):
+        related = ["ceive", "ception", "cepted", "céive"]
+
+        stems = NeuvelFulopImplementation.Relationship(related, "re", "de", True)
+        endings = NeuvelFulopImplementation.Relationship(related, "ing", "ed", False)
+
+        self.assertEqual(NeuvelFulopImplementation.consensus([stems, endings]), [("rec####**", "dec####**"), ("**#####ing", "**#####ed")])
+        self.assertEqual(self.fresh([stems])[0].rule(), stems.rule())
+        self.assertEqual(self.fresh([endings])[0].rule(), endings.rule())
+        # Endings are aligned by their first characters and stems by their last characters
+
+    def test_cached(self):
+        relset = self.fresh(mined(os.path.join("EnglishCorpus", "EnglishCorpus500.txt"), 1, 2, 1)[1])
+
+        known = relset[0].rule()
+        rules = NeuvelFulopImplementation.consensus(relset)
+
+        self.assertIs(rules[0], known)
+        self.assertEqual(rules, [rel.rule() for rel in self.fresh(relset)])
+        self.assertEqual(NeuvelFulopImplementation.consensus([]), [])
+        # Relationships whose rules are already known keep them
@@ -0,0 +1,102 @@
+import asyncio
+import os
+import unittest
+from morphologylearner import CorpusLoader, HarrisImplementation, Reporting, Server
+
+directory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+class ServerTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(ServerTest):
+        ServerTest.corpus = CorpusLoader.load(os.path.join(directory, "EnglishCorpus", "EnglishCorpus500.txt"))
+        ServerTest.model = Server.Model(ServerTest.corpus, ("harris", "neuvelfulop"), None, Reporting.silent)
+
+    def serve(self, test, model=None):
+        async def main():
+            server = Server.Server(model or self.model, reporter=Reporting.silent)
+
+            await server.start()
+
+            client = await Server.Client.connect(port=server.server.sockets[0].getsockname()[1])
+
+            try:
+                await asyncio.wait_for(test(client), 30)
+            finally:
+                await client.close()
+                await server.stop()
+
+        asyncio.run(main())
+        # Runs a test against a server on an unused port, failing it (instead of hanging) if any request goes unanswered
+
+    def test_segment(self):
+        splits = HarrisImplementation.Harris(self.corpus, 1, True, None, Reporting.silent)
+
+        async def test(client):
+            words = self.corpus.words[:20]
+
+            self.assertEqual(await client.segment(words), [splits[word] for word in words])
+            self.assertEqual(len(await client.generate(words)), len(words))
+
+        self.serve(test)
+
+    def test_bad_requests(self):
+        async def test(client):
+            with self.assertRaises(ValueError):
+                await client.request("unknown", ["word"])
+
+            with self.assertRaises(ValueError):
+                await client.segment(["word"], "mdl")
+
+            with self.assertRaises(ValueError):
+                await client.request("segment", None)
+
+            client.writer.write(b"not json\n")
+
+            self.assertEqual(len(await client.segment(["walking"])), 1)
+            # The server keeps answering after every kind of bad request
+
+        self.serve(test)
+
+    def test_failure(self):
+        model = Server.Model(self.corpus.words[:50], ("harris",), None, Reporting.silent)
+        segment = model.segment
+
+        def failing(words, method):
+            if "broken" in words:
+                raise RuntimeError("broken word")
+
+            return segment(words, method)
+
+        model.segment = failing
+
+        async def test(client):
+            results = await asyncio.gather(client.segment(["walking"]), client.segment(["broken"]), client.segment(["talked"]), return_exceptions=True)
+
+            self.assertIsInstance(results[1], ValueError)
+            self.assertEqual(results[0], segment(["walking"], "harris"))
+            self.assertEqual(results[2], segment(["talked"], "harris"))
+            # Only the request that raised is given an error, even when it shares a batch with others
+
+            self.assertEqual(await client.segment(["jumps"]), segment(["jumps"], "harris"))
+            # The batcher survives the failure
+
+            self.assertGreater((await client.stats())["requests"], 0)
+
+        self.serve(test, model)
+
+    def test_cancelled_request(self):
+        async def test(client):
+            request = asyncio.ensure_future(client.segment(["walking"]))
+
+            await asyncio.sleep(0)
+
+            request.cancel()
+
+            self.assertEqual(len(await client.segment(["talked"])), 1)
+            # Replies to cancelled requests are dropped without disturbing the client
+
+            await client.close()
+            await client.listener
+            # Nor do cancelled requests disturb the client once the connection is closed
+
+        self.serve(test)
@@ -0,0 +1,62 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+from morphologylearner import CorpusLoader, HarrisImplementation, MDLImplementation, Reporting, Sharding
+
+directory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+corpora = [os.path.join(directory, "EnglishCorpus", "EnglishCorpus1000.txt"), os.path.join(directory, "CornishCorpus", "CornishCorpus1000.txt")]
+
+class HarrisTest(unittest.TestCase):
+    def check(self, path, ESM, frequencymatching, shards, lowercase=True):
+        corpus = CorpusLoader.load(path, lowercase)
+
+        splits = HarrisImplementation.Harris(corpus, ESM, frequencymatching, None, Reporting.silent)
+
+        found = list(Sharding.harris(path, ESM, frequencymatching, shards, None, lowercase, Reporting.silent))
+
+        self.assertEqual([word for word, boundaries in found], corpus.words)
+        self.assertEqual({word: boundaries for word, boundaries in found}, splits)
+        # Sharded runs give the same words (in the same order) and the same splits as runs held in memory
+
+    def test_matches_memory(self):
+        for path in corpora:
+            for ESM, frequencymatching in ((0, True), (1, True), (2, False), (3, True)):
+                for shards in (1, 5):
+                    with self.subTest(path=path, ESM=ESM, frequencymatching=frequencymatching, shards=shards):
+                        self.check(path, ESM, frequencymatching, shards)
+
+    def test_keep_case(self):
+        self.check(corpora[0], 1, True, 5, False)
+
+    def test_repeats_and_blank_lines(self):
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "corpus.txt")
+
+            with open(path, "w", encoding="utf8") as file:
+                file.write("walking 4\n\nwalked\nTalking\n  \nwalking\ntalks\nwalks 4\ntalked\nZebra\nwalked\n")
+
+            for shards in (1, 3):
+                self.check(path, 1, True, shards)
+                self.check(path, 1, True, shards, False)
+
+class EntropyTableTest(unittest.TestCase):
+    def test_matches_memory(self):
+        corpus = CorpusLoader.load(corpora[1])
+
+        expected = MDLImplementation.entropytable(corpus)
+
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "entropies")
+
+            Sharding.entropytable(corpora[1], path, 5, None, Reporting.silent)
+
+            self.assertFalse(os.path.exists(path + ".npz"))
+            # The table is written to exactly the path given
+
+            table = MDLImplementation.EntropyTable.load(path, corpus.words)
+
+        self.assertIsNotNone(table)
+        self.assertTrue(np.array_equal(table.values, expected.values))
+        # The merged table is identical to the one built in memory (bit for bit)
@@ -0,0 +1,123 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+from morphologylearner import CorpusLoader, Evaluation, HarrisImplementation, MDLImplementation, NeuvelFulopImplementation, Reporting, Sweep
+
+directory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def outputs(results):
+    return [(record["parameters"], json.loads(json.dumps(record["output"]))) for record in results]
+    # Returns the parameters and output of every result, in the same form as they're cached
+
+class ConfigurationsTest(unittest.TestCase):
+    def test_grid(self):
+        found = Sweep.configurations("harris", {"ESM": [0, 1, 2], "frequencymatching": [True, False]})
+
+        self.assertEqual(len(found), 6)
+        self.assertEqual(found[1], {"ESM": 0, "frequencymatching": False})
+
+    def test_defaults(self):
+        found = Sweep.configurations("mdl", {"popcount": [8, 16]})
+
+        self.assertEqual([parameters["popcount"] for parameters in found], [8, 16])
+        self.assertEqual(found[0]["gencount"], Sweep.defaults["mdl"]["gencount"])
+        # Parameters left out of the grid keep their defaults
+
+    def test_key(self):
+        corpushash = Sweep.fingerprint(["walking", "walked"])
+
+        self.assertEqual(Sweep.key(corpushash, "harris", {"ESM": 1, "frequencymatching": True}), Sweep.key(corpushash, "harris", {"frequencymatching": True, "ESM": 1}))
+        self.assertNotEqual(Sweep.key(corpushash, "harris", {"ESM": 1}), Sweep.key(Sweep.fingerprint(["walked", "walking"]), "harris", {"ESM": 1}))
+        # Configurations are identified by their parameters (in any order) and by their corpus' words (in order)
+
+    def test_unknown(self):
+        with mock.patch("builtins.print"):
+            self.assertIsNone(Sweep.sweep(["walking"], "other", {}, 1, reporter=Reporting.silent))
+
+class RunTest(unittest.TestCase):
+    def setUp(self):
+        self.words = CorpusLoader.load(os.path.join(directory, "EnglishCorpus", "EnglishCorpus500.txt")).words
+
+    def test_harris(self):
+        results = Sweep.sweep(self.words, "harris", {"ESM": [0, 1, 3], "frequencymatching": [True, False]}, 1, reporter=Reporting.silent)
+
+        for record in results:
+            parameters = record["parameters"]
+
+            splits = HarrisImplementation.Harris(self.words, parameters["ESM"], parameters["frequencymatching"], None, Reporting.silent)
+
+            self.assertEqual(record["output"], [splits[word] for word in self.words])
+        # Configurations that share an index find the same splits as running each of them alone
+
+    def test_neuvelfulop(self):
+        words = CorpusLoader.load(os.path.join(directory, "CornishCorpus", "CornishCorpus1000.txt")).words
+
+        results = Sweep.sweep(words, "neuvelfulop", {"minmatch": [2, 3], "cachereq": [2], "relreq": [1, 2, 3]}, 1, reporter=Reporting.silent)
+
+        self.assertGreater(len(results[0]["output"]["rules"]), len(results[1]["output"]["rules"]))
+
+        for record in results:
+            parameters = record["parameters"]
+
+            relset = NeuvelFulopImplementation.relationships(words, parameters["minmatch"], parameters["cachereq"], parameters["relreq"], Reporting.silent)
+            rules = NeuvelFulopImplementation.consensus(relset)
+
+            generated = []
+            seen = set(words)
+
+            for found in NeuvelFulopImplementation.applyrules(words, rules):
+                for index, out in found:
+                    if out not in seen:
+                        seen.add(out)
+                        generated.append(out)
+
+            self.assertEqual(json.loads(json.dumps(record["output"])), json.loads(json.dumps({"rules": [list(rule) for rule in rules], "generated": generated})))
+        # Mining the pairs once (with the lowest relreq) and filtering them keeps the same rules, in the same order, as mining them for each relreq
+
+    def test_mdl(self):
+        results = Sweep.sweep(self.words, "mdl", {"popcount": [8], "gencount": [3], "entropythreshold": [0, 0.5]}, 1, reporter=Reporting.silent)
+
+        for record in results:
+            best = MDLImplementation.genetic(self.words, reporter=Reporting.silent, **record["parameters"])
+
+            self.assertEqual(record["output"]["splits"], [best.boundary(word) for word in self.words])
+            self.assertEqual(record["output"]["fitness"], best.fitnessabsolute())
+        # Runs that share an index and an entropy table evolve in the same way as those that don't
+
+    def test_processes(self):
+        grid = {"ESM": [0, 1, 2, 3]}
+
+        self.assertEqual(outputs(Sweep.sweep(self.words, "harris", grid, 2, reporter=Reporting.silent)), outputs(Sweep.sweep(self.words, "harris", grid, 1, reporter=Reporting.silent)))
+        # Results are given in the order of the grid however many processes run them
+
+class CacheTest(unittest.TestCase):
+    def test_cached(self):
+        words = CorpusLoader.load(os.path.join(directory, "EnglishCorpus", "EnglishCorpus100.txt")).words
+
+        with tempfile.TemporaryDirectory() as folder:
+            first = Sweep.sweep(words, "harris", {"ESM": [0, 1]}, 1, folder, reporter=Reporting.silent)
+
+            self.assertEqual(len(os.listdir(folder)), 2)
+
+            with mock.patch.dict(Sweep.runners, {"harris": None}):
+                second = Sweep.sweep(words, "harris", {"ESM": [0, 1]}, 1, folder, reporter=Reporting.silent)
+            # Nothing is run when every configuration is already cached
+
+            third = Sweep.sweep(words, "harris", {"ESM": [0, 1, 2]}, 1, folder, reporter=Reporting.silent)
+
+        self.assertEqual([record["cached"] for record in first], [False, False])
+        self.assertEqual([record["cached"] for record in second], [True, True])
+        self.assertEqual([record["cached"] for record in third], [True, True, False])
+        self.assertEqual(outputs(second), outputs(first))
+
+    def test_scores(self):
+        path = os.path.join(directory, "EnglishCorpus", "EnglishCorpus100.txt")
+
+        gold = Evaluation.load(path)
+        words = CorpusLoader.load(path).words
+
+        record = Sweep.sweep(words, "harris", {"ESM": [1]}, 1, None, gold, Reporting.silent)[0]
+
+        self.assertEqual(record["scores"], Evaluation.evaluate(gold, HarrisImplementation.Harris(words, 1, True, None, Reporting.silent), False))